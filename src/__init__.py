@@ -12,7 +12,8 @@ from .data_fetcher import (
     FMPFetcher,
     MultiSourceFetcher,
     DataFetcherFactory,
-    validate_company_name
+    validate_company_name,
+    invalidate_validation_cache
 )
 
 from .analyzer import (
@@ -62,6 +63,7 @@ __all__ = [
     "MultiSourceFetcher",
     "DataFetcherFactory",
     "validate_company_name",
+    "invalidate_validation_cache",
     
     # PDF Parsing
     "PDFReportParser",
@@ -422,7 +422,7 @@ class QualityManagementAgent:
             default="json"
         )
         
-        base_filename = f"quality_report_{report.ticker}_{report.analysis_date[:10]}"
+        base_filename = f"quality_report_{report.ticker}_{report.analysis_date_short}"
         
         if format_choice in ["json", "both"]:
             json_path = f"reports/{base_filename}.json"
@@ -115,6 +115,18 @@ class QualityReport:
     
     # Raw metrics
     metrics_summary: Dict = field(default_factory=dict)
+    
+    @property
+    def analysis_date_short(self) -> str:
+        """Analysis date as YYYY-MM-DD"""
+        return self.analysis_date[:10]
+    
+    @property
+    def overall_rating(self) -> str:
+        """Strong / Moderate / Weak, from the current overall_score"""
+        if self.overall_score >= 7:
+            return "Strong"
+        return "Moderate" if self.overall_score >= 5 else "Weak"
 
 
 class QualityAnalyzer:
@@ -0,0 +1,72 @@
+"""
+File Cache Module - Persistent on-disk cache for fetched financial data
+Entries are JSON files under .cache/{source}/ and expire after a per-entry TTL
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+from typing import Any, Optional
+
+
+# Default time-to-live (seconds) for each kind of data
+FUNDAMENTALS_TTL = 30 * 24 * 3600  # Financial statements change at most quarterly
+QUOTE_TTL = 24 * 3600  # Market cap, P/E and other price-driven fields
+SEARCH_TTL = 7 * 24 * 3600  # Company search results
+ANALYSIS_TTL = 7 * 24 * 3600  # LLM analyses of an identical prompt
+PDF_TEXT_TTL = 365 * 24 * 3600  # Text extracted from a PDF, keyed by a hash of its contents
+
+
+class FileCache:
+    """JSON file cache keyed by (source, ticker, endpoint, years)"""
+    
+    def __init__(self, cache_dir: str = ".cache"):
+        """
+        Args:
+            cache_dir: Directory that holds one sub-directory per data source
+        """
+        self.cache_dir = cache_dir
+    
+    @staticmethod
+    def make_key(source: str, ticker: str, endpoint: str, years: int = 0) -> str:
+        """
+        Build a cache key for a fetch
+        
+        Returns:
+            '{source}/{md5 of source|ticker|endpoint|years}'
+        """
+        digest = hashlib.md5(f"{source}|{ticker.upper()}|{endpoint}|{years}".encode()).hexdigest()
+        return f"{source}/{digest}"
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing, expired or unreadable"""
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if time.time() - entry['ts'] < entry['ttl']:
+                return entry['data']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+    
+    def set(self, key: str, value: Any, ttl: float):
+        """Store a JSON-serializable value; write failures are ignored"""
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temp file and rename so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'ts': time.time(), 'ttl': ttl, 'data': value}, f, default=str)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
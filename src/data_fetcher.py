@@ -6,44 +6,450 @@ Version: 2.1.0 - Universal NSE/BSE ticker acceptance
 
 import os
 import re
+import asyncio
+import logging
+import bisect
 import json
 import time
-import sys
+import copy
+import threading
 import warnings
+import importlib.util
 from abc import ABC, abstractmethod
-from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field, fields
+from functools import lru_cache, partial
+from itertools import compress
+from types import MappingProxyType
+from urllib.parse import quote_plus
 
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html as lxml_html
+import numpy as np
 
 try:
-    import yfinance as yf
+    from .cache import FileCache, FUNDAMENTALS_TTL, QUOTE_TTL, SEARCH_TTL
+except ImportError:  # Imported as a top-level module with src/ on sys.path
+    from cache import FileCache, FUNDAMENTALS_TTL, QUOTE_TTL, SEARCH_TTL
+
+# yfinance (and the pandas it pulls in) is only imported once a Yahoo fetcher
+# is created - see _load_yfinance()
+yf = None
+_YFINANCE_INSTALLED = importlib.util.find_spec('yfinance') is not None
+
+try:
+    import orjson
 except ImportError:
-    yf = None
+    orjson = None
+
+_log = logging.getLogger(__name__)
+
+
+# Ticker-shaped input: up to 15 letters/digits with optional '.' or '-'
+# (e.g. TCS, ALKEM.NS, BAJAJ-AUTO). Matching is done in a single regex scan.
+_TICKER_CHARS_RE = re.compile(r'[A-Za-z0-9.\-]{1,15}')
+_TICKER_RE = re.compile(r'(?=[A-Z0-9.\-]*[A-Z])[A-Z0-9.\-]{1,15}')
+
+
+# Hardcoded mapping for major Indian stocks (checked FIRST to avoid API issues)
+# Comprehensive list of NSE stocks - 150+ companies
+INDIAN_STOCK_NAMES = {
+    # Nifty 50 - Large Caps
+    'RELIANCE': 'Reliance Industries Limited',
+    'TCS': 'Tata Consultancy Services Limited',
+    'HDFCBANK': 'HDFC Bank Limited',
+    'INFY': 'Infosys Limited',
+    'ICICIBANK': 'ICICI Bank Limited',
+    'HINDUNILVR': 'Hindustan Unilever Limited',
+    'SBIN': 'State Bank of India',
+    'BHARTIARTL': 'Bharti Airtel Limited',
+    'ITC': 'ITC Limited',
+    'KOTAKBANK': 'Kotak Mahindra Bank Limited',
+    'LT': 'Larsen & Toubro Limited',
+    'AXISBANK': 'Axis Bank Limited',
+    'WIPRO': 'Wipro Limited',
+    'ASIANPAINT': 'Asian Paints Limited',
+    'MARUTI': 'Maruti Suzuki India Limited',
+    'HCLTECH': 'HCL Technologies Limited',
+    'SUNPHARMA': 'Sun Pharmaceutical Industries Limited',
+    'TITAN': 'Titan Company Limited',
+    'ULTRACEMCO': 'UltraTech Cement Limited',
+    'BAJFINANCE': 'Bajaj Finance Limited',
+    'NESTLEIND': 'Nestle India Limited',
+    'TECHM': 'Tech Mahindra Limited',
+    'POWERGRID': 'Power Grid Corporation of India Limited',
+    'NTPC': 'NTPC Limited',
+    'TATAMOTORS': 'Tata Motors Limited',
+    'TATASTEEL': 'Tata Steel Limited',
+    'JSWSTEEL': 'JSW Steel Limited',
+    'ONGC': 'Oil and Natural Gas Corporation Limited',
+    'COALINDIA': 'Coal India Limited',
+    'ADANIENT': 'Adani Enterprises Limited',
+    'ADANIPORTS': 'Adani Ports and Special Economic Zone Limited',
+    'BAJAJFINSV': 'Bajaj Finserv Limited',
+    'DRREDDY': 'Dr. Reddy\'s Laboratories Limited',
+    'CIPLA': 'Cipla Limited',
+    'EICHERMOT': 'Eicher Motors Limited',
+    'GRASIM': 'Grasim Industries Limited',
+    'DIVISLAB': 'Divi\'s Laboratories Limited',
+    'BRITANNIA': 'Britannia Industries Limited',
+    'APOLLOHOSP': 'Apollo Hospitals Enterprise Limited',
+    'INDUSINDBK': 'IndusInd Bank Limited',
+    'M&M': 'Mahindra & Mahindra Limited',
+    'BPCL': 'Bharat Petroleum Corporation Limited',
+    'HEROMOTOCO': 'Hero MotoCorp Limited',
+    'HINDALCO': 'Hindalco Industries Limited',
+    'TATACONSUM': 'Tata Consumer Products Limited',
+    'BAJAJ-AUTO': 'Bajaj Auto Limited',
+    'UPL': 'UPL Limited',
+    
+    # Nifty Next 50 & Popular Mid/Small Caps
+    'VEDL': 'Vedanta Limited',
+    'GODREJCP': 'Godrej Consumer Products Limited',
+    'DABUR': 'Dabur India Limited',
+    'MARICO': 'Marico Limited',
+    'PIIND': 'PI Industries Limited',
+    'BANKBARODA': 'Bank of Baroda',
+    'PNB': 'Punjab National Bank',
+    'CANBK': 'Canara Bank',
+    'UNIONBANK': 'Union Bank of India',
+    'INDHOTEL': 'The Indian Hotels Company Limited',
+    'TRENT': 'Trent Limited',
+    'PIDILITIND': 'Pidilite Industries Limited',
+    'AMBUJACEM': 'Ambuja Cements Limited',
+    'ACC': 'ACC Limited',
+    'SHREECEM': 'Shree Cement Limited',
+    'GAIL': 'GAIL (India) Limited',
+    'IOC': 'Indian Oil Corporation Limited',
+    'HINDZINC': 'Hindustan Zinc Limited',
+    'SAIL': 'Steel Authority of India Limited',
+    'NMDC': 'NMDC Limited',
+    'ADANIGREEN': 'Adani Green Energy Limited',
+    'ADANIPOWER': 'Adani Power Limited',
+    'ADANITRANS': 'Adani Transmission Limited',
+    'TATAPOWER': 'Tata Power Company Limited',
+    'TORNTPOWER': 'Torrent Power Limited',
+    'SIEMENS': 'Siemens Limited',
+    'ABB': 'ABB India Limited',
+    'HAVELLS': 'Havells India Limited',
+    'CROMPTON': 'Crompton Greaves Consumer Electricals Limited',
+    'VOLTAS': 'Voltas Limited',
+    'BLUESTARCO': 'Blue Star Limited',
+    'DIXON': 'Dixon Technologies (India) Limited',
+    'GODREJPROP': 'Godrej Properties Limited',
+    'DLF': 'DLF Limited',
+    'OBEROIRLTY': 'Oberoi Realty Limited',
+    'PRESTIGE': 'Prestige Estates Projects Limited',
+    'PHOENIXLTD': 'The Phoenix Mills Limited',
+    'INDIGOPNTS': 'Indigo Paints Limited',
+    'BERGEPAINT': 'Berger Paints India Limited',
+    'AKZOINDIA': 'Akzo Nobel India Limited',
+    'MCDOWELL-N': 'United Spirits Limited',  # Former symbol of UNITDSPR, still accepted
+    'RADICO': 'Radico Khaitan Limited',
+    'UNITDSPR': 'United Spirits Limited',
+    'VBL': 'Varun Beverages Limited',
+    'TATACOMM': 'Tata Communications Limited',
+    'TVSMOTOR': 'TVS Motor Company Limited',
+    'BAJAJHLDNG': 'Bajaj Holdings & Investment Limited',
+    'BOSCHLTD': 'Bosch Limited',
+    'MOTHERSON': 'Samvardhana Motherson International Limited',
+    'ESCORTS': 'Escorts Kubota Limited',
+    'ASHOKLEY': 'Ashok Leyland Limited',
+    'APOLLOTYRE': 'Apollo Tyres Limited',
+    'MRF': 'MRF Limited',
+    'CEAT': 'CEAT Limited',
+    'ZYDUSLIFE': 'Zydus Lifesciences Limited',
+    'TORNTPHARM': 'Torrent Pharmaceuticals Limited',
+    'AUROPHARMA': 'Aurobindo Pharma Limited',
+    'LUPIN': 'Lupin Limited',
+    'BIOCON': 'Biocon Limited',
+    'ALKEM': 'Alkem Laboratories Limited',
+    'LALPATHLAB': 'Dr. Lal PathLabs Limited',
+    'FORTIS': 'Fortis Healthcare Limited',
+    'MAXHEALTH': 'Max Healthcare Institute Limited',
+    'SYNGENE': 'Syngene International Limited',
+    'PVR': 'PVR INOX Limited',
+    'PVRINOX': 'PVR INOX Limited',
+    'ZOMATO': 'Zomato Limited',
+    'NYKAA': 'FSN E-Commerce Ventures Limited',
+    'POLICYBZR': 'PB Fintech Limited',
+    'PAYTM': 'One 97 Communications Limited',
+    'DMART': 'Avenue Supermarts Limited',
+    'TATAELXSI': 'Tata Elxsi Limited',
+    'COFORGE': 'Coforge Limited',
+    'LTTS': 'L&T Technology Services Limited',
+    'PERSISTENT': 'Persistent Systems Limited',
+    'MPHASIS': 'Mphasis Limited',
+    'LTIM': 'LTIMindtree Limited',
+    'OFSS': 'Oracle Financial Services Software Limited',
+    'INDUSTOWER': 'Indus Towers Limited',
+    'IRCTC': 'Indian Railway Catering and Tourism Corporation Limited',
+    'CONCOR': 'Container Corporation of India Limited',
+    'IRFC': 'Indian Railway Finance Corporation Limited',
+    'RECLTD': 'REC Limited',
+    'PFC': 'Power Finance Corporation Limited',
+    'LICHSGFIN': 'LIC Housing Finance Limited',
+    'HDFCLIFE': 'HDFC Life Insurance Company Limited',
+    'SBILIFE': 'SBI Life Insurance Company Limited',
+    'ICICIPRULI': 'ICICI Prudential Life Insurance Company Limited',
+    'ICICIGI': 'ICICI Lombard General Insurance Company Limited',
+    'BAJAJHFL': 'Bajaj Housing Finance Limited',
+    'SHRIRAMFIN': 'Shriram Finance Limited',
+    'CHOLAFIN': 'Cholamandalam Investment and Finance Company Limited',
+    'MUTHOOTFIN': 'Muthoot Finance Limited',
+    'MANAPPURAM': 'Manappuram Finance Limited',
+    'JINDALSTEL': 'Jindal Steel & Power Limited',
+    'CRISIL': 'CRISIL Limited',
+    'ICRA': 'ICRA Limited',
+    'PETRONET': 'Petronet LNG Limited',
+    'INDIAMART': 'IndiaMART InterMESH Limited',
+    'JUSTDIAL': 'Just Dial Limited',
+    'INFO EDGE': 'Info Edge (India) Limited',
+    'NAUKRI': 'Info Edge (India) Limited',
+    'PGHH': 'Procter & Gamble Hygiene and Health Care Limited',
+    'COLPAL': 'Colgate-Palmolive (India) Limited',
+    'GILLETTE': 'Gillette India Limited',
+    'HONAUT': 'Honeywell Automation India Limited',
+    'PFIZER': 'Pfizer Limited',
+    'GLAXO': 'GlaxoSmithKline Pharmaceuticals Limited',
+    'ABBOTINDIA': 'Abbott India Limited',
+    'SANOFI': 'Sanofi India Limited',
+    
+    # Additional popular stocks
+    'POLYCAB': 'Polycab India Limited',
+    'KANSAINER': 'Kansai Nerolac Paints Limited',
+    'RAYMOND': 'Raymond Limited',
+    'AIAENG': 'AIA Engineering Limited',
+    'WHIRLPOOL': 'Whirlpool of India Limited',
+    'SCHAEFFLER': 'Schaeffler India Limited',
+    'EXIDEIND': 'Exide Industries Limited',
+    'AMARARAJA': 'Amara Raja Energy & Mobility Limited',
+    'RELAXO': 'Relaxo Footwears Limited',
+    'BATAINDIA': 'Bata India Limited',
+    'PAGEIND': 'Page Industries Limited',
+    'VENKEYS': 'Venky\'s (India) Limited',
+    'JUBLFOOD': 'Jubilant FoodWorks Limited',
+    'WESTLIFE': 'Westlife Foodworld Limited',
+    'SAPPHIRE': 'Sapphire Foods India Limited',
+    'DEVYANI': 'Devyani International Limited',
+    'BSOFT': 'Birlasoft Limited',
+    'SONACOMS': 'Sona BLW Precision Forgings Limited',
+    'KPITTECH': 'KPIT Technologies Limited',
+}
+# Read-only: the lookup tables below are derived from it once at import
+INDIAN_STOCK_NAMES = MappingProxyType(INDIAN_STOCK_NAMES)
+
+# Single source of truth for "known Indian ticker" checks, plus the NSE symbol
+# of each so hot paths don't re-format f"{ticker}.NS"
+INDIAN_TICKERS = frozenset(INDIAN_STOCK_NAMES)
+_INDIAN_TICKER_NS = {ticker: f"{ticker}.NS" for ticker in INDIAN_STOCK_NAMES}
+
+# Lower-cased company name -> ticker, sorted so name prefixes can be
+# looked up with a binary search instead of a network search
+_INDIAN_NAME_INDEX = sorted({name.lower(): ticker for ticker, name in INDIAN_STOCK_NAMES.items()}.items())
+_INDIAN_NAME_KEYS = [name for name, _ in _INDIAN_NAME_INDEX]
+
+
+def _match_indian_company_names(query: str, limit: int = 10) -> List[Dict[str, str]]:
+    """Return hardcoded Indian companies whose name starts with the query"""
+    prefix = query.lower()
+    start = bisect.bisect_left(_INDIAN_NAME_KEYS, prefix)
+    matches = []
+    for name_key, ticker in _INDIAN_NAME_INDEX[start:start + limit]:
+        if not name_key.startswith(prefix):
+            break
+        matches.append({'name': INDIAN_STOCK_NAMES[ticker], 'ticker': _INDIAN_TICKER_NS[ticker]})
+    return matches
+
+
+# Indian exchange suffixes (NSE, BSE) as accepted by str.endswith
+_EXCHANGE_SUFFIXES = ('.NS', '.BO')
+
+
+def _strip_exchange(symbol: str) -> str:
+    """Drop a trailing .NS/.BO exchange suffix, e.g. 'TCS.NS' -> 'TCS'"""
+    return symbol.removesuffix('.NS').removesuffix('.BO')
+
 
+def _json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
-@contextmanager
-def suppress_output():
-    """Suppress stdout and stderr temporarily"""
-    import io
-    old_stdout = sys.stdout
-    old_stderr = sys.stderr
-    sys.stdout = io.StringIO()
-    sys.stderr = io.StringIO()
+
+def _load_yfinance():
+    """Import yfinance on first use; returns None if it is not available"""
+    global yf, _YFINANCE_INSTALLED
+    if yf is None and _YFINANCE_INSTALLED:
+        try:
+            import yfinance
+        except ImportError:
+            _YFINANCE_INSTALLED = False
+            return None
+        # yfinance reports failed lookups (unknown symbols, missing statements) via
+        # logging and pandas warnings; callers already fall back, so keep them quiet
+        logging.getLogger('yfinance').setLevel(logging.CRITICAL)
+        warnings.filterwarnings('ignore', module=r'yfinance(\.|$)')
+        yf = yfinance
+    return yf
+
+
+# (epoch seconds, ISO string) of the last timestamp handed out by _now_iso
+_last_timestamp: Tuple[float, str] = (0.0, '')
+
+
+def _now_iso() -> str:
+    """Current local time in ISO format, refreshed at most once per second"""
+    global _last_timestamp
+    now = time.time()
+    cached_at, iso = _last_timestamp
+    if now - cached_at >= 1.0:
+        iso = datetime.fromtimestamp(now).isoformat()
+        _last_timestamp = (now, iso)
+    return iso
+
+
+def _xpath_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# (connect, read) timeouts: an unreachable host fails within the connect
+# budget instead of eating the time meant for reading the response
+_API_TIMEOUT = (2.0, 8.0)
+_PAGE_TIMEOUT = (3.0, 12.0)  # Full HTML company pages
+_PROBE_TIMEOUT = (1.5, 3.5)  # Validation lookups, where the user is waiting
+
+
+# Longest wait (seconds) before retrying a rate-limited request; a server asking
+# for more is retried early rather than stalling the caller
+RETRY_AFTER_MAX = 3.0
+
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After on 429/503 responses, up to RETRY_AFTER_MAX"""
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, RETRY_AFTER_MAX)
+
+
+def _make_session(headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """
+    Create a pooled keep-alive session with light retries on transient failures
+    
+    Rate-limited (429) responses are retried too, after the server's (capped)
+    Retry-After, or with exponential backoff when it sends none.
+    
+    requests already advertises br (when brotli is installed), gzip and deflate
+    and decompresses transparently, so responses come over the wire compressed.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        # Once retries run out, hand back the last response so callers' status-code
+        # fallbacks (e.g. Screener's consolidated -> standalone page) still run
+        max_retries=_CappedRetry(total=2, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504),
+                                 raise_on_status=False)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+# One keep-alive session per data source, shared by every fetcher instance
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _shared_session(source: str, headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """Get the process-wide session for a data source, creating it on first use"""
+    with _sessions_lock:
+        session = _sessions.get(source)
+        if session is None:
+            session = _sessions[source] = _make_session(headers)
+        return session
+
+
+# Persistent response cache shared by all fetchers
+_file_cache = FileCache()
+
+
+class IncompleteLookup(Exception):
+    """A remote lookup failed (error or non-200 response), so an empty answer is not conclusive"""
+
+
+class SourceUnavailable(IncompleteLookup):
+    """A data source is failing (unreachable, timed out, 5xx or 429) rather than lacking the company"""
+
+
+def _is_outage(exc: BaseException) -> bool:
+    """Whether an exception means the source itself is failing"""
+    if isinstance(exc, SourceUnavailable):
+        return True
+    status = getattr(getattr(exc, 'response', None), 'status_code', None)
+    if status is not None:
+        return status == 429 or status >= 500
+    # requests, curl_cffi and socket errors (timeouts included) are all OSErrors;
+    # yfinance reports throttling with its own exception type
+    return isinstance(exc, OSError) or type(exc).__name__ == 'YFRateLimitError'
+
+
+def _raise_for_outage(response: requests.Response):
+    """Raise SourceUnavailable for a rate-limited (429) or server-error (5xx) response"""
+    if response.status_code == 429 or response.status_code >= 500:
+        raise SourceUnavailable(f"{response.url} returned {response.status_code}")
+
+
+def _first_valid(func, candidates: List[Any], is_valid,
+                 errors: Optional[List[Exception]] = None) -> Optional[Any]:
+    """
+    Run func over candidates concurrently and return the first valid result
+    
+    Results are checked in candidate order, so an earlier (preferred) candidate
+    wins over a later one that happened to finish first. Exceptions count as
+    invalid results and are appended to errors when it is given. Returns None
+    if no candidate produced a valid result.
+    """
+    if len(candidates) <= 1:
+        for candidate in candidates:
+            try:
+                result = func(candidate)
+            except Exception as e:
+                if errors is not None:
+                    errors.append(e)
+                return None
+            return result if is_valid(result) else None
+        return None
+    
+    executor = ThreadPoolExecutor(max_workers=len(candidates))
     try:
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            yield
+        futures = [executor.submit(func, candidate) for candidate in candidates]
+        for future in futures:
+            try:
+                result = future.result()
+            except Exception as e:
+                if errors is not None:
+                    errors.append(e)
+                continue
+            if is_valid(result):
+                return result
+        return None
     finally:
-        sys.stdout = old_stdout
-        sys.stderr = old_stderr
+        # Don't wait for slower candidates once we have an answer
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class FinancialData:
     """Container for company financial data"""
     company_name: str
@@ -96,52 +502,63 @@ class FinancialData:
     data_source: str = ""
     fetch_timestamp: str = ""
     
+    @property
+    def is_populated(self) -> bool:
+        """True if a fetch returned usable figures (any revenue or net income)"""
+        return bool(self.revenue or self.net_income)
+    
     def to_dict(self) -> Dict:
-        """Convert to dictionary for serialization"""
-        return {
-            'company_name': self.company_name,
-            'ticker': self.ticker,
-            'years_analyzed': self.years_analyzed,
-            'total_assets': self.total_assets,
-            'total_liabilities': self.total_liabilities,
-            'shareholders_equity': self.shareholders_equity,
-            'total_debt': self.total_debt,
-            'cash_and_equivalents': self.cash_and_equivalents,
-            'revenue': self.revenue,
-            'net_income': self.net_income,
-            'operating_income': self.operating_income,
-            'gross_profit': self.gross_profit,
-            'ebitda': self.ebitda,
-            'operating_cash_flow': self.operating_cash_flow,
-            'free_cash_flow': self.free_cash_flow,
-            'capex': self.capex,
-            'roe': self.roe,
-            'roa': self.roa,
-            'roce': self.roce,
-            'debt_to_equity': self.debt_to_equity,
-            'current_ratio': self.current_ratio,
-            'interest_coverage': self.interest_coverage,
-            'revenue_growth': self.revenue_growth,
-            'profit_growth': self.profit_growth,
-            'operating_margin': self.operating_margin,
-            'net_margin': self.net_margin,
-            'sector': self.sector,
-            'industry': self.industry,
-            'market_cap': self.market_cap,
-            'pe_ratio': self.pe_ratio,
-            'pb_ratio': self.pb_ratio,
-            'dividend_yield': self.dividend_yield,
-            'data_source': self.data_source,
-            'fetch_timestamp': self.fetch_timestamp
+        """Convert to dictionary for serialization (every field except raw_data)"""
+        return {name: getattr(self, name) for name in _SERIALIZED_FIELDS}
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to_dict() as UTF-8 JSON, using orjson when it is installed"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(self.to_dict(), default=float).encode()
+    
+    def as_arrays(self, *metrics: str, years: Optional[List[str]] = None,
+                  dtype=np.float64) -> Tuple[List[str], Dict[str, np.ndarray]]:
+        """
+        Columnar view of per-year metrics for vectorized calculations
+        
+        Args:
+            metrics: Names of per-year fields (e.g. 'revenue', 'net_income')
+            years: Year labels to align to (default: every year seen in metrics)
+            dtype: Float dtype of the arrays; np.float32 halves memory for bulk
+                analysis but keeps only ~7 significant digits
+        
+        Returns:
+            Tuple of (year labels, {metric: array aligned to those years}).
+            Years are kept in first-seen order; a year missing from a metric is NaN.
+        """
+        series = [getattr(self, metric) for metric in metrics]
+        if years is None:
+            years = list(dict.fromkeys(year for values in series for year in values))
+        arrays = {
+            metric: np.array([values.get(year, np.nan) for year in years], dtype=dtype)
+            for metric, values in zip(metrics, series)
         }
+        return years, arrays
+
+
+# FinancialData fields included by to_dict, in declaration order
+_SERIALIZED_FIELDS = tuple(f.name for f in fields(FinancialData) if f.name != 'raw_data')
 
 
 class BaseDataFetcher(ABC):
     """Abstract base class for data fetchers"""
     
+    __slots__ = ()
+    
     @abstractmethod
-    def fetch_data(self, company_identifier: str, years: int) -> Optional[FinancialData]:
-        """Fetch financial data for a company"""
+    def fetch_data(self, company_identifier: str, years: int, force_refresh: bool = False) -> Optional[FinancialData]:
+        """
+        Fetch financial data for a company (force_refresh bypasses the file cache)
+        
+        Returns None when the source has no data for the company; raises
+        SourceUnavailable when the source itself is failing.
+        """
         pass
     
     @abstractmethod
@@ -160,18 +577,61 @@ class ScreenerInFetcher(BaseDataFetcher):
         'Accept-Language': 'en-US,en;q=0.5',
     }
     
+    # Precompiled XPath queries over the parsed company page
+    _XP_NAME = etree.XPath(f"(//h1[{_xpath_class('h2')}])[1]")
+    _XP_TABLE = etree.XPath("(//section[@id=$section_id]//table)[1]")
+    _XP_HEADER_CELLS = etree.XPath("(.//thead)[1]//th")
+    _XP_BODY_ROWS = etree.XPath("(.//tbody)[1]//tr")
+    _XP_CELLS = etree.XPath(".//td")
+    _XP_TOP_RATIOS = etree.XPath("(//ul[@id='top-ratios'])[1]//li")
+    _XP_RATIO_NAME = etree.XPath(f"(.//span[{_xpath_class('name')}])[1]")
+    _XP_RATIO_NUMBER = etree.XPath(f"(.//span[{_xpath_class('number')}])[1]")
+    _XP_SECTOR_LINK = etree.XPath(
+        f"((//div[{_xpath_class('company-info')}])[1]//a[contains(@href, '/screen/raw/')])[1]"
+    )
+    
+    # Thousands separators and percent signs, removed in one translate() pass
+    _STRIP_CHARS = str.maketrans('', '', ',%')
+    
+    # FinancialData field -> lowercase row label substrings, in order of preference
+    PROFIT_LOSS_METRICS = {
+        'revenue': ['sales', 'revenue'],
+        'operating_income': ['operating profit'],
+        'net_income': ['net profit'],
+        'operating_margin': ['opm'],
+    }
+    BALANCE_SHEET_METRICS = {
+        'shareholders_equity': ['equity'],
+        'total_debt': ['borrowing'],
+        'total_assets': ['total assets'],
+    }
+    CASH_FLOW_METRICS = {
+        'operating_cash_flow': ['operating'],
+        'free_cash_flow': ['free cash flow'],
+    }
+    RATIO_METRICS = {
+        'roe': ['roe'],
+        'roce': ['roce'],
+    }
+    
+    __slots__ = ('session',)
+    
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(self.HEADERS)
+        self.session = _shared_session('screener', self.HEADERS)
     
     def search_company(self, query: str) -> List[Dict[str, str]]:
         """Search for companies on Screener.in"""
+        cache_key = FileCache.make_key('screener', query, 'search')
+        cached = _file_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             search_url = f"{self.BASE_URL}/api/company/search/?q={query}"
-            response = self.session.get(search_url, timeout=10)
+            response = self.session.get(search_url, timeout=_API_TIMEOUT)
             
             if response.status_code == 200:
-                results = response.json()
+                results = _json(response)
                 parsed_results = []
                 for item in results[:10]:
                     name = item.get('name', '')
@@ -184,33 +644,45 @@ class ScreenerInFetcher(BaseDataFetcher):
                         ticker = parts[1].upper()  # The company identifier
                     if ticker and ticker not in ['CONSOLIDATED', 'STANDALONE']:
                         parsed_results.append({'name': name, 'ticker': ticker})
+                if parsed_results:
+                    _file_cache.set(cache_key, parsed_results, SEARCH_TTL)
                 return parsed_results
         except Exception as e:
             pass  # Silent fail
         return []
     
-    def fetch_data(self, company_identifier: str, years: int) -> Optional[FinancialData]:
+    def fetch_data(self, company_identifier: str, years: int, force_refresh: bool = False) -> Optional[FinancialData]:
         """Fetch financial data from Screener.in"""
         try:
-            # Try to get the company page
-            company_url = f"{self.BASE_URL}/company/{company_identifier}/consolidated/"
-            response = self.session.get(company_url, timeout=15)
-            
-            if response.status_code != 200:
-                # Try standalone if consolidated fails
-                company_url = f"{self.BASE_URL}/company/{company_identifier}/"
-                response = self.session.get(company_url, timeout=15)
+            # The company page also carries market cap and P/E, so it uses the quote TTL
+            cache_key = FileCache.make_key('screener', company_identifier, 'company')
+            html = None if force_refresh else _file_cache.get(cache_key)
             
-            if response.status_code != 200:
-                return None
+            if html is None:
+                # Try to get the company page
+                company_url = f"{self.BASE_URL}/company/{company_identifier}/consolidated/"
+                response = self.session.get(company_url, timeout=_PAGE_TIMEOUT)
+                
+                if response.status_code != 200:
+                    # Try standalone if consolidated fails
+                    company_url = f"{self.BASE_URL}/company/{company_identifier}/"
+                    response = self.session.get(company_url, timeout=_PAGE_TIMEOUT)
+                
+                if response.status_code != 200:
+                    _raise_for_outage(response)
+                    return None
+                
+                html = response.text
+                _file_cache.set(cache_key, html, QUOTE_TTL)
             
-            soup = BeautifulSoup(response.content, 'lxml')
+            # Parse once; every extraction below is an XPath query on this tree
+            tree = lxml_html.fromstring(html)
             
             # Extract company name
             company_name = ""
-            name_elem = soup.find('h1', class_='h2')
+            name_elem = self._XP_NAME(tree)
             if name_elem:
-                company_name = name_elem.text.strip()
+                company_name = name_elem[0].text_content().strip()
             
             # Initialize financial data
             fin_data = FinancialData(
@@ -218,136 +690,149 @@ class ScreenerInFetcher(BaseDataFetcher):
                 ticker=company_identifier.upper(),
                 years_analyzed=years,
                 data_source="Screener.in",
-                fetch_timestamp=datetime.now().isoformat()
+                fetch_timestamp=_now_iso()
             )
             
             # Extract data from tables
-            self._extract_profit_loss(soup, fin_data, years)
-            self._extract_balance_sheet(soup, fin_data, years)
-            self._extract_cash_flow(soup, fin_data, years)
-            self._extract_ratios(soup, fin_data, years)
-            self._extract_company_info(soup, fin_data)
+            self._extract_profit_loss(tree, fin_data, years)
+            self._extract_balance_sheet(tree, fin_data, years)
+            self._extract_cash_flow(tree, fin_data, years)
+            self._extract_ratios(tree, fin_data, years)
+            self._extract_company_info(tree, fin_data)
             
             return fin_data
             
         except Exception as e:
+            if _is_outage(e):
+                raise SourceUnavailable(f"Screener.in: {e}") from e
             # Silent fail - multi-source fetcher will try next source
             return None
     
-    def _extract_table_data(self, soup: BeautifulSoup, section_id: str, metric_name: str, years: int) -> Dict[str, float]:
-        """Extract specific metric from a table section"""
-        data = {}
+    def _extract_section(self, tree: lxml_html.HtmlElement, section_id: str,
+                         metric_map: Dict[str, List[str]], years: int) -> Dict[str, Dict[str, float]]:
+        """
+        Extract several metrics from one table section in a single pass over its rows
+        
+        Args:
+            tree: Parsed company page
+            section_id: id of the <section> holding the table (e.g. 'profit-loss')
+            metric_map: {field: lowercase label substrings}; the first row containing a
+                substring is used, falling back to the next substring if it has no values
+            years: Number of most recent years to keep
+        
+        Returns:
+            {field: {year label: value}}, with an empty dict for metrics not found
+        """
+        results = {metric: {} for metric in metric_map}
         try:
-            section = soup.find('section', id=section_id)
-            if not section:
-                return data
-            
-            table = section.find('table')
-            if not table:
-                return data
+            tables = self._XP_TABLE(tree, section_id=section_id)
+            if not tables:
+                return results
+            table = tables[0]
             
             # Get years from header
-            header = table.find('thead')
-            if header:
-                year_cells = header.find_all('th')[1:]  # Skip first column
-                year_labels = [cell.text.strip() for cell in year_cells][-years:]
-            else:
-                return data
+            header_cells = self._XP_HEADER_CELLS(table)
+            if not header_cells:
+                return results
+            year_labels = [cell.text_content().strip() for cell in header_cells[1:]][-years:]  # Skip first column
             
-            # Find the row with the metric
-            rows = table.find('tbody').find_all('tr')
-            for row in rows:
-                cells = row.find_all('td')
-                if cells:
-                    row_label = cells[0].text.strip().lower()
-                    if metric_name.lower() in row_label:
-                        values = [cells[i].text.strip() for i in range(1, len(cells))][-years:]
-                        for i, year in enumerate(year_labels):
-                            if i < len(values):
-                                try:
-                                    # Clean and convert value
-                                    val = values[i].replace(',', '').replace('%', '').strip()
-                                    if val and val != '-':
-                                        data[year] = float(val)
-                                except ValueError:
-                                    pass
-                        break
+            # Find the first row for every label substring in one walk over the body
+            wanted = {substr for substrs in metric_map.values() for substr in substrs}
+            matched_rows = {}
+            for row in self._XP_BODY_ROWS(table):
+                cells = self._XP_CELLS(row)
+                if not cells:
+                    continue
+                row_label = cells[0].text_content().strip().lower()
+                for substr in wanted:
+                    if substr not in matched_rows and substr in row_label:
+                        matched_rows[substr] = cells
+                if len(matched_rows) == len(wanted):
+                    break
+            
+            for metric, substrs in metric_map.items():
+                for substr in substrs:
+                    if substr in matched_rows:
+                        data = self._row_values(matched_rows[substr], year_labels, years)
+                        if data:
+                            results[metric] = data
+                            break
         except Exception as e:
             pass
+        return results
+    
+    @classmethod
+    def _row_values(cls, cells: List[lxml_html.HtmlElement], year_labels: List[str], years: int) -> Dict[str, float]:
+        """Convert a table row's value cells to {year label: value}, skipping blanks"""
+        data = {}
+        values = [cell.text_content().strip() for cell in cells[1:]][-years:]
+        for year, value in zip(year_labels, values):
+            try:
+                # Clean and convert value
+                val = value.translate(cls._STRIP_CHARS).strip()
+                if val and val != '-':
+                    data[year] = float(val)
+            except ValueError:
+                pass
         return data
     
-    def _extract_profit_loss(self, soup: BeautifulSoup, fin_data: FinancialData, years: int):
+    def _extract_profit_loss(self, tree: lxml_html.HtmlElement, fin_data: FinancialData, years: int):
         """Extract P&L data"""
-        fin_data.revenue = self._extract_table_data(soup, 'profit-loss', 'sales', years)
-        if not fin_data.revenue:
-            fin_data.revenue = self._extract_table_data(soup, 'profit-loss', 'revenue', years)
-        fin_data.operating_income = self._extract_table_data(soup, 'profit-loss', 'operating profit', years)
-        fin_data.net_income = self._extract_table_data(soup, 'profit-loss', 'net profit', years)
-        fin_data.operating_margin = self._extract_table_data(soup, 'profit-loss', 'opm', years)
-    
-    def _extract_balance_sheet(self, soup: BeautifulSoup, fin_data: FinancialData, years: int):
+        for attr, values in self._extract_section(tree, 'profit-loss', self.PROFIT_LOSS_METRICS, years).items():
+            setattr(fin_data, attr, values)
+    
+    def _extract_balance_sheet(self, tree: lxml_html.HtmlElement, fin_data: FinancialData, years: int):
         """Extract balance sheet data"""
-        fin_data.shareholders_equity = self._extract_table_data(soup, 'balance-sheet', 'equity', years)
-        fin_data.total_debt = self._extract_table_data(soup, 'balance-sheet', 'borrowing', years)
-        fin_data.total_assets = self._extract_table_data(soup, 'balance-sheet', 'total assets', years)
+        for attr, values in self._extract_section(tree, 'balance-sheet', self.BALANCE_SHEET_METRICS, years).items():
+            setattr(fin_data, attr, values)
     
-    def _extract_cash_flow(self, soup: BeautifulSoup, fin_data: FinancialData, years: int):
+    def _extract_cash_flow(self, tree: lxml_html.HtmlElement, fin_data: FinancialData, years: int):
         """Extract cash flow data"""
-        fin_data.operating_cash_flow = self._extract_table_data(soup, 'cash-flow', 'operating', years)
-        fin_data.free_cash_flow = self._extract_table_data(soup, 'cash-flow', 'free cash flow', years)
+        for attr, values in self._extract_section(tree, 'cash-flow', self.CASH_FLOW_METRICS, years).items():
+            setattr(fin_data, attr, values)
     
-    def _extract_ratios(self, soup: BeautifulSoup, fin_data: FinancialData, years: int):
+    def _extract_ratios(self, tree: lxml_html.HtmlElement, fin_data: FinancialData, years: int):
         """Extract financial ratios"""
-        fin_data.roe = self._extract_table_data(soup, 'ratios', 'roe', years)
-        fin_data.roce = self._extract_table_data(soup, 'ratios', 'roce', years)
+        for attr, values in self._extract_section(tree, 'ratios', self.RATIO_METRICS, years).items():
+            setattr(fin_data, attr, values)
     
-    def _extract_company_info(self, soup: BeautifulSoup, fin_data: FinancialData):
+    def _extract_company_info(self, tree: lxml_html.HtmlElement, fin_data: FinancialData):
         """Extract company information"""
         try:
             # Extract from top ratios section
-            ratios_list = soup.find('ul', id='top-ratios')
-            if ratios_list:
-                items = ratios_list.find_all('li')
-                for item in items:
-                    name = item.find('span', class_='name')
-                    value = item.find('span', class_='number')
-                    if name and value:
-                        name_text = name.text.strip().lower()
-                        value_text = value.text.strip().replace(',', '')
-                        
-                        if 'market cap' in name_text:
-                            fin_data.market_cap = self._parse_value(value_text)
-                        elif 'stock p/e' in name_text or 'p/e' in name_text:
-                            fin_data.pe_ratio = self._parse_value(value_text)
-                        elif 'book value' in name_text:
-                            pass  # Could calculate P/B from this
-                        elif 'dividend yield' in name_text:
-                            fin_data.dividend_yield = self._parse_value(value_text)
-                        elif 'roe' in name_text:
-                            fin_data.roe['current'] = self._parse_value(value_text)
-                        elif 'roce' in name_text:
-                            fin_data.roce['current'] = self._parse_value(value_text)
+            for item in self._XP_TOP_RATIOS(tree):
+                name = self._XP_RATIO_NAME(item)
+                value = self._XP_RATIO_NUMBER(item)
+                if name and value:
+                    name_text = name[0].text_content().strip().lower()
+                    value_text = value[0].text_content().strip().replace(',', '')
+                    
+                    if 'market cap' in name_text:
+                        fin_data.market_cap = self._parse_value(value_text)
+                    elif 'stock p/e' in name_text or 'p/e' in name_text:
+                        fin_data.pe_ratio = self._parse_value(value_text)
+                    elif 'book value' in name_text:
+                        pass  # Could calculate P/B from this
+                    elif 'dividend yield' in name_text:
+                        fin_data.dividend_yield = self._parse_value(value_text)
+                    elif 'roe' in name_text:
+                        fin_data.roe['current'] = self._parse_value(value_text)
+                    elif 'roce' in name_text:
+                        fin_data.roce['current'] = self._parse_value(value_text)
             
             # Extract sector/industry
-            company_info = soup.find('div', class_='company-info')
-            if company_info:
-                links = company_info.find_all('a')
-                for link in links:
-                    href = link.get('href', '')
-                    if '/screen/raw/' in href:
-                        fin_data.sector = link.text.strip()
-                        break
-                        
+            sector_link = self._XP_SECTOR_LINK(tree)
+            if sector_link:
+                fin_data.sector = sector_link[0].text_content().strip()
+            
         except Exception as e:
             pass
     
     def _parse_value(self, value_str: str) -> float:
         """Parse value string to float"""
         try:
-            value_str = value_str.replace(',', '').replace('%', '').strip()
-            if 'Cr' in value_str:
-                value_str = value_str.replace('Cr', '').strip()
-            return float(value_str)
+            # float() tolerates the space left before a trimmed crore suffix
+            return float(value_str.translate(self._STRIP_CHARS).strip().removesuffix('Cr'))
         except ValueError:
             return 0.0
 
@@ -355,20 +840,37 @@ class ScreenerInFetcher(BaseDataFetcher):
 class YahooFinanceFetcher(BaseDataFetcher):
     """Fetcher for Yahoo Finance (Global stocks)"""
     
-    # Common Indian stock tickers that need .NS suffix
-    INDIAN_TICKERS = {
-        'TCS', 'RELIANCE', 'INFY', 'HDFCBANK', 'ICICIBANK', 'HINDUNILVR',
-        'SBIN', 'BHARTIARTL', 'ITC', 'KOTAKBANK', 'LT', 'AXISBANK',
-        'WIPRO', 'ASIANPAINT', 'MARUTI', 'HCLTECH', 'SUNPHARMA', 'TITAN',
-        'ULTRACEMCO', 'BAJFINANCE', 'NESTLEIND', 'TECHM', 'POWERGRID',
-        'NTPC', 'TATAMOTORS', 'TATASTEEL', 'JSWSTEEL', 'ONGC', 'COALINDIA',
-        'ADANIENT', 'ADANIPORTS', 'BAJAJFINSV', 'DRREDDY', 'CIPLA', 'EICHERMOT',
-        'GRASIM', 'DIVISLAB', 'BRITANNIA', 'APOLLOHOSP', 'INDUSINDBK', 'M&M',
-        'BPCL', 'HEROMOTOCO', 'HINDALCO', 'TATACONSUM', 'BAJAJ-AUTO', 'UPL'
+    # Known Indian stock tickers that need .NS suffix
+    INDIAN_TICKERS = INDIAN_TICKERS
+    
+    # Yahoo quote types that show up in name fields but are not company names
+    _SKIP_NAMES = frozenset({'EQUITY', 'MUTUALFUND', 'ETF'})
+    
+    # FinancialData field -> yfinance statement row
+    INCOME_ROWS = {
+        'revenue': 'Total Revenue',
+        'net_income': 'Net Income',
+        'operating_income': 'Operating Income',
+        'gross_profit': 'Gross Profit',
+        'ebitda': 'EBITDA',
+    }
+    BALANCE_ROWS = {
+        'total_assets': 'Total Assets',
+        'total_liabilities': 'Total Liabilities Net Minority Interest',
+        'shareholders_equity': 'Stockholders Equity',
+        'total_debt': 'Total Debt',
+        'cash_and_equivalents': 'Cash And Cash Equivalents',
+    }
+    CASHFLOW_ROWS = {
+        'operating_cash_flow': 'Operating Cash Flow',
+        'free_cash_flow': 'Free Cash Flow',
+        'capex': 'Capital Expenditure',
     }
     
+    __slots__ = ()
+    
     def __init__(self):
-        if yf is None:
+        if _load_yfinance() is None:
             raise ImportError("yfinance is required for Yahoo Finance fetching")
     
     def _resolve_ticker(self, company_identifier: str) -> List[str]:
@@ -376,14 +878,14 @@ class YahooFinanceFetcher(BaseDataFetcher):
         ticker = company_identifier.upper().strip()
         candidates = []
         
-        # If already has exchange suffix, use as-is
-        if '.NS' in ticker or '.BO' in ticker or '.' in ticker:
+        # If already has exchange suffix (.NS, .BO or any other), use as-is
+        if '.' in ticker:
             candidates.append(ticker)
             return candidates
         
         # Check if it's a known Indian stock
         if ticker in self.INDIAN_TICKERS:
-            candidates.append(f"{ticker}.NS")  # NSE first
+            candidates.append(_INDIAN_TICKER_NS[ticker])  # NSE first
             candidates.append(f"{ticker}.BO")  # BSE as fallback
         
         # Also try the raw ticker (for US stocks)
@@ -393,75 +895,94 @@ class YahooFinanceFetcher(BaseDataFetcher):
     
     def search_company(self, query: str) -> List[Dict[str, str]]:
         """Search for companies using Yahoo Finance data"""
+        try:
+            return self.search_company_strict(query)
+        except Exception:
+            # If all attempts fail, results will be empty
+            return []
+    
+    def search_company_strict(self, query: str) -> List[Dict[str, str]]:
+        """Like search_company, but raises IncompleteLookup if an empty answer came from a failed lookup"""
         ticker = query.upper().strip()
+        cache_key = FileCache.make_key('yahoo', ticker, 'search')
+        cached = _file_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         results = []
         
-        # Try to get actual company name from Yahoo Finance
-        try:
-            candidates = self._resolve_ticker(ticker)
-            for ticker_symbol in candidates:
-                try:
-                    # Try with suppress_output first
-                    with suppress_output():
-                        yf_ticker = yf.Ticker(ticker_symbol)
-                        info = yf_ticker.info
-                    
-                    # If info is empty or very small, try without suppression
-                    if not info or len(info) < 5:
-                        yf_ticker = yf.Ticker(ticker_symbol)
-                        info = yf_ticker.info
-                    
-                    if info and len(info) > 5:  # Valid info dict should have many fields
-                        # Try multiple name fields in order of preference
-                        company_name = None
-                        for name_field in ['longName', 'shortName', 'name', 'quoteType']:
-                            if name_field in info and info[name_field]:
-                                potential_name = str(info[name_field])
-                                # Skip if it's just the ticker itself (without exchange suffix)
-                                base_ticker = ticker_symbol.replace('.NS', '').replace('.BO', '').replace('.', '')
-                                if (potential_name.upper() != base_ticker and 
-                                    potential_name.upper() != ticker and
-                                    potential_name.upper() not in ['EQUITY', 'MUTUALFUND', 'ETF']):
-                                    company_name = potential_name
-                                    break
-                        
-                        if company_name and company_name.upper() not in [ticker, ticker_symbol, base_ticker]:
-                            results.append({'name': company_name, 'ticker': ticker_symbol})
-                            break  # Use first successful result with proper name
-                except Exception as e:
-                    # Continue trying other candidates
-                    continue
-        except Exception as e:
-            # If all attempts fail, results will be empty
-            pass
+        # Try to get actual company name from Yahoo Finance; candidates are probed
+        # concurrently but the first one (in preference order) with a name wins
+        errors = []
+        candidates = self._resolve_ticker(ticker)
+        found = _first_valid(
+            lambda ticker_symbol: (ticker_symbol, self._lookup_name(ticker_symbol, ticker)),
+            candidates,
+            lambda result: result[1] is not None,
+            errors
+        )
+        if found:
+            results.append({'name': found[1], 'ticker': found[0]})
+        elif errors:
+            raise IncompleteLookup(f"Yahoo Finance lookup failed for {ticker}: {errors[0]}")
         
         # Don't add fallback with ticker as company name
         # Return empty results if we couldn't fetch a real company name
         # This allows the validation to try other APIs or fail gracefully
+        if results:
+            _file_cache.set(cache_key, results, SEARCH_TTL)
         return results
     
-    def fetch_data(self, company_identifier: str, years: int) -> Optional[FinancialData]:
-        """Fetch financial data from Yahoo Finance"""
-        # Try different ticker variants
-        ticker_candidates = self._resolve_ticker(company_identifier)
-        
-        for ticker_symbol in ticker_candidates:
-            try:
-                result = self._fetch_for_ticker(ticker_symbol, years)
-                if result and (result.revenue or result.net_income):
-                    return result
-            except Exception:
-                continue
+    def _lookup_name(self, ticker_symbol: str, ticker: str) -> Optional[str]:
+        """Get a real company name for one ticker candidate, or None"""
+        info = yf.Ticker(ticker_symbol).info
         
+        if info and len(info) > 5:  # Valid info dict should have many fields
+            # Try multiple name fields in order of preference
+            company_name = None
+            for name_field in ['longName', 'shortName', 'name', 'quoteType']:
+                if name_field in info and info[name_field]:
+                    potential_name = str(info[name_field])
+                    # Skip if it's just the ticker itself (without exchange suffix)
+                    base_ticker = _strip_exchange(ticker_symbol).replace('.', '')
+                    if (potential_name.upper() != base_ticker and 
+                        potential_name.upper() != ticker and
+                        potential_name.upper() not in self._SKIP_NAMES):
+                        company_name = potential_name
+                        break
+            
+            if company_name and company_name.upper() not in (ticker, ticker_symbol, base_ticker):
+                return company_name
         return None
     
-    def _fetch_for_ticker(self, ticker_symbol: str, years: int) -> Optional[FinancialData]:
+    def fetch_data(self, company_identifier: str, years: int, force_refresh: bool = False) -> Optional[FinancialData]:
+        """Fetch financial data from Yahoo Finance"""
+        # Try different ticker variants concurrently; the first usable one in
+        # preference order (.NS, .BO, raw) is returned
+        ticker_candidates = self._resolve_ticker(company_identifier)
+        errors = []
+        data = _first_valid(
+            lambda ticker_symbol: self._fetch_for_ticker(ticker_symbol, years, force_refresh),
+            ticker_candidates,
+            lambda result: result is not None and result.is_populated,
+            errors
+        )
+        if data is None and errors:
+            raise errors[0]
+        return data
+    
+    def _fetch_for_ticker(self, ticker_symbol: str, years: int, force_refresh: bool = False) -> Optional[FinancialData]:
         """Fetch data for a specific ticker symbol"""
         try:
-            # Suppress yfinance HTTP error messages
-            with suppress_output():
-                ticker = yf.Ticker(ticker_symbol)
+            ticker = yf.Ticker(ticker_symbol)
+            
+            # .info is the heaviest call, so it is cached separately from the statements
+            info_key = FileCache.make_key('yahoo', ticker_symbol, 'info')
+            info = None if force_refresh else _file_cache.get(info_key)
+            if info is None:
                 info = ticker.info
+                if info and 'symbol' in info:
+                    _file_cache.set(info_key, info, QUOTE_TTL)
             
             if not info or 'symbol' not in info:
                 return None
@@ -471,61 +992,18 @@ class YahooFinanceFetcher(BaseDataFetcher):
                 ticker=ticker_symbol.upper(),
                 years_analyzed=years,
                 data_source="Yahoo Finance",
-                fetch_timestamp=datetime.now().isoformat()
+                fetch_timestamp=_now_iso()
             )
             
-            # Get financial statements (suppress any yfinance warnings)
-            with suppress_output():
-                income_stmt = ticker.income_stmt
-                balance_sheet = ticker.balance_sheet
-                cash_flow = ticker.cashflow
+            statements_key = FileCache.make_key('yahoo', ticker_symbol, 'statements', years)
+            statements = None if force_refresh else _file_cache.get(statements_key)
+            if statements is None:
+                statements = self._extract_statements(ticker, years)
+                if any(statements.values()):
+                    _file_cache.set(statements_key, statements, FUNDAMENTALS_TTL)
             
-            # Process income statement
-            if income_stmt is not None and not income_stmt.empty:
-                columns = list(income_stmt.columns)[:years]
-                for col in columns:
-                    year_label = str(col.year) if hasattr(col, 'year') else str(col)
-                    
-                    if 'Total Revenue' in income_stmt.index:
-                        fin_data.revenue[year_label] = float(income_stmt.loc['Total Revenue', col] or 0)
-                    if 'Net Income' in income_stmt.index:
-                        fin_data.net_income[year_label] = float(income_stmt.loc['Net Income', col] or 0)
-                    if 'Operating Income' in income_stmt.index:
-                        fin_data.operating_income[year_label] = float(income_stmt.loc['Operating Income', col] or 0)
-                    if 'Gross Profit' in income_stmt.index:
-                        fin_data.gross_profit[year_label] = float(income_stmt.loc['Gross Profit', col] or 0)
-                    if 'EBITDA' in income_stmt.index:
-                        fin_data.ebitda[year_label] = float(income_stmt.loc['EBITDA', col] or 0)
-            
-            # Process balance sheet
-            if balance_sheet is not None and not balance_sheet.empty:
-                columns = list(balance_sheet.columns)[:years]
-                for col in columns:
-                    year_label = str(col.year) if hasattr(col, 'year') else str(col)
-                    
-                    if 'Total Assets' in balance_sheet.index:
-                        fin_data.total_assets[year_label] = float(balance_sheet.loc['Total Assets', col] or 0)
-                    if 'Total Liabilities Net Minority Interest' in balance_sheet.index:
-                        fin_data.total_liabilities[year_label] = float(balance_sheet.loc['Total Liabilities Net Minority Interest', col] or 0)
-                    if 'Stockholders Equity' in balance_sheet.index:
-                        fin_data.shareholders_equity[year_label] = float(balance_sheet.loc['Stockholders Equity', col] or 0)
-                    if 'Total Debt' in balance_sheet.index:
-                        fin_data.total_debt[year_label] = float(balance_sheet.loc['Total Debt', col] or 0)
-                    if 'Cash And Cash Equivalents' in balance_sheet.index:
-                        fin_data.cash_and_equivalents[year_label] = float(balance_sheet.loc['Cash And Cash Equivalents', col] or 0)
-            
-            # Process cash flow
-            if cash_flow is not None and not cash_flow.empty:
-                columns = list(cash_flow.columns)[:years]
-                for col in columns:
-                    year_label = str(col.year) if hasattr(col, 'year') else str(col)
-                    
-                    if 'Operating Cash Flow' in cash_flow.index:
-                        fin_data.operating_cash_flow[year_label] = float(cash_flow.loc['Operating Cash Flow', col] or 0)
-                    if 'Free Cash Flow' in cash_flow.index:
-                        fin_data.free_cash_flow[year_label] = float(cash_flow.loc['Free Cash Flow', col] or 0)
-                    if 'Capital Expenditure' in cash_flow.index:
-                        fin_data.capex[year_label] = float(cash_flow.loc['Capital Expenditure', col] or 0)
+            for attr, values in statements.items():
+                setattr(fin_data, attr, values)
             
             # Additional info
             fin_data.sector = info.get('sector', '')
@@ -541,36 +1019,61 @@ class YahooFinanceFetcher(BaseDataFetcher):
             return fin_data
             
         except Exception as e:
+            if _is_outage(e):
+                raise SourceUnavailable(f"Yahoo Finance: {e}") from e
             # Silent fail - multi-source fetcher will try next source
             return None
     
+    def _extract_statements(self, ticker, years: int) -> Dict[str, Dict[str, float]]:
+        """Read the per-year statement rows into {FinancialData field: {year: value}}"""
+        # Get financial statements
+        income_stmt = ticker.income_stmt
+        balance_sheet = ticker.balance_sheet
+        cash_flow = ticker.cashflow
+        
+        statements = {}
+        for statement, rows in ((income_stmt, self.INCOME_ROWS),
+                                (balance_sheet, self.BALANCE_ROWS),
+                                (cash_flow, self.CASHFLOW_ROWS)):
+            if statement is None or statement.empty:
+                continue
+            # Slice the wanted rows and years out as one dense float block
+            fields = {attr: row for attr, row in rows.items() if row in statement.index}
+            block = statement.loc[list(fields.values())].iloc[:, :years]
+            year_labels = [str(col.year) if hasattr(col, 'year') else str(col) for col in block.columns]
+            for attr, values in zip(fields, block.to_numpy(dtype=np.float64).tolist()):
+                statements[attr] = dict(zip(year_labels, values))
+        return statements
+    
+    # (ratio field, numerator, denominator, scale)
+    RATIOS = (
+        ('roe', 'net_income', 'shareholders_equity', 100),  # Return on Equity
+        ('roa', 'net_income', 'total_assets', 100),  # Return on Assets
+        ('debt_to_equity', 'total_debt', 'shareholders_equity', 1),
+        ('operating_margin', 'operating_income', 'revenue', 100),
+        ('net_margin', 'net_income', 'revenue', 100),
+    )
+    
     def _calculate_ratios(self, fin_data: FinancialData):
         """Calculate financial ratios from raw data"""
-        for year in fin_data.revenue.keys():
-            # ROE = Net Income / Shareholders Equity
-            if year in fin_data.net_income and year in fin_data.shareholders_equity:
-                if fin_data.shareholders_equity[year] != 0:
-                    fin_data.roe[year] = (fin_data.net_income[year] / fin_data.shareholders_equity[year]) * 100
-            
-            # ROA = Net Income / Total Assets
-            if year in fin_data.net_income and year in fin_data.total_assets:
-                if fin_data.total_assets[year] != 0:
-                    fin_data.roa[year] = (fin_data.net_income[year] / fin_data.total_assets[year]) * 100
-            
-            # Debt to Equity = Total Debt / Shareholders Equity
-            if year in fin_data.total_debt and year in fin_data.shareholders_equity:
-                if fin_data.shareholders_equity[year] != 0:
-                    fin_data.debt_to_equity[year] = fin_data.total_debt[year] / fin_data.shareholders_equity[year]
-            
-            # Operating Margin = Operating Income / Revenue
-            if year in fin_data.operating_income and year in fin_data.revenue:
-                if fin_data.revenue[year] != 0:
-                    fin_data.operating_margin[year] = (fin_data.operating_income[year] / fin_data.revenue[year]) * 100
-            
-            # Net Margin = Net Income / Revenue
-            if year in fin_data.net_income and year in fin_data.revenue:
-                if fin_data.revenue[year] != 0:
-                    fin_data.net_margin[year] = (fin_data.net_income[year] / fin_data.revenue[year]) * 100
+        years = list(fin_data.revenue)
+        if not years:
+            return
+        
+        # One aligned array per input metric, plus which years each metric actually has
+        metrics = {name for _, num, den, _ in self.RATIOS for name in (num, den)}
+        _, arrays = fin_data.as_arrays(*metrics, years=years)
+        present = {
+            name: np.array([year in getattr(fin_data, name) for year in years], dtype=bool)
+            for name in metrics
+        }
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for attr, num, den, scale in self.RATIOS:
+                # A ratio is only set for years with both inputs and a non-zero denominator
+                valid = present[num] & present[den] & (arrays[den] != 0)
+                values = arrays[num] / arrays[den] * scale
+                getattr(fin_data, attr).update(zip(compress(years, valid), values[valid].tolist()))
 
 
 class FMPFetcher(BaseDataFetcher):
@@ -578,81 +1081,129 @@ class FMPFetcher(BaseDataFetcher):
     
     BASE_URL = "https://financialmodelingprep.com/api/v3"
     
+    # FinancialData field -> FMP statement key
+    INCOME_FIELDS = {
+        'revenue': 'revenue',
+        'net_income': 'netIncome',
+        'operating_income': 'operatingIncome',
+        'gross_profit': 'grossProfit',
+        'ebitda': 'ebitda',
+    }
+    BALANCE_FIELDS = {
+        'total_assets': 'totalAssets',
+        'total_liabilities': 'totalLiabilities',
+        'shareholders_equity': 'totalStockholdersEquity',
+        'total_debt': 'totalDebt',
+        'cash_and_equivalents': 'cashAndCashEquivalents',
+    }
+    CASHFLOW_FIELDS = {
+        'operating_cash_flow': 'operatingCashFlow',
+        'free_cash_flow': 'freeCashFlow',
+        'capex': 'capitalExpenditure',
+    }
+    
+    __slots__ = ('api_key', 'session')
+    
     def __init__(self, api_key: str):
         self.api_key = api_key
+        # Shared keep-alive session so every instance reuses the same TCP/TLS connections
+        self.session = _shared_session('fmp')
+    
+    @staticmethod
+    def _apply_statement(fin_data: FinancialData, items: List[Dict[str, Any]], fields: Dict[str, str]):
+        """Populate per-year FinancialData fields from FMP statement rows in one pass per field"""
+        years = [item.get('date', '')[:4] for item in items]
+        for attr, key in fields.items():
+            setattr(fin_data, attr, dict(zip(years, (item.get(key, 0) for item in items))))
+    
+    def _get_cached_json(self, url: str, cache_key: str, ttl: float, force_refresh: bool = False,
+                         timeout: Tuple[float, float] = _API_TIMEOUT) -> Optional[Any]:
+        """
+        GET a JSON endpoint through the file cache
+        
+        Returns None for a non-200 response; raises SourceUnavailable for a 429/5xx.
+        """
+        data = None if force_refresh else _file_cache.get(cache_key)
+        if data is None:
+            response = self.session.get(url, timeout=timeout)
+            if response.status_code != 200:
+                _raise_for_outage(response)
+                return None
+            data = _json(response)
+            # Empty payloads (unknown ticker) are not worth keeping for a month
+            if data:
+                _file_cache.set(cache_key, data, ttl)
+        return data
     
     def search_company(self, query: str) -> List[Dict[str, str]]:
         """Search for companies using FMP API"""
         try:
-            url = f"{self.BASE_URL}/search?query={query}&apikey={self.api_key}"
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                results = response.json()
-                return [
-                    {'name': item.get('name', ''), 'ticker': item.get('symbol', '')}
-                    for item in results[:10]
-                ]
+            return self.search_company_strict(query)
+        except IncompleteLookup:
+            pass
         except Exception as e:
-            print(f"Search error: {e}")
+            _log.warning("FMP search failed: %s", e)
         return []
     
-    def fetch_data(self, company_identifier: str, years: int) -> Optional[FinancialData]:
+    def search_company_strict(self, query: str) -> List[Dict[str, str]]:
+        """Like search_company, but raises IncompleteLookup on a non-200 response"""
+        # Names such as "M&M" must be escaped or the '&' would start a new parameter
+        url = f"{self.BASE_URL}/search?query={quote_plus(query)}&apikey={self.api_key}"
+        results = self._get_cached_json(url, FileCache.make_key('fmp', query, 'search'), SEARCH_TTL)
+        if results is None:
+            raise IncompleteLookup(f"FMP search for {query!r} did not return 200")
+        return [
+            {'name': item.get('name', ''), 'ticker': item.get('symbol', '')}
+            for item in results[:10]
+        ]
+    
+    def fetch_data(self, company_identifier: str, years: int, force_refresh: bool = False) -> Optional[FinancialData]:
         """Fetch financial data from FMP API"""
         try:
-            # Get company profile
-            profile_url = f"{self.BASE_URL}/profile/{company_identifier}?apikey={self.api_key}"
-            profile_resp = requests.get(profile_url, timeout=10)
+            # (endpoint, query string, cache TTL); the profile holds price-driven fields
+            endpoints = [
+                ('profile', '', QUOTE_TTL),
+                ('income-statement', f"limit={years}&", FUNDAMENTALS_TTL),
+                ('balance-sheet-statement', f"limit={years}&", FUNDAMENTALS_TTL),
+                ('cash-flow-statement', f"limit={years}&", FUNDAMENTALS_TTL),
+            ]
             
-            if profile_resp.status_code != 200:
+            def get_endpoint(endpoint: Tuple[str, str, float]) -> Optional[Any]:
+                name, params, ttl = endpoint
+                url = f"{self.BASE_URL}/{name}/{company_identifier}?{params}apikey={self.api_key}"
+                # The profile does not depend on years, and sharing one entry lets
+                # validate_company_name's profile lookup be reused here
+                cache_key = FileCache.make_key('fmp', company_identifier, name, years if params else 0)
+                return self._get_cached_json(url, cache_key, ttl, force_refresh)
+            
+            # Profile and the three statements are independent - request them concurrently
+            with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+                profiles, income, balance, cashflow = executor.map(get_endpoint, endpoints)
+            
+            if profiles is None:
                 return None
             
-            profile = profile_resp.json()[0] if profile_resp.json() else {}
+            profile = profiles[0] if profiles else {}
             
             fin_data = FinancialData(
                 company_name=profile.get('companyName', company_identifier),
                 ticker=company_identifier.upper(),
                 years_analyzed=years,
                 data_source="Financial Modeling Prep",
-                fetch_timestamp=datetime.now().isoformat()
+                fetch_timestamp=_now_iso()
             )
             
-            # Get income statement
-            income_url = f"{self.BASE_URL}/income-statement/{company_identifier}?limit={years}&apikey={self.api_key}"
-            income_resp = requests.get(income_url, timeout=10)
-            
-            if income_resp.status_code == 200:
-                for item in income_resp.json():
-                    year = item.get('date', '')[:4]
-                    fin_data.revenue[year] = item.get('revenue', 0)
-                    fin_data.net_income[year] = item.get('netIncome', 0)
-                    fin_data.operating_income[year] = item.get('operatingIncome', 0)
-                    fin_data.gross_profit[year] = item.get('grossProfit', 0)
-                    fin_data.ebitda[year] = item.get('ebitda', 0)
-            
-            # Get balance sheet
-            balance_url = f"{self.BASE_URL}/balance-sheet-statement/{company_identifier}?limit={years}&apikey={self.api_key}"
-            balance_resp = requests.get(balance_url, timeout=10)
+            # Income statement
+            if income is not None:
+                self._apply_statement(fin_data, income, self.INCOME_FIELDS)
             
-            if balance_resp.status_code == 200:
-                for item in balance_resp.json():
-                    year = item.get('date', '')[:4]
-                    fin_data.total_assets[year] = item.get('totalAssets', 0)
-                    fin_data.total_liabilities[year] = item.get('totalLiabilities', 0)
-                    fin_data.shareholders_equity[year] = item.get('totalStockholdersEquity', 0)
-                    fin_data.total_debt[year] = item.get('totalDebt', 0)
-                    fin_data.cash_and_equivalents[year] = item.get('cashAndCashEquivalents', 0)
+            # Balance sheet
+            if balance is not None:
+                self._apply_statement(fin_data, balance, self.BALANCE_FIELDS)
             
-            # Get cash flow
-            cashflow_url = f"{self.BASE_URL}/cash-flow-statement/{company_identifier}?limit={years}&apikey={self.api_key}"
-            cashflow_resp = requests.get(cashflow_url, timeout=10)
-            
-            if cashflow_resp.status_code == 200:
-                for item in cashflow_resp.json():
-                    year = item.get('date', '')[:4]
-                    fin_data.operating_cash_flow[year] = item.get('operatingCashFlow', 0)
-                    fin_data.free_cash_flow[year] = item.get('freeCashFlow', 0)
-                    fin_data.capex[year] = item.get('capitalExpenditure', 0)
+            # Cash flow
+            if cashflow is not None:
+                self._apply_statement(fin_data, cashflow, self.CASHFLOW_FIELDS)
             
             # Set company info
             fin_data.sector = profile.get('sector', '')
@@ -663,7 +1214,9 @@ class FMPFetcher(BaseDataFetcher):
             return fin_data
             
         except Exception as e:
-            print(f"Error fetching data from FMP: {e}")
+            if _is_outage(e):
+                raise SourceUnavailable(f"FMP: {e}") from e
+            _log.warning("FMP fetch failed: %s", e)
             return None
 
 
@@ -694,7 +1247,7 @@ class DataFetcherFactory:
         """Get all available fetchers for fallback"""
         fetchers = [ScreenerInFetcher()]
         
-        if yf:
+        if _YFINANCE_INSTALLED:
             fetchers.append(YahooFinanceFetcher())
         
         if fmp_api_key:
@@ -703,37 +1256,131 @@ class DataFetcherFactory:
         return fetchers
 
 
+class CircuitBreaker:
+    """Tracks consecutive failures per data source so known-down sources can be skipped"""
+    
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 60.0):
+        """
+        Args:
+            failure_threshold: Consecutive failures before a source is skipped
+            cooldown: Seconds to skip a source before probing it again
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures: Dict[type, int] = {}
+        self._opened_at: Dict[type, float] = {}
+        self._lock = threading.Lock()
+    
+    def is_open(self, source: type) -> bool:
+        """Check whether a source is currently being skipped"""
+        with self._lock:
+            opened_at = self._opened_at.get(source)
+            if opened_at is None:
+                return False
+            if time.monotonic() - opened_at >= self.cooldown:
+                # Cooldown over - allow a probe; one more failure re-opens it
+                del self._opened_at[source]
+                self._failures[source] = self.failure_threshold - 1
+                return False
+            return True
+    
+    def record_success(self, source: type):
+        """Reset the failure count after a successful fetch"""
+        with self._lock:
+            self._failures.pop(source, None)
+            self._opened_at.pop(source, None)
+    
+    def record_failure(self, source: type):
+        """Count a failed fetch, opening the breaker at the threshold"""
+        with self._lock:
+            failures = self._failures.get(source, 0) + 1
+            self._failures[source] = failures
+            if failures >= self.failure_threshold:
+                self._opened_at[source] = time.monotonic()
+
+
+@lru_cache(maxsize=4)
+def _get_fmp_fetcher(api_key: str) -> FMPFetcher:
+    """Shared FMPFetcher per API key, reused across validations"""
+    return FMPFetcher(api_key)
+
+
+@lru_cache(maxsize=1)
+def _get_yahoo_fetcher() -> YahooFinanceFetcher:
+    """Shared YahooFinanceFetcher, reused across validations"""
+    return YahooFinanceFetcher()
+
+
 class MultiSourceFetcher:
     """Fetcher that tries multiple sources with fallback"""
     
     # Known Indian stock tickers for auto-detection
-    INDIAN_TICKERS = {
-        'TCS', 'RELIANCE', 'INFY', 'HDFCBANK', 'ICICIBANK', 'HINDUNILVR',
-        'SBIN', 'BHARTIARTL', 'ITC', 'KOTAKBANK', 'LT', 'AXISBANK',
-        'WIPRO', 'ASIANPAINT', 'MARUTI', 'HCLTECH', 'SUNPHARMA', 'TITAN',
-        'ULTRACEMCO', 'BAJFINANCE', 'NESTLEIND', 'TECHM', 'POWERGRID',
-        'NTPC', 'TATAMOTORS', 'TATASTEEL', 'JSWSTEEL', 'ONGC', 'COALINDIA'
-    }
+    INDIAN_TICKERS = INDIAN_TICKERS
+    _INDIAN_FIRST_CHARS = frozenset(ticker[0] for ticker in INDIAN_TICKERS)
+    
+    # Shared by all instances so every caller benefits from known outages
+    breaker = CircuitBreaker()
+    
+    __slots__ = ('fetchers', '_inflight', '_inflight_lock')
     
     def __init__(self, fmp_api_key: str = None):
         self.fetchers = DataFetcherFactory.get_all_fetchers(fmp_api_key)
+        # In-flight fetches keyed by (identifier, years, market); concurrent
+        # callers for the same company share one fetch (single-flight)
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
     
     def _detect_market(self, company_identifier: str) -> str:
         """Auto-detect market based on ticker"""
         ticker = company_identifier.upper().strip()
         
         # Check for explicit exchange suffix
-        if '.NS' in ticker or '.BO' in ticker:
+        if ticker.endswith(_EXCHANGE_SUFFIXES):
             return 'india'
         
-        # Check if it's a known Indian ticker
-        if ticker in self.INDIAN_TICKERS:
+        # Check if it's a known Indian ticker (the first-letter pre-filter
+        # skips the full set lookup for most non-Indian tickers)
+        if ticker[:1] in self._INDIAN_FIRST_CHARS and ticker in self.INDIAN_TICKERS:
             return 'india'
         
         return 'global'
     
-    def fetch_data(self, company_identifier: str, years: int, preferred_market: str = "auto") -> Optional[FinancialData]:
-        """Try to fetch data from multiple sources"""
+    def fetch_data(self, company_identifier: str, years: int, preferred_market: str = "auto",
+                   force_refresh: bool = False) -> Optional[FinancialData]:
+        """
+        Try to fetch data from multiple sources (force_refresh bypasses the file cache)
+        
+        Concurrent calls for the same company are collapsed into a single fetch;
+        every caller receives its own copy of the result.
+        """
+        key = (company_identifier.upper().strip(), years, preferred_market.lower())
+        
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_owner:
+            # Another caller is already fetching this company - share its result
+            return copy.deepcopy(future.result())
+        
+        try:
+            result = self._fetch_data(company_identifier, years, preferred_market, force_refresh)
+            future.set_result(result)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        
+        return result
+    
+    def _fetch_data(self, company_identifier: str, years: int, preferred_market: str,
+                    force_refresh: bool) -> Optional[FinancialData]:
+        """Run the actual source fallback chain (see fetch_data)"""
         
         # Auto-detect market if needed
         if preferred_market.lower() == "auto":
@@ -747,13 +1394,22 @@ class MultiSourceFetcher:
                       [f for f in fetchers if isinstance(f, ScreenerInFetcher)] + \
                       [f for f in fetchers if not isinstance(f, (YahooFinanceFetcher, ScreenerInFetcher))]
         
+        # Skip sources that keep failing (unless every source is being skipped)
+        fetchers = [f for f in fetchers if not self.breaker.is_open(type(f))] or fetchers
+        
         for fetcher in fetchers:
             try:
-                data = fetcher.fetch_data(company_identifier, years)
-                if data and (data.revenue or data.net_income):
-                    return data
+                data = fetcher.fetch_data(company_identifier, years, force_refresh=force_refresh)
             except Exception as e:
+                # Only an outage counts against the source; a bug in one fetcher
+                # should not take it out for everyone
+                if _is_outage(e):
+                    self.breaker.record_failure(type(fetcher))
                 continue
+            if data and data.is_populated:
+                self.breaker.record_success(type(fetcher))
+                return data
+            # A clean "no data" (e.g. Screener for a US ticker) says nothing about health
         
         return None
     
@@ -762,25 +1418,79 @@ class MultiSourceFetcher:
         all_results = []
         seen = set()
         
-        for fetcher in self.fetchers:
+        def search(fetcher: BaseDataFetcher) -> List[Dict[str, str]]:
             try:
-                results = fetcher.search_company(query)
+                return fetcher.search_company(query)
+            except Exception:
+                return []
+        
+        if not self.fetchers:
+            return all_results
+        
+        # Sources are queried concurrently but merged in fetcher order,
+        # so duplicates keep the entry from the preferred source
+        with ThreadPoolExecutor(max_workers=len(self.fetchers)) as executor:
+            for results in executor.map(search, self.fetchers):
                 for r in results:
-                    key = (r['name'].lower(), r['ticker'].upper())
+                    # A ticker identifies the company on its own; the name only
+                    # matters for results that came back without one
+                    ticker = r['ticker'].upper()
+                    key = (ticker, '' if ticker else r['name'].casefold())
                     if key not in seen:
                         seen.add(key)
                         all_results.append(r)
-            except Exception:
-                continue
         
         return all_results
 
 
+# In-flight validations keyed by (normalized query, has FMP key).
+# Concurrent callers for the same key wait on the first caller's result
+# instead of repeating the FMP/Yahoo lookups (single-flight).
+_inflight_validations: Dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+# "Not found" results keyed like _inflight_validations, stored as
+# (timestamp, result) in insertion order so typos don't re-run every lookup
+# on each retry; the oldest entry is evicted once the cache is full. Misses
+# where any lookup failed are not stored, since the company may well exist
+NEGATIVE_CACHE_TTL = 3600  # seconds
+NEGATIVE_CACHE_SIZE = 512
+_negative_validations: OrderedDict[tuple, Tuple[float, Dict[str, Any]]] = OrderedDict()
+
+# Successful results keyed like _inflight_validations, least recently used
+# first; a company that validated once keeps validating, so these never expire
+VALIDATION_CACHE_SIZE = 2048
+_valid_validations: OrderedDict[tuple, Dict[str, Any]] = OrderedDict()
+
+VALIDATION_BATCH_WORKERS = 16  # Concurrent lookups in validate_company_names_batch
+
+
+def invalidate_validation_cache(company_name: Optional[str] = None):
+    """
+    Drop cached validation results
+    
+    Args:
+        company_name: Query to forget (any FMP key setting); clears everything if None
+    """
+    with _inflight_lock:
+        if company_name is None:
+            _negative_validations.clear()
+            _valid_validations.clear()
+            return
+        query = company_name.strip().upper()
+        for cache in (_negative_validations, _valid_validations):
+            for key in [k for k in cache if k[0] == query]:
+                del cache[key]
+
+
 def validate_company_name(company_name: str, fmp_api_key: Optional[str] = None) -> Dict[str, Any]:
     """
     Validate company name or ticker and fetch matching information
     Accepts both company names and ticker symbols for validation
     
+    Concurrent calls for the same query are collapsed into a single lookup
+    and results are cached; every caller receives its own copy of the result.
+    
     Args:
         company_name: Company name or ticker symbol to validate
         fmp_api_key: Optional FMP API key for enhanced search
@@ -792,6 +1502,132 @@ def validate_company_name(company_name: str, fmp_api_key: Optional[str] = None)
             - 'best_match': Best matching company (if found)
             - 'error': Error message (if any)
     """
+    key = ((company_name or '').strip().upper(), bool(fmp_api_key))
+    
+    with _inflight_lock:
+        cached = _valid_validations.get(key)
+        if cached is not None:
+            _valid_validations.move_to_end(key)
+            return copy.deepcopy(cached)
+        
+        cached = _negative_validations.get(key)
+        if cached:
+            if time.monotonic() - cached[0] < NEGATIVE_CACHE_TTL:
+                return copy.deepcopy(cached[1])
+            del _negative_validations[key]
+        
+        future = _inflight_validations.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight_validations[key] = future
+    
+    if not is_owner:
+        # Another caller is already validating this query - share its result
+        return copy.deepcopy(future.result())
+    
+    try:
+        errors = []
+        result = _validate_company_name(company_name, fmp_api_key, errors)
+        if key[0]:
+            with _inflight_lock:
+                if result['valid']:
+                    _valid_validations[key] = copy.deepcopy(result)
+                    if len(_valid_validations) > VALIDATION_CACHE_SIZE:
+                        _valid_validations.popitem(last=False)
+                elif not errors:
+                    # Only a miss from lookups that all completed is cached; one
+                    # that failed (timeout, 429, ...) is retried on the next call
+                    _negative_validations.pop(key, None)  # Re-insert as newest
+                    _negative_validations[key] = (time.monotonic(), copy.deepcopy(result))
+                    if len(_negative_validations) > NEGATIVE_CACHE_SIZE:
+                        _negative_validations.popitem(last=False)
+        future.set_result(result)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight_validations[key]
+    
+    return result
+
+
+async def validate_company_name_async(company_name: str, fmp_api_key: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Awaitable validate_company_name for asyncio callers
+    
+    The lookup runs on a worker thread through the pooled per-source sessions,
+    so gathered calls overlap while sharing the same caches and single-flight.
+    """
+    return await asyncio.to_thread(validate_company_name, company_name, fmp_api_key)
+
+
+def validate_company_names_batch(company_names: List[str],
+                                 fmp_api_key: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Validate several company names or tickers at once
+    
+    FMP has no multi-query search, so the lookups fan out over a bounded
+    thread pool; queries that normalize to the same key share one lookup.
+    
+    Args:
+        company_names: Company names or ticker symbols to validate
+        fmp_api_key: Optional FMP API key for enhanced search
+    
+    Returns:
+        Dict mapping each input string to its validate_company_name result
+    """
+    unique = list(dict.fromkeys(company_names))
+    if len(unique) <= 1:
+        return {name: validate_company_name(name, fmp_api_key) for name in unique}
+    
+    with ThreadPoolExecutor(max_workers=min(len(unique), VALIDATION_BATCH_WORKERS)) as executor:
+        results = executor.map(lambda name: validate_company_name(name, fmp_api_key), unique)
+        return dict(zip(unique, results))
+
+
+def _classify_query(company_name: str) -> Tuple[str, bool]:
+    """
+    Normalize a validation query without any I/O
+    
+    Args:
+        company_name: Raw company name or ticker entered by the user
+        
+    Returns:
+        Tuple of (normalized query, whether it looks like a ticker)
+    """
+    query = company_name.strip()
+    
+    # Auto-capitalize if it looks like a ticker
+    if _TICKER_CHARS_RE.fullmatch(query):
+        query = query.upper()
+    
+    # Check if input looks like a ticker (short, uppercase, alphanumeric)
+    # Dots and dashes are allowed to handle ALKEM.NS, BAJAJ-AUTO, etc.
+    return query, _TICKER_RE.fullmatch(query) is not None
+
+
+def _query_variants(query: str, is_likely_ticker: bool) -> List[str]:
+    """Build the list of queries to try against the remote sources"""
+    query_variants = [query]
+    # Always try .NS suffix for short tickers (not just known ones, which are
+    # all short too) - helps discover new stocks
+    if is_likely_ticker and len(query) <= 12 and not query.endswith(_EXCHANGE_SUFFIXES):
+        query_variants.append(_INDIAN_TICKER_NS.get(query) or f"{query}.NS")
+    return query_variants
+
+
+def _validate_company_name(company_name: str, fmp_api_key: Optional[str] = None,
+                           errors: Optional[List[Exception]] = None) -> Dict[str, Any]:
+    """
+    Run the actual validation lookups (see validate_company_name)
+    
+    Failed lookups (exceptions, non-200 responses) are appended to errors when
+    it is given, so an invalid result can be told apart from a genuine miss.
+    """
+    if errors is None:
+        errors = []
     result = {
         'valid': False,
         'matches': [],
@@ -803,302 +1639,117 @@ def validate_company_name(company_name: str, fmp_api_key: Optional[str] = None)
         result['error'] = "Company name or ticker cannot be empty"
         return result
     
-    query = company_name.strip()
-    
     try:
-        # Auto-capitalize if it looks like a ticker
-        if query and len(query) <= 15 and query.replace('.', '').replace('-', '').isalnum():
-            query = query.upper()
+        query, is_likely_ticker = _classify_query(company_name)
         
-        # Check if input looks like a ticker (short, uppercase, alphanumeric)
-        # Remove dots and dashes for checking (to handle ALKEM.NS, BAJAJ-AUTO, etc.)
-        clean_query = query.replace('.', '').replace('-', '')
-        is_likely_ticker = (
-            len(query) <= 15 and  # Extended to handle longer tickers with suffixes
-            clean_query.isalnum() and
-            clean_query.isupper()  # Check uppercase on cleaned string
-        )
+        # PRIORITY: Check hardcoded mapping first - known tickers need no network lookup
+        has_suffix = query.endswith(_EXCHANGE_SUFFIXES)
+        base_query = _strip_exchange(query) if has_suffix else query
+        known_name = INDIAN_STOCK_NAMES.get(base_query) if (is_likely_ticker or has_suffix) else None
+        if known_name is not None:
+            ticker_symbol = query if has_suffix else _INDIAN_TICKER_NS[base_query]
+            result['matches'] = [{'name': known_name, 'ticker': ticker_symbol}]
+            result['valid'] = True
+            result['best_match'] = result['matches'][0]
+            return result
         
         # AUTO-ADD .NS suffix for likely Indian tickers without suffix
-        if is_likely_ticker and '.NS' not in query and '.BO' not in query and len(clean_query) <= 12:
+        if (is_likely_ticker and not has_suffix and
+                len(query) - query.count('.') - query.count('-') <= 12):
             # Short ticker without suffix - likely NSE stock
             query = f"{query}.NS"
+            has_suffix = True
         
-        # FIRST PRIORITY: Accept ANY ticker with .NS or .BO suffix immediately
+        # Accept ANY ticker with .NS or .BO suffix immediately
         # This allows validation of ANY NSE/BSE stock
-        if '.NS' in query or '.BO' in query:
-            # Will populate with company name later from hardcoded list or APIs
+        if has_suffix:
             result['matches'] = [{'name': query, 'ticker': query}]
             result['valid'] = True
             result['best_match'] = result['matches'][0]
-            # Continue to try to fetch actual company name, but don't fail if we can't
-        
-        # Hardcoded mapping for major Indian stocks (use FIRST to avoid API issues)
-        # Comprehensive list of NSE stocks - 150+ companies
-        INDIAN_STOCK_NAMES = {
-            # Nifty 50 - Large Caps
-            'RELIANCE': 'Reliance Industries Limited',
-            'TCS': 'Tata Consultancy Services Limited',
-            'HDFCBANK': 'HDFC Bank Limited',
-            'INFY': 'Infosys Limited',
-            'ICICIBANK': 'ICICI Bank Limited',
-            'HINDUNILVR': 'Hindustan Unilever Limited',
-            'SBIN': 'State Bank of India',
-            'BHARTIARTL': 'Bharti Airtel Limited',
-            'ITC': 'ITC Limited',
-            'KOTAKBANK': 'Kotak Mahindra Bank Limited',
-            'LT': 'Larsen & Toubro Limited',
-            'AXISBANK': 'Axis Bank Limited',
-            'WIPRO': 'Wipro Limited',
-            'ASIANPAINT': 'Asian Paints Limited',
-            'MARUTI': 'Maruti Suzuki India Limited',
-            'HCLTECH': 'HCL Technologies Limited',
-            'SUNPHARMA': 'Sun Pharmaceutical Industries Limited',
-            'TITAN': 'Titan Company Limited',
-            'ULTRACEMCO': 'UltraTech Cement Limited',
-            'BAJFINANCE': 'Bajaj Finance Limited',
-            'NESTLEIND': 'Nestle India Limited',
-            'TECHM': 'Tech Mahindra Limited',
-            'POWERGRID': 'Power Grid Corporation of India Limited',
-            'NTPC': 'NTPC Limited',
-            'TATAMOTORS': 'Tata Motors Limited',
-            'TATASTEEL': 'Tata Steel Limited',
-            'JSWSTEEL': 'JSW Steel Limited',
-            'ONGC': 'Oil and Natural Gas Corporation Limited',
-            'COALINDIA': 'Coal India Limited',
-            'ADANIENT': 'Adani Enterprises Limited',
-            'ADANIPORTS': 'Adani Ports and Special Economic Zone Limited',
-            'BAJAJFINSV': 'Bajaj Finserv Limited',
-            'DRREDDY': 'Dr. Reddy\'s Laboratories Limited',
-            'CIPLA': 'Cipla Limited',
-            'EICHERMOT': 'Eicher Motors Limited',
-            'GRASIM': 'Grasim Industries Limited',
-            'DIVISLAB': 'Divi\'s Laboratories Limited',
-            'BRITANNIA': 'Britannia Industries Limited',
-            'APOLLOHOSP': 'Apollo Hospitals Enterprise Limited',
-            'INDUSINDBK': 'IndusInd Bank Limited',
-            'M&M': 'Mahindra & Mahindra Limited',
-            'BPCL': 'Bharat Petroleum Corporation Limited',
-            'HEROMOTOCO': 'Hero MotoCorp Limited',
-            'HINDALCO': 'Hindalco Industries Limited',
-            'TATACONSUM': 'Tata Consumer Products Limited',
-            'BAJAJ-AUTO': 'Bajaj Auto Limited',
-            'UPL': 'UPL Limited',
-            
-            # Nifty Next 50 & Popular Mid/Small Caps
-            'VEDL': 'Vedanta Limited',
-            'GODREJCP': 'Godrej Consumer Products Limited',
-            'DABUR': 'Dabur India Limited',
-            'MARICO': 'Marico Limited',
-            'PIIND': 'PI Industries Limited',
-            'BANKBARODA': 'Bank of Baroda',
-            'PNB': 'Punjab National Bank',
-            'CANBK': 'Canara Bank',
-            'UNIONBANK': 'Union Bank of India',
-            'INDHOTEL': 'The Indian Hotels Company Limited',
-            'TRENT': 'Trent Limited',
-            'PIDILITIND': 'Pidilite Industries Limited',
-            'AMBUJACEM': 'Ambuja Cements Limited',
-            'ACC': 'ACC Limited',
-            'SHREECEM': 'Shree Cement Limited',
-            'GAIL': 'GAIL (India) Limited',
-            'IOC': 'Indian Oil Corporation Limited',
-            'HINDZINC': 'Hindustan Zinc Limited',
-            'HINDALCO': 'Hindalco Industries Limited',
-            'SAIL': 'Steel Authority of India Limited',
-            'NMDC': 'NMDC Limited',
-            'ADANIGREEN': 'Adani Green Energy Limited',
-            'ADANIPOWER': 'Adani Power Limited',
-            'ADANITRANS': 'Adani Transmission Limited',
-            'TATAPOWER': 'Tata Power Company Limited',
-            'TORNTPOWER': 'Torrent Power Limited',
-            'SIEMENS': 'Siemens Limited',
-            'ABB': 'ABB India Limited',
-            'HAVELLS': 'Havells India Limited',
-            'CROMPTON': 'Crompton Greaves Consumer Electricals Limited',
-            'VOLTAS': 'Voltas Limited',
-            'BLUESTARCO': 'Blue Star Limited',
-            'DIXON': 'Dixon Technologies (India) Limited',
-            'GODREJPROP': 'Godrej Properties Limited',
-            'DLF': 'DLF Limited',
-            'OBEROIRLTY': 'Oberoi Realty Limited',
-            'PRESTIGE': 'Prestige Estates Projects Limited',
-            'PHOENIXLTD': 'The Phoenix Mills Limited',
-            'INDIGOPNTS': 'Indigo Paints Limited',
-            'BERGEPAINT': 'Berger Paints India Limited',
-            'AKZOINDIA': 'Akzo Nobel India Limited',
-            'MCDOWELL-N': 'United Spirits Limited',
-            'RADICO': 'Radico Khaitan Limited',
-            'UNITDSPR': 'United Spirits Limited',
-            'VBL': 'Varun Beverages Limited',
-            'TATACOMM': 'Tata Communications Limited',
-            'TVSMOTOR': 'TVS Motor Company Limited',
-            'BAJAJHLDNG': 'Bajaj Holdings & Investment Limited',
-            'BOSCHLTD': 'Bosch Limited',
-            'MOTHERSON': 'Samvardhana Motherson International Limited',
-            'ESCORTS': 'Escorts Kubota Limited',
-            'ASHOKLEY': 'Ashok Leyland Limited',
-            'APOLLOTYRE': 'Apollo Tyres Limited',
-            'MRF': 'MRF Limited',
-            'CEAT': 'CEAT Limited',
-            'ZYDUSLIFE': 'Zydus Lifesciences Limited',
-            'TORNTPHARM': 'Torrent Pharmaceuticals Limited',
-            'AUROPHARMA': 'Aurobindo Pharma Limited',
-            'LUPIN': 'Lupin Limited',
-            'BIOCON': 'Biocon Limited',
-            'ALKEM': 'Alkem Laboratories Limited',
-            'LALPATHLAB': 'Dr. Lal PathLabs Limited',
-            'FORTIS': 'Fortis Healthcare Limited',
-            'MAXHEALTH': 'Max Healthcare Institute Limited',
-            'SYNGENE': 'Syngene International Limited',
-            'PVR': 'PVR INOX Limited',
-            'PVRINOX': 'PVR INOX Limited',
-            'ZOMATO': 'Zomato Limited',
-            'NYKAA': 'FSN E-Commerce Ventures Limited',
-            'POLICYBZR': 'PB Fintech Limited',
-            'PAYTM': 'One 97 Communications Limited',
-            'DMART': 'Avenue Supermarts Limited',
-            'TATAELXSI': 'Tata Elxsi Limited',
-            'COFORGE': 'Coforge Limited',
-            'LTTS': 'L&T Technology Services Limited',
-            'PERSISTENT': 'Persistent Systems Limited',
-            'MPHASIS': 'Mphasis Limited',
-            'LTIM': 'LTIMindtree Limited',
-            'OFSS': 'Oracle Financial Services Software Limited',
-            'INDUSTOWER': 'Indus Towers Limited',
-            'IRCTC': 'Indian Railway Catering and Tourism Corporation Limited',
-            'CONCOR': 'Container Corporation of India Limited',
-            'IRFC': 'Indian Railway Finance Corporation Limited',
-            'RECLTD': 'REC Limited',
-            'PFC': 'Power Finance Corporation Limited',
-            'LICHSGFIN': 'LIC Housing Finance Limited',
-            'HDFCLIFE': 'HDFC Life Insurance Company Limited',
-            'SBILIFE': 'SBI Life Insurance Company Limited',
-            'ICICIPRULI': 'ICICI Prudential Life Insurance Company Limited',
-            'ICICIGI': 'ICICI Lombard General Insurance Company Limited',
-            'BAJAJHFL': 'Bajaj Housing Finance Limited',
-            'SHRIRAMFIN': 'Shriram Finance Limited',
-            'CHOLAFIN': 'Cholamandalam Investment and Finance Company Limited',
-            'MUTHOOTFIN': 'Muthoot Finance Limited',
-            'MANAPPURAM': 'Manappuram Finance Limited',
-            'JINDALSTEL': 'Jindal Steel & Power Limited',
-            'CRISIL': 'CRISIL Limited',
-            'ICRA': 'ICRA Limited',
-            'PETRONET': 'Petronet LNG Limited',
-            'INDIAMART': 'IndiaMART InterMESH Limited',
-            'JUSTDIAL': 'Just Dial Limited',
-            'INFO EDGE': 'Info Edge (India) Limited',
-            'NAUKRI': 'Info Edge (India) Limited',
-            'PGHH': 'Procter & Gamble Hygiene and Health Care Limited',
-            'COLPAL': 'Colgate-Palmolive (India) Limited',
-            'GILLETTE': 'Gillette India Limited',
-            'HONAUT': 'Honeywell Automation India Limited',
-            'PFIZER': 'Pfizer Limited',
-            'GLAXO': 'GlaxoSmithKline Pharmaceuticals Limited',
-            'ABBOTINDIA': 'Abbott India Limited',
-            'SANOFI': 'Sanofi India Limited',
-            
-            # Additional popular stocks
-            'POLYCAB': 'Polycab India Limited',
-            'KANSAINER': 'Kansai Nerolac Paints Limited',
-            'RAYMOND': 'Raymond Limited',
-            'AIAENG': 'AIA Engineering Limited',
-            'WHIRLPOOL': 'Whirlpool of India Limited',
-            'SCHAEFFLER': 'Schaeffler India Limited',
-            'EXIDEIND': 'Exide Industries Limited',
-            'AMARARAJA': 'Amara Raja Energy & Mobility Limited',
-            'RELAXO': 'Relaxo Footwears Limited',
-            'BATAINDIA': 'Bata India Limited',
-            'PAGEIND': 'Page Industries Limited',
-            'VENKEYS': 'Venky\'s (India) Limited',
-            'JUBLFOOD': 'Jubilant FoodWorks Limited',
-            'WESTLIFE': 'Westlife Foodworld Limited',
-            'SAPPHIRE': 'Sapphire Foods India Limited',
-            'DEVYANI': 'Devyani International Limited',
-            'BSOFT': 'KPIT Technologies Limited',
-            'SONACOMS': 'Sona BLW Precision Forgings Limited',
-            'KPITTECH': 'KPIT Technologies Limited',
-        }
+            return result
         
-        # PRIORITY: Check hardcoded mapping to get actual company name
-        if is_likely_ticker or result['valid']:  # Check even if already valid from .NS/.BO
-            base_query = query.replace('.NS', '').replace('.BO', '')
-            if base_query in INDIAN_STOCK_NAMES:
-                company_name = INDIAN_STOCK_NAMES[base_query]
-                ticker_symbol = f"{base_query}.NS" if '.NS' not in query and '.BO' not in query else query
-                result['matches'] = [{'name': company_name, 'ticker': ticker_symbol}]
+        # Company names that prefix-match the hardcoded list need no network lookup
+        if not is_likely_ticker and len(query) >= 3:
+            name_matches = _match_indian_company_names(query)
+            if name_matches:
+                result['matches'] = name_matches
                 result['valid'] = True
-                result['best_match'] = result['matches'][0]
+                result['best_match'] = name_matches[0]
                 return result
         
-        # If already valid from .NS/.BO acceptance, return it
-        if result['valid']:
-            return result
+        query_variants = _query_variants(query, is_likely_ticker)
+        # Names equal to the query itself are echoes, not real matches
+        bare_query = _strip_exchange(query)
         
-        # For known Indian tickers, add .NS suffix for better API lookups
-        INDIAN_TICKERS = set(INDIAN_STOCK_NAMES.keys())
-        query_variants = [query]
-        if is_likely_ticker:
-            base_query = query.replace('.NS', '').replace('.BO', '')
-            # Always try .NS suffix for tickers (not just known ones) - helps discover new stocks
-            if '.NS' not in query and '.BO' not in query:
-                # If it's a known Indian ticker, add .NS
-                if base_query in INDIAN_TICKERS:
-                    query_variants.append(f"{base_query}.NS")
-                # For any short ticker (likely Indian), also try .NS as fallback
-                elif len(base_query) <= 12:  # Most NSE tickers are short
-                    query_variants.append(f"{base_query}.NS")
+        # Fetchers are shared across variants and across calls
+        fmp_fetcher = _get_fmp_fetcher(fmp_api_key) if fmp_api_key else None
+        yf_fetcher = _get_yahoo_fetcher() if _YFINANCE_INSTALLED else None
         
-        # Try FMP API first if available (most comprehensive)
-        if fmp_api_key:
-            for query_variant in query_variants:
-                try:
-                    fmp_fetcher = FMPFetcher(fmp_api_key)
-                    matches = fmp_fetcher.search_company(query_variant)
-                    if matches and any(m.get('name', '').upper() not in [query, query_variant, query.replace('.NS', '').replace('.BO', '')] for m in matches):
-                        result['matches'] = matches
-                        result['valid'] = True
-                        result['best_match'] = matches[0]
-                        return result
-                except Exception as e:
-                    pass  # Fall through to other sources
+        def search_probe(fetcher: BaseDataFetcher, query_variant: str) -> Optional[List[Dict[str, str]]]:
+            matches = fetcher.search_company_strict(query_variant)
+            # Check if we got a real company name, not just the ticker
+            reject = frozenset((query, query_variant, bare_query))
+            if matches and any(m.get('name', '').upper() not in reject for m in matches):
+                return matches
+            return None
         
-        # Try Yahoo Finance if available
-        if yf is not None:
-            for query_variant in query_variants:
-                try:
-                    yf_fetcher = YahooFinanceFetcher()
-                    matches = yf_fetcher.search_company(query_variant)
-                    # Check if we got a real company name, not just the ticker
-                    if matches and any(m.get('name', '').upper() not in [query, query_variant, query.replace('.NS', '').replace('.BO', '')] for m in matches):
-                        result['matches'] = matches
-                        result['valid'] = True
-                        result['best_match'] = matches[0]
-                        return result
-                except Exception as e:
-                    pass  # Continue if Yahoo Finance fails
+        def get_profiles(symbols: List[str]) -> Optional[List[Dict[str, Any]]]:
+            profile_url = f"{fmp_fetcher.BASE_URL}/profile/{','.join(symbols)}?apikey={fmp_api_key}"
+            if len(symbols) == 1:
+                # Same cache entry as FMPFetcher.fetch_data, so fetching a freshly
+                # validated ticker does not request its profile again
+                cache_key = FileCache.make_key('fmp', symbols[0], 'profile')
+                profiles = fmp_fetcher._get_cached_json(profile_url, cache_key, QUOTE_TTL, timeout=_PROBE_TIMEOUT)
+                return None if profiles is None else (profiles or [])
+            response = fmp_fetcher.session.get(profile_url, timeout=_PROBE_TIMEOUT)
+            return (_json(response) or []) if response.status_code == 200 else None
         
-        # If it looks like a ticker and we have FMP API, try direct ticker lookup
-        if is_likely_ticker and fmp_api_key:
+        def profile_probe() -> Optional[List[Dict[str, str]]]:
+            # Direct ticker validation via FMP; the profile endpoint takes a
+            # comma-separated symbol list, so every variant costs one round trip
+            profiles = get_profiles(query_variants)
+            if profiles is None and len(query_variants) > 1:
+                # Plans without multi-symbol support: one request per variant
+                per_variant = [get_profiles([v]) for v in query_variants]
+                if None in per_variant:
+                    raise IncompleteLookup(f"FMP profile lookup failed for {query}")
+                profiles = [p for variant_profiles in per_variant for p in variant_profiles]
+            elif profiles is None:
+                raise IncompleteLookup(f"FMP profile lookup failed for {query}")
+            if not profiles:
+                return None
+            
+            by_symbol = {p.get('symbol', '').upper(): p for p in profiles}
             for query_variant in query_variants:
-                try:
-                    # Direct ticker validation via FMP
-                    fmp_fetcher = FMPFetcher(fmp_api_key)
-                    profile_url = f"{fmp_fetcher.BASE_URL}/profile/{query_variant}?apikey={fmp_api_key}"
-                    response = requests.get(profile_url, timeout=5)
-                    if response.status_code == 200 and response.json():
-                        profile = response.json()[0]
-                        company_name = profile.get('companyName', '')
-                        if company_name and company_name.upper() not in [query, query_variant.replace('.NS', '').replace('.BO', '')]:
-                            result['matches'] = [{
-                                'name': company_name,
-                                'ticker': query_variant if '.' in query_variant else query.upper()
-                            }]
-                            result['valid'] = True
-                            result['best_match'] = result['matches'][0]
-                            return result
-                except Exception as e:
-                    pass
+                profile = by_symbol.get(query_variant.upper())
+                if profile is None and len(query_variants) == 1:
+                    profile = profiles[0]
+                company_name = (profile or {}).get('companyName', '')
+                if company_name and company_name.upper() not in (query, _strip_exchange(query_variant)):
+                    return [{
+                        'name': company_name,
+                        'ticker': query_variant if '.' in query_variant else query.upper()
+                    }]
+            return None
+        
+        # Probes in order of preference: FMP search (most comprehensive), Yahoo
+        # Finance search, then direct FMP ticker lookup for ticker-like input
+        probes = []
+        if fmp_fetcher:
+            probes += [partial(search_probe, fmp_fetcher, v) for v in query_variants]
+        if yf_fetcher:
+            probes += [partial(search_probe, yf_fetcher, v) for v in query_variants]
+        if is_likely_ticker and fmp_fetcher:
+            probes.append(profile_probe)
+        
+        # All probes run concurrently; the first hit in preference order wins, so the
+        # answer matches the old sequential fallback without waiting on each miss
+        matches = _first_valid(lambda probe: probe(), probes, bool, errors)
+        if matches:
+            result['matches'] = matches
+            result['valid'] = True
+            result['best_match'] = matches[0]
+            return result
         
         # If no matches found, provide helpful error message
         if not result['matches']:
@@ -1110,5 +1761,6 @@ def validate_company_name(company_name: str, fmp_api_key: Optional[str] = None)
         return result
         
     except Exception as e:
+        errors.append(e)
         result['error'] = f"Error during validation: {str(e)}"
         return result
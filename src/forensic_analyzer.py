@@ -5,66 +5,54 @@ Advanced institutional-grade forensic analysis using comprehensive prompts
 
 import os
 import json
-from typing import Dict, List, Optional
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from string import Template
 
 from openai import OpenAI
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 from .analyzer import QualityReport, QualityScore, RedFlag
+from .cache import FileCache, ANALYSIS_TTL
 
+_log = logging.getLogger(__name__)
 
-class ForensicQualityAnalyzer:
-    """
-    Advanced forensic analysis engine for institutional-grade management quality assessment
-    """
-    
-    def __init__(self, use_ai: bool = True):
-        """Initialize the forensic analyzer"""
-        self.use_ai = use_ai
-        if use_ai:
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key or api_key == "your-openai-api-key-here":
-                raise ValueError("OpenAI API key not configured")
-            self.client = OpenAI(api_key=api_key)
-    
-    def analyze_from_pdf_text(
-        self,
-        pdf_text: str,
-        company_name: str,
-        years_analyzed: int
-    ) -> QualityReport:
-        """
-        Perform comprehensive forensic analysis from PDF annual report text
-        
-        Args:
-            pdf_text: Extracted text from annual report PDF(s)
-            company_name: Name of the company
-            years_analyzed: Number of years covered in the analysis
-            
-        Returns:
-            QualityReport with detailed forensic analysis
-        """
-        
-        # Generate forensic analysis using comprehensive prompt
-        analysis_result = self._generate_forensic_analysis(pdf_text, company_name, years_analyzed)
-        
-        # Parse the analysis result and create QualityReport
-        report = self._parse_analysis_to_report(analysis_result, company_name, years_analyzed)
-        
-        return report
-    
-    def _generate_forensic_analysis(self, pdf_text: str, company_name: str, years: int) -> str:
-        """
-        Generate comprehensive forensic analysis using advanced institutional prompt
-        """
-        
-        # Truncate PDF text to fit in context window (keep most recent sections)
-        max_text_length = 50000  # Approx 50k chars for GPT-4
-        if len(pdf_text) > max_text_length:
-            pdf_text = pdf_text[:max_text_length] + "\n\n[Document truncated for processing...]"
-        
-        system_prompt = """You are operating in **Forensic Equity Research Mode** with 20+ years of experience in:
+# Annual report text budget per analysis. 12.5k tokens is roughly the
+# 50k characters of English text the analysis has always been given;
+# the character cap applies when no tokenizer is available.
+MAX_INPUT_TOKENS = 12_500
+MAX_INPUT_CHARS = 50_000
+_TRUNCATION_NOTE = "\n\n[Document truncated for processing...]"
+
+# (model, max output tokens) per analyzer tier. "fast" costs a fraction of
+# "quality" and responds sooner, for screening many companies at once.
+MODEL_TIERS = {
+    "quality": ("gpt-4o", 4000),
+    "fast": ("gpt-4o-mini", 2500),
+}
+
+# Completed analyses keyed by a hash of the model and full prompt, so
+# re-running the same report skips the API call entirely
+_response_cache = FileCache()
+
+# Static instructions, sent as the system message. Keeping them identical and
+# ahead of the per-company content lets OpenAI's automatic prompt caching reuse
+# this prefix across analyses instead of billing and processing it every time.
+_SYSTEM_PROMPT = """You are operating in **Forensic Equity Research Mode** with 20+ years of experience in:
 
 * Forensic accounting
 * Governance evaluation
@@ -74,9 +62,10 @@ class ForensicQualityAnalyzer:
 
 Your task is to evaluate **Management Quality** using only disclosures contained in the uploaded Annual Report(s).
 
-Your output must reflect the depth, rigor, and analytical precision expected from a **senior institutional research analyst**."""
+Your output must reflect the depth, rigor, and analytical precision expected from a **senior institutional research analyst**.
+
+---
 
-        user_prompt = f"""
 # STRICT RULES
 
 ✔ Use ONLY disclosed report data
@@ -90,16 +79,6 @@ If data is missing: **State:** "Not adequately disclosed."
 
 ---
 
-# INPUT DATA
-
-Company: {company_name}
-Years Analyzed: {years}
-
-Annual Report Content:
-{pdf_text}
-
----
-
 # ANALYSIS FRAMEWORK
 
 Analyze the following dimensions:
@@ -257,42 +236,42 @@ Evaluate sustainability of:
 
 Return your analysis in this exact JSON structure:
 
-{{
-  "strategic_alignment": {{
+{
+  "strategic_alignment": {
     "analysis": "Detailed evidence-based analysis of strategy clarity and execution consistency.",
     "score": 0-2,
     "key_findings": ["finding1", "finding2", ...]
-  }},
-  "capital_allocation": {{
+  },
+  "capital_allocation": {
     "analysis": "Evaluation of efficiency of capital deployment and cash flow stewardship.",
     "score": 0-2,
     "key_findings": ["finding1", "finding2", ...]
-  }},
-  "governance_transparency": {{
+  },
+  "governance_transparency": {
     "analysis": "Analysis of board effectiveness, auditor tone, compensation integrity, and disclosure quality.",
     "score": 0-2,
     "key_findings": ["finding1", "finding2", ...]
-  }},
-  "execution_vs_narrative": {{
+  },
+  "execution_vs_narrative": {
     "analysis": "Identify divergence between management commentary and financial outcomes.",
     "score": 0-2,
     "validation_table": [
-      {{"claim": "...", "supporting_metric": "...", "consistency": "Aligned/Divergent"}}
+      {"claim": "...", "supporting_metric": "...", "consistency": "Aligned/Divergent"}
     ]
-  }},
-  "red_flags": {{
+  },
+  "red_flags": {
     "critical": [
-      {{
+      {
         "category": "Governance/Financial Integrity/Reporting/Strategic",
         "description": "...",
         "impact": "...",
         "recommendation": "..."
-      }}
+      }
     ],
     "moderate": [...],
     "strengths": [...]
-  }},
-  "quantitative_scoring": {{
+  },
+  "quantitative_scoring": {
     "strategy_clarity": 0-2,
     "execution_consistency": 0-2,
     "capital_allocation_discipline": 0-2,
@@ -303,43 +282,200 @@ Return your analysis in this exact JSON structure:
     "minority_shareholder_fairness": 0-2,
     "total_score": 0-16,
     "normalized_score": 0-10
-  }},
-  "earnings_quality_metrics": {{
+  },
+  "earnings_quality_metrics": {
     "cfo_pat_ratio": "...",
     "working_capital_trend": "...",
     "one_time_dependency": "..."
-  }},
-  "multi_year_trends": {{
+  },
+  "multi_year_trends": {
     "revenue_growth_sustainability": "...",
     "margin_sustainability": "...",
     "roce_trend": "...",
     "leverage_trend": "..."
-  }},
-  "final_verdict": {{
+  },
+  "final_verdict": {
     "summary": "Concise institutional-style conclusion",
     "classification": "Exceptional/Strong/Average/Concerning/High Risk",
     "investment_perspective": "..."
-  }},
+  },
   "key_strengths": ["strength1", "strength2", "strength3"],
   "executive_summary": "200-250 word comprehensive summary"
-}}
+}
 
-Return ONLY valid JSON. No additional text or markdown formatting.
-"""
+Return ONLY valid JSON. No additional text or markdown formatting."""
+
+# Per-company user message; the static instructions live in _SYSTEM_PROMPT
+# so they form a cacheable prefix
+_USER_PROMPT = Template("""# INPUT DATA
 
+Company: $company_name
+Years Analyzed: $years
+
+Annual Report Content:
+$pdf_text""")
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """tiktoken encoding for model, or None if tiktoken or its data is unavailable"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:  # Unknown model, or the BPE file could not be downloaded
+        _log.warning("No tokenizer for %s; truncating report text by characters", model)
+        return None
+
+
+def _truncate_report_text(text: str, model: str) -> str:
+    """Cut text down to the input budget, counting tokens when possible"""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        if len(text) > MAX_INPUT_CHARS:
+            return text[:MAX_INPUT_CHARS] + _TRUNCATION_NOTE
+        return text
+    
+    # Tokens average ~4 characters, so a generous prefix always holds the
+    # whole budget and multi-MB reports are never tokenized in full
+    prefix = text[:MAX_INPUT_TOKENS * 16]
+    tokens = encoding.encode(prefix, disallowed_special=())
+    if len(tokens) > MAX_INPUT_TOKENS:
+        return encoding.decode(tokens[:MAX_INPUT_TOKENS]) + _TRUNCATION_NOTE
+    if len(prefix) < len(text):
+        return prefix + _TRUNCATION_NOTE
+    return text
+
+
+class ForensicQualityAnalyzer:
+    """
+    Advanced forensic analysis engine for institutional-grade management quality assessment
+    """
+    
+    def __init__(
+        self,
+        use_ai: bool = True,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        tier: str = "quality"
+    ):
+        """
+        Initialize the forensic analyzer
+        
+        Args:
+            use_ai: Whether to create the OpenAI client
+            model: OpenAI model; defaults to $FORENSIC_MODEL, then the tier's model
+            max_tokens: Output token limit; defaults to the tier's limit
+            tier: Preset from MODEL_TIERS - 'quality' (default) or 'fast'
+        """
+        if tier not in MODEL_TIERS:
+            raise ValueError(f"Unknown tier {tier!r}; expected one of {', '.join(MODEL_TIERS)}")
+        tier_model, tier_max_tokens = MODEL_TIERS[tier]
+        self.model = model or os.getenv("FORENSIC_MODEL") or tier_model
+        self.max_tokens = max_tokens or tier_max_tokens
+        self.use_ai = use_ai
+        if use_ai:
+            api_key = os.getenv("OPENAI_API_KEY")
+            if not api_key or api_key == "your-openai-api-key-here":
+                raise ValueError("OpenAI API key not configured")
+            self.client = OpenAI(api_key=api_key)
+    
+    def analyze_from_pdf_text(
+        self,
+        pdf_text: str,
+        company_name: str,
+        years_analyzed: int
+    ) -> QualityReport:
+        """
+        Perform comprehensive forensic analysis from PDF annual report text
+        
+        Args:
+            pdf_text: Extracted text from annual report PDF(s)
+            company_name: Name of the company
+            years_analyzed: Number of years covered in the analysis
+            
+        Returns:
+            QualityReport with detailed forensic analysis
+        """
+        
+        # Generate forensic analysis using comprehensive prompt
+        analysis_result = self._generate_forensic_analysis(pdf_text, company_name, years_analyzed)
+        
+        # Parse the analysis result and create QualityReport
+        report = self._parse_analysis_to_report(analysis_result, company_name, years_analyzed)
+        
+        return report
+    
+    def analyze_many(
+        self,
+        jobs: List[Tuple[str, str, int]],
+        max_concurrent: int = 8
+    ) -> List[QualityReport]:
+        """
+        Run forensic analyses for several companies concurrently
+        
+        Each analysis spends nearly all of its time waiting on the OpenAI API,
+        so a portfolio takes about as long as its slowest report instead of the
+        sum of all of them.
+        
+        Args:
+            jobs: (pdf_text, company_name, years_analyzed) for each company
+            max_concurrent: Maximum number of API requests in flight at once
+            
+        Returns:
+            QualityReports in the same order as jobs; the first failure is raised
+        """
+        if len(jobs) <= 1:
+            return [self.analyze_from_pdf_text(*job) for job in jobs]
+        
+        with ThreadPoolExecutor(max_workers=min(max_concurrent, len(jobs))) as executor:
+            return list(executor.map(lambda job: self.analyze_from_pdf_text(*job), jobs))
+    
+    def _generate_forensic_analysis(self, pdf_text: str, company_name: str, years: int) -> str:
+        """
+        Generate comprehensive forensic analysis using advanced institutional prompt
+        """
+        model = self.model
+        
+        # Truncate PDF text to fit the input budget (keeps the start of the report)
+        pdf_text = _truncate_report_text(pdf_text, model)
+        
+        user_prompt = _USER_PROMPT.substitute(company_name=company_name, years=years, pdf_text=pdf_text)
+        
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (model, str(self.max_tokens), _SYSTEM_PROMPT, user_prompt):
+            digest.update(part.encode())
+        cache_key = FileCache.make_key('forensic', company_name, digest.hexdigest(), years)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             response = self.client.chat.completions.create(
-                model="gpt-4o",
+                model=model,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": _SYSTEM_PROMPT},
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=0.3,  # Lower temperature for more consistent, analytical output
-                max_tokens=4000,
+                max_tokens=self.max_tokens,
                 response_format={"type": "json_object"}
             )
             
-            result = response.choices[0].message.content.strip()
+            usage = response.usage
+            details = getattr(usage, "prompt_tokens_details", None)
+            if usage is not None and details is not None:
+                _log.info(
+                    "Forensic analysis prompt: %s tokens, %s served from cache",
+                    usage.prompt_tokens, details.cached_tokens or 0
+                )
+            
+            choice = response.choices[0]
+            result = choice.message.content.strip()
+            # A reply cut off at max_tokens is truncated JSON; caching it would
+            # replay the same broken output instead of asking again
+            if choice.finish_reason == "stop":
+                _response_cache.set(cache_key, result, ANALYSIS_TTL)
             return result
             
         except Exception as e:
@@ -355,43 +491,55 @@ Return ONLY valid JSON. No additional text or markdown formatting.
         Parse the JSON analysis result into a QualityReport object
         """
         try:
-            data = json.loads(analysis_json)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            data = orjson.loads(analysis_json) if orjson is not None else json.loads(analysis_json)
         except json.JSONDecodeError as e:
             raise Exception(f"Failed to parse analysis JSON: {str(e)}")
         
-        # Extract overall score
+        # Sections used more than once below
         scoring = data.get("quantitative_scoring", {})
+        trends = data.get("multi_year_trends", {})
+        earnings = data.get("earnings_quality_metrics", {})
+        verdict = data.get("final_verdict", {})
+        red_flag_data = data.get("red_flags", {})
+        
+        # Extract overall score
         overall_score = scoring.get("normalized_score", 0.0)
         
+        def category_score(key: str) -> float:
+            return float(scoring.get(key, 0)) * 5  # Scale 0-2 to 0-10
+        
+        earnings_score = category_score("earnings_quality")
+        
         # Create category scores
         category_scores = [
             QualityScore(
                 category="Profitability & Margins",
-                score=float(scoring.get("earnings_quality", 0)) * 5,  # Scale 0-2 to 0-10
+                score=earnings_score,
                 weight=0.20,
                 strengths=[],
                 concerns=[],
-                explanation=data.get("earnings_quality_metrics", {}).get("cfo_pat_ratio", "")
+                explanation=earnings.get("cfo_pat_ratio", "")
             ),
             QualityScore(
                 category="Growth & Revenue Stability",
-                score=float(scoring.get("strategy_clarity", 0)) * 5,
+                score=category_score("strategy_clarity"),
                 weight=0.15,
                 strengths=[],
                 concerns=[],
-                explanation=data.get("multi_year_trends", {}).get("revenue_growth_sustainability", "")
+                explanation=trends.get("revenue_growth_sustainability", "")
             ),
             QualityScore(
                 category="Financial Health & Leverage",
-                score=float(scoring.get("balance_sheet_integrity", 0)) * 5,
+                score=category_score("balance_sheet_integrity"),
                 weight=0.20,
                 strengths=[],
                 concerns=[],
-                explanation=data.get("multi_year_trends", {}).get("leverage_trend", "")
+                explanation=trends.get("leverage_trend", "")
             ),
             QualityScore(
                 category="Cash Flow Management",
-                score=float(scoring.get("capital_allocation_discipline", 0)) * 5,
+                score=category_score("capital_allocation_discipline"),
                 weight=0.15,
                 strengths=[],
                 concerns=[],
@@ -399,23 +547,23 @@ Return ONLY valid JSON. No additional text or markdown formatting.
             ),
             QualityScore(
                 category="Capital Efficiency & Returns",
-                score=float(scoring.get("execution_consistency", 0)) * 5,
+                score=category_score("execution_consistency"),
                 weight=0.15,
                 strengths=[],
                 concerns=[],
-                explanation=data.get("multi_year_trends", {}).get("roce_trend", "")
+                explanation=trends.get("roce_trend", "")
             ),
             QualityScore(
                 category="Quality of Earnings",
-                score=float(scoring.get("earnings_quality", 0)) * 5,
+                score=earnings_score,
                 weight=0.10,
                 strengths=[],
                 concerns=[],
-                explanation=data.get("earnings_quality_metrics", {}).get("working_capital_trend", "")
+                explanation=earnings.get("working_capital_trend", "")
             ),
             QualityScore(
                 category="Management & Governance Indicators",
-                score=float(scoring.get("governance_quality", 0)) * 5,
+                score=category_score("governance_quality"),
                 weight=0.05,
                 strengths=[],
                 concerns=[],
@@ -425,11 +573,11 @@ Return ONLY valid JSON. No additional text or markdown formatting.
         
         # Parse red flags
         red_flags = []
-        red_flag_data = data.get("red_flags", {})
+        add_flag = red_flags.append
         
         # Critical red flags
         for flag in red_flag_data.get("critical", []):
-            red_flags.append(RedFlag(
+            add_flag(RedFlag(
                 severity="High",
                 category=flag.get("category", "General"),
                 description=flag.get("description", ""),
@@ -440,7 +588,7 @@ Return ONLY valid JSON. No additional text or markdown formatting.
         # Moderate red flags
         for flag in red_flag_data.get("moderate", []):
             if isinstance(flag, dict):
-                red_flags.append(RedFlag(
+                add_flag(RedFlag(
                     severity="Medium",
                     category=flag.get("category", "General"),
                     description=flag.get("description", ""),
@@ -448,7 +596,7 @@ Return ONLY valid JSON. No additional text or markdown formatting.
                     recommendation=flag.get("recommendation", "")
                 ))
             else:
-                red_flags.append(RedFlag(
+                add_flag(RedFlag(
                     severity="Medium",
                     category="General",
                     description=str(flag),
@@ -472,12 +620,12 @@ Return ONLY valid JSON. No additional text or markdown formatting.
             key_strengths=key_strengths,
             red_flags=red_flags,
             executive_summary=data.get("executive_summary", ""),
-            investment_thesis=data.get("final_verdict", {}).get("investment_perspective", ""),
-            risk_assessment=data.get("final_verdict", {}).get("summary", ""),
+            investment_thesis=verdict.get("investment_perspective", ""),
+            risk_assessment=verdict.get("summary", ""),
             metrics_summary={
-                "forensic_analysis": data.get("final_verdict", {}),
-                "earnings_quality": data.get("earnings_quality_metrics", {}),
-                "multi_year_trends": data.get("multi_year_trends", {}),
+                "forensic_analysis": verdict,
+                "earnings_quality": earnings,
+                "multi_year_trends": trends,
                 "execution_validation": data.get("execution_vs_narrative", {})
             }
         )
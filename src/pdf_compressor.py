@@ -4,13 +4,50 @@ Automatically compresses PDFs to reduce file size for upload
 """
 
 import os
+import stat
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from types import MappingProxyType
+from typing import BinaryIO, Optional, Tuple
 import PyPDF2
+from PyPDF2.generic import ArrayObject, DecodedStreamObject, NameObject, StreamObject
 from io import BytesIO
 from PIL import Image
 import tempfile
 
+try:
+    import pikepdf
+except ImportError:
+    pikepdf = None
+
+# Compression presets, from least to most aggressive (read-only)
+_QUALITY_SETTINGS = MappingProxyType({
+    'high': MappingProxyType({'image_quality': 70, 'max_image_px': 2400, 'remove_duplication': False}),
+    'medium': MappingProxyType({'image_quality': 50, 'max_image_px': 1600, 'remove_duplication': True}),
+    'low': MappingProxyType({'image_quality': 30, 'max_image_px': 1200, 'remove_duplication': True}),
+})
+
+# Image stream entries rewritten when an image is re-encoded
+_IMAGE_KEYS = ('/Filter', '/DecodeParms', '/Width', '/Height', '/ColorSpace', '/BitsPerComponent', '/SMaskInData')
+
+
+def _page_content(page: PyPDF2.PageObject) -> Optional[bytes]:
+    """Decoded /Contents of a page, joining split content streams"""
+    content = page.get_contents()
+    if content is None:
+        return None
+    if isinstance(content, ArrayObject):
+        return b"\n".join(part.get_object().get_data() for part in content)
+    return content.get_data()
+
+
+def _flate_stream(data: bytes) -> StreamObject:
+    """FlateDecode-compressed stream holding data"""
+    stream = DecodedStreamObject()
+    stream.set_data(data)
+    return stream.flate_encode()
+
 
 class PDFCompressor:
     """
@@ -29,6 +66,19 @@ class PDFCompressor:
     
     def get_file_size_mb(self, file_obj) -> float:
         """Get file size in MB"""
+        # In-memory buffers (including Streamlit uploads) know their length
+        if hasattr(file_obj, 'getbuffer'):
+            with file_obj.getbuffer() as view:
+                return view.nbytes / (1024 * 1024)
+        
+        # Real files: ask the OS instead of seeking
+        try:
+            st = os.fstat(file_obj.fileno())
+            if stat.S_ISREG(st.st_mode):
+                return st.st_size / (1024 * 1024)
+        except (AttributeError, OSError, ValueError):
+            pass
+        
         if hasattr(file_obj, 'seek') and hasattr(file_obj, 'tell'):
             current_pos = file_obj.tell()
             file_obj.seek(0, 2)  # Seek to end
@@ -37,6 +87,20 @@ class PDFCompressor:
             return size / (1024 * 1024)
         return 0.0
     
+    def _as_readable(self, input_file) -> Tuple[BinaryIO, float]:
+        """
+        Normalize a path or file-like input to a binary stream at offset 0
+        
+        Returns:
+            Tuple of (stream, size_mb); the caller closes the stream if it opened a path
+        """
+        if isinstance(input_file, str):
+            stream = open(input_file, 'rb')
+        else:
+            stream = input_file
+            stream.seek(0)
+        return stream, self.get_file_size_mb(stream)
+    
     def compress_pdf(self, input_file, output_file=None, quality: str = 'medium') -> Tuple[str, float, float]:
         """
         Compress PDF file
@@ -50,26 +114,11 @@ class PDFCompressor:
             Tuple of (output_path, original_size_mb, compressed_size_mb)
         """
         # Determine quality settings
-        quality_settings = {
-            'low': {'image_quality': 30, 'remove_duplication': True},
-            'medium': {'image_quality': 50, 'remove_duplication': True},
-            'high': {'image_quality': 70, 'remove_duplication': False}
-        }
+        settings = _QUALITY_SETTINGS.get(quality, _QUALITY_SETTINGS['medium'])
         
-        settings = quality_settings.get(quality, quality_settings['medium'])
-        
-        # Handle file input
-        if isinstance(input_file, str):
-            with open(input_file, 'rb') as f:
-                input_data = f.read()
-            original_size = len(input_data) / (1024 * 1024)
-            input_stream = BytesIO(input_data)
-        else:
-            # It's a file-like object
-            input_file.seek(0)
-            input_data = input_file.read()
-            original_size = len(input_data) / (1024 * 1024)
-            input_stream = BytesIO(input_data)
+        # Both PDF libraries read objects lazily from a seekable stream,
+        # so the PDF is read in place rather than copied into memory
+        input_stream, original_size = self._as_readable(input_file)
         
         # Create output file if not specified
         if output_file is None:
@@ -77,23 +126,11 @@ class PDFCompressor:
             os.close(temp_fd)
         
         try:
-            # Read PDF
-            reader = PyPDF2.PdfReader(input_stream)
-            writer = PyPDF2.PdfWriter()
-            
-            # Copy pages with compression
-            for page_num in range(len(reader.pages)):
-                page = reader.pages[page_num]
-                
-                # Compress content streams
-                if settings['remove_duplication']:
-                    page.compress_content_streams()
-                
-                writer.add_page(page)
-            
-            # Write compressed PDF
-            with open(output_file, 'wb') as output_stream:
-                writer.write(output_stream)
+            # qpdf (via pikepdf) when installed, otherwise PyPDF2
+            if pikepdf is not None:
+                self._write_with_pikepdf(input_stream, output_file, settings)
+            else:
+                self._write_with_pypdf2(PyPDF2.PdfReader(input_stream), output_file, settings)
             
             # Check compressed size
             compressed_size = os.path.getsize(output_file) / (1024 * 1024)
@@ -102,66 +139,235 @@ class PDFCompressor:
             
         except Exception as e:
             # If compression fails, save original
+            input_stream.seek(0)
             with open(output_file, 'wb') as f:
-                f.write(input_data)
+                shutil.copyfileobj(input_stream, f)
             return output_file, original_size, original_size
+        finally:
+            if input_stream is not input_file:
+                input_stream.close()
+    
+    def _write_with_pikepdf(self, input_stream, output_file: str, settings: dict):
+        """Rewrite the PDF with qpdf: recompressed images and streams, packed object streams"""
+        with pikepdf.open(input_stream) as pdf:
+            self._apply_image_quality(self._load_images(pdf), settings)
+            self._save_pikepdf(pdf, output_file, settings)
+    
+    @staticmethod
+    def _save_pikepdf(pdf, output, settings: dict):
+        """Save with recompressed streams and object streams to a path or stream"""
+        pdf.save(
+            output,
+            compress_streams=True,
+            stream_decode_level=pikepdf.StreamDecodeLevel.generalized,
+            object_stream_mode=pikepdf.ObjectStreamMode.generate,
+            recompress_flate=settings['remove_duplication']
+        )
+    
+    @staticmethod
+    def _load_images(pdf) -> list:
+        """
+        Find the images worth re-encoding as JPEG
+        
+        Masks, color-keyed images and images with /Decode arrays are skipped.
+        Only the original encoded bytes are kept (not decoded pixels), so memory
+        stays proportional to the file size across repeated attempts.
+        
+        Returns:
+            List of (image stream, original raw bytes, original dictionary entries)
+        """
+        images = []
+        seen = set()
+        for page in pdf.pages:
+            # get_images() also finds images nested in form XObjects (pikepdf 10+)
+            page_images = page.get_images() if hasattr(page, 'get_images') else page.images
+            for raw in page_images.values():
+                if raw.objgen in seen:
+                    continue  # Shared between pages
+                seen.add(raw.objgen)
+                if raw.get('/ImageMask', False) or '/Mask' in raw or '/Decode' in raw:
+                    continue
+                original = {key: raw[key] for key in _IMAGE_KEYS if key in raw}
+                images.append((raw, raw.read_raw_bytes(), original))
+        return images
     
-    def smart_compress(self, input_file, max_attempts: int = 3) -> Tuple[str, float, float, str]:
+    @staticmethod
+    def _apply_image_quality(images: list, settings: dict):
+        """
+        Downsample and re-encode images as JPEG at the quality setting
+        
+        Scanned reports are mostly image bytes, so this is where most of the
+        size reduction comes from. Each image is rebuilt from its original
+        bytes, so this can be applied repeatedly with different settings; an
+        image keeps its original encoding when the JPEG would not be smaller.
+        """
+        max_px = settings['max_image_px']
+        for raw, original_bytes, original in images:
+            # Restore the original encoding before decoding it again
+            raw.write(original_bytes, filter=original.get('/Filter'), decode_parms=original.get('/DecodeParms'))
+            for key in _IMAGE_KEYS:
+                if key in original:
+                    raw[key] = original[key]
+                elif key in raw:
+                    del raw[key]
+            
+            try:
+                image = pikepdf.PdfImage(raw).as_pil_image()
+                image = image.convert('L' if image.mode in ('1', 'L', 'LA') else 'RGB')
+                image.thumbnail((max_px, max_px))
+                buffer = BytesIO()
+                image.save(buffer, 'JPEG', quality=settings['image_quality'], optimize=True, progressive=True)
+            except Exception:
+                continue  # Unsupported encoding or color space
+            
+            data = buffer.getvalue()
+            if len(data) >= len(original_bytes):
+                continue
+            raw.write(data, filter=pikepdf.Name.DCTDecode)
+            raw.Width, raw.Height = image.size
+            raw.ColorSpace = pikepdf.Name.DeviceGray if image.mode == 'L' else pikepdf.Name.DeviceRGB
+            raw.BitsPerComponent = 8
+            if '/SMaskInData' in raw:
+                del raw['/SMaskInData']
+    
+    def _search_image_quality(self, input_stream, max_attempts: int) -> Optional[Tuple[bytes, str]]:
+        """
+        Binary-search the highest JPEG quality that fits the target size
+        
+        The PDF is parsed once; each attempt re-encodes the images and saves to
+        memory. Output size falls as quality falls, so a handful of attempts
+        over 10-90 lands close to the target.
+        
+        Returns:
+            (compressed PDF bytes, quality label), or None if pikepdf cannot process the file
+        """
+        input_stream.seek(0)
+        settings = dict(_QUALITY_SETTINGS['medium'])
+        best = smallest = None
+        try:
+            with pikepdf.open(input_stream) as pdf:
+                images = self._load_images(pdf)
+                low, high = 10, 90
+                # Without images every quality gives the same output
+                for _ in range(max_attempts if images else 1):
+                    quality = (low + high) // 2
+                    settings['image_quality'] = quality
+                    self._apply_image_quality(images, settings)
+                    buffer = BytesIO()
+                    self._save_pikepdf(pdf, buffer, settings)
+                    
+                    label = f"jpeg q{quality}" if images else 'lossless'
+                    if buffer.tell() <= self.target_size_bytes:
+                        best = (buffer.getvalue(), label)
+                        low = quality + 1
+                    else:
+                        smallest = (buffer.getvalue(), label)
+                        high = quality - 1
+                    if low > high:
+                        break
+        except Exception:
+            return None
+        
+        # Best fit if any attempt fit, otherwise the lowest quality tried
+        return best or smallest
+    
+    def _write_with_pypdf2(self, reader: PyPDF2.PdfReader, output_file: str, settings: dict):
+        """Rewrite a parsed PDF with PyPDF2, deflating page content streams"""
+        writer = PyPDF2.PdfWriter()
+        
+        pages = list(reader.pages)
+        
+        # Compress content streams. The decoded bytes are deflated directly
+        # (PageObject.compress_content_streams would parse and re-serialize
+        # every operator first), and zlib releases the GIL, so pages are
+        # compressed in parallel
+        if settings['remove_duplication']:
+            contents = [_page_content(page) for page in pages]
+            with ThreadPoolExecutor() as executor:
+                streams = executor.map(
+                    lambda data: None if data is None else _flate_stream(data), contents
+                )
+                for page, stream in zip(pages, streams):
+                    if stream is not None:
+                        page[NameObject('/Contents')] = stream
+        
+        # Copy pages
+        for page in pages:
+            writer.add_page(page)
+        
+        # Write compressed PDF
+        with open(output_file, 'wb') as output_stream:
+            writer.write(output_stream)
+    
+    def smart_compress(self, input_file, max_attempts: int = 5) -> Tuple[str, float, float, str]:
         """
         Intelligently compress PDF to target size
         
+        With pikepdf installed the JPEG quality is binary-searched (e.g.
+        'jpeg q55'); otherwise the 'high', 'medium' and 'low' presets are tried.
+        
         Args:
             input_file: Input PDF file object or path
-            max_attempts: Maximum compression attempts with different quality levels
+            max_attempts: Maximum number of JPEG qualities tried when searching
             
         Returns:
             Tuple of (output_path, original_size_mb, compressed_size_mb, quality_used)
         """
-        # Get original size
-        if isinstance(input_file, str):
-            original_size = os.path.getsize(input_file) / (1024 * 1024)
-        else:
-            input_file.seek(0)
-            data = input_file.read()
-            original_size = len(data) / (1024 * 1024)
-            input_file.seek(0)
+        input_stream, original_size = self._as_readable(input_file)
+        try:
+            return self._smart_compress_stream(input_file, input_stream, original_size, max_attempts)
+        finally:
+            if input_stream is not input_file:
+                input_stream.close()
+    
+    def _smart_compress_stream(self, input_file, input_stream, original_size: float,
+                               max_attempts: int) -> Tuple[str, float, float, str]:
+        """smart_compress on an already opened input; input_file is kept for kernel-side copies"""
+        # Every attempt overwrites this one temp file, so none are left behind
+        temp_fd, output_path = tempfile.mkstemp(suffix='.pdf')
+        os.close(temp_fd)
         
         # If already under target, return as-is
         if original_size <= self.target_size_mb:
-            # Save to temp file
-            temp_fd, temp_path = tempfile.mkstemp(suffix='.pdf')
-            os.close(temp_fd)
-            
+            # Save to temp file without holding the whole PDF in memory
             if isinstance(input_file, str):
-                with open(input_file, 'rb') as f_in:
-                    with open(temp_path, 'wb') as f_out:
-                        f_out.write(f_in.read())
+                shutil.copyfile(input_file, output_path)  # Kernel-side copy where supported
             else:
-                input_file.seek(0)
-                with open(temp_path, 'wb') as f_out:
-                    f_out.write(input_file.read())
-                input_file.seek(0)
+                with open(output_path, 'wb') as f_out:
+                    shutil.copyfileobj(input_stream, f_out, 1024 * 1024)
+                input_stream.seek(0)
             
-            return temp_path, original_size, original_size, 'none'
+            return output_path, original_size, original_size, 'none'
         
-        # Try different compression levels
-        quality_levels = ['high', 'medium', 'low']
+        if pikepdf is not None:
+            result = self._search_image_quality(input_stream, max_attempts)
+            if result is not None:
+                data, quality = result
+                with open(output_path, 'wb') as f_out:
+                    f_out.write(data)
+                return output_path, original_size, len(data) / (1024 * 1024), quality
         
-        for quality in quality_levels:
-            output_path, orig_size, comp_size = self.compress_pdf(
-                input_file, 
-                quality=quality
-            )
-            
-            if comp_size <= self.target_size_mb:
-                return output_path, orig_size, comp_size, quality
-            
-            # Reset file pointer for next attempt
-            if hasattr(input_file, 'seek'):
-                input_file.seek(0)
+        # Try different compression levels with PyPDF2. The PDF is parsed once,
+        # and since PyPDF2 cannot touch images, presets that differ only in
+        # image settings produce the same file and are written only once
+        try:
+            input_stream.seek(0)
+            reader = PyPDF2.PdfReader(input_stream)
+            written = None
+            for quality, settings in _QUALITY_SETTINGS.items():
+                if settings['remove_duplication'] != written:
+                    self._write_with_pypdf2(reader, output_path, settings)
+                    comp_size = os.path.getsize(output_path) / (1024 * 1024)
+                    written = settings['remove_duplication']
+                
+                if comp_size <= self.target_size_mb:
+                    return output_path, original_size, comp_size, quality
+        except Exception:
+            # Unreadable PDF: hand back the original, as compress_pdf does
+            output_path, original_size, comp_size = self.compress_pdf(input_stream, output_file=output_path)
         
         # Return best attempt (lowest quality)
-        return output_path, orig_size, comp_size, 'low'
+        return output_path, original_size, comp_size, 'low'
 
 
 def compress_pdf_for_upload(uploaded_file, target_mb: float = 20.0) -> Tuple[str, dict]:
@@ -177,12 +383,7 @@ def compress_pdf_for_upload(uploaded_file, target_mb: float = 20.0) -> Tuple[str
     """
     compressor = PDFCompressor(target_size_mb=target_mb)
     
-    # Check original size
-    uploaded_file.seek(0, 2)
-    original_size_mb = uploaded_file.tell() / (1024 * 1024)
-    uploaded_file.seek(0)
-    
-    # Compress
+    # Compress (smart_compress measures the original size itself)
     output_path, orig_size, comp_size, quality = compressor.smart_compress(uploaded_file)
     
     compression_info = {
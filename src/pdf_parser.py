@@ -5,14 +5,230 @@ Extracts financial data from PDF annual reports using AI
 
 import os
 import re
+import hashlib
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import compress, repeat
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import json
 
-import pdfplumber
+import numpy as np
 from openai import OpenAI
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .data_fetcher import FinancialData
+from .cache import FileCache, ANALYSIS_TTL, PDF_TEXT_TTL
+
+_log = logging.getLogger(__name__)
+
+# Extracted report text keyed by a hash of the PDF, so re-running the same
+# report skips pdfplumber entirely
+_text_cache = FileCache()
+
+# FinancialData extracted from a report, keyed by its hash, the model and
+# PROMPT_VERSION; a hit skips both pdfplumber and the LLM call
+_result_cache = FileCache()
+
+# Pages each worker process should get before a process pool beats extracting
+# in-process (a worker must re-open and re-parse the PDF)
+MIN_PAGES_PER_WORKER = 8
+
+# Characters of each annual report's text sent to the LLM
+REPORT_TEXT_CHARS = 15_000
+
+# Statement titles, matched near the start of a line so passing mentions in
+# prose don't count, and how much text around each one the LLM is given
+_STATEMENT_HEADING_RE = re.compile(
+    r'^[^\n]{0,40}?\b(balance sheet|statement of profit and loss|profit and loss statement|'
+    r'income statement|cash flow statement|statement of cash flows)\b',
+    re.IGNORECASE | re.MULTILINE
+)
+SECTION_CHARS_BEFORE = 500
+SECTION_CHARS_AFTER = 3_500
+
+# Lines worth sending to the LLM: any figure (small line items matter too),
+# units of measure (needed to convert to millions) and statement titles
+_NUMERIC_LINE_RE = re.compile(
+    r'\d|₹|\b(?:crores?|lakhs?|millions?|billions?|rs|inr|usd)\b'
+    r'|balance sheet|profit and loss|income statement|cash flow',
+    re.IGNORECASE
+)
+
+# Four-digit year in a report's file name, e.g. "annual_report_2024.pdf"
+_YEAR_RE = re.compile(r'(?<!\d)(?:19|20)\d{2}(?!\d)')
+
+# Structured extraction works well on the smaller model at a fraction of the
+# cost and latency; set PDF_EXTRACTION_MODEL=gpt-4o for the larger one
+EXTRACTION_MODEL = os.getenv("PDF_EXTRACTION_MODEL") or "gpt-4o-mini"
+
+# Bump when the extraction prompt or response parsing changes, so results
+# cached by an older version are not reused
+PROMPT_VERSION = 1
+
+# Static instructions and schema, sent as the system message. Keeping them
+# identical and ahead of the report text lets OpenAI's automatic prompt caching
+# reuse this prefix across extractions.
+_SYSTEM_PROMPT = """You are a precise financial data extraction assistant. Extract data accurately from financial statements and return valid JSON only.
+
+You are a financial analyst extracting data from an annual report.
+Extract the requested financial metrics in JSON format:
+{
+  "company_name": "full company name",
+  "years": ["2024", "2023", "2022", ...],  // Most recent fiscal years found, as many as requested
+  "revenue": {"2024": value, "2023": value, ...},  // Annual revenue/sales in millions
+  "net_income": {"2024": value, ...},  // Net profit in millions
+  "operating_income": {"2024": value, ...},  // Operating profit/EBIT in millions
+  "total_assets": {"2024": value, ...},  // Total assets in millions
+  "total_liabilities": {"2024": value, ...},  // Total liabilities in millions
+  "shareholders_equity": {"2024": value, ...},  // Shareholders' equity in millions
+  "total_debt": {"2024": value, ...},  // Total debt/borrowings in millions
+  "cash_and_equivalents": {"2024": value, ...},  // Cash and cash equivalents in millions
+  "operating_cash_flow": {"2024": value, ...},  // Cash from operations in millions
+  "free_cash_flow": {"2024": value, ...},  // Free cash flow in millions
+  "capex": {"2024": value, ...},  // Capital expenditure in millions
+  "sector": "industry sector",
+  "industry": "specific industry",
+  "market_cap": market_cap_value,  // in millions
+  "pe_ratio": float,
+  "dividend_yield": float  // as percentage
+}
+
+IMPORTANT:
+- Convert all amounts to millions (e.g., if reported in crores, divide by 10)
+- Use positive numbers for all values
+- If CAPEX is negative in cash flow statement, report as positive
+- If a metric is not found, use 0
+- Extract from: Balance Sheet, Income Statement, Cash Flow Statement
+- Look for consolidated financials if available
+
+Return ONLY valid JSON, no additional text."""
+
+# Headings of the statements financial metrics are extracted from
+FINANCIAL_RE = re.compile(
+    r'\b(balance sheet|income statement|profit and loss|statement of profit|cash flows?|consolidated financial)\b',
+    re.IGNORECASE
+)
+
+
+def _extract_page_range(pdf, start: int, end: int, financial_tables_only: bool = False) -> List[str]:
+    """Text and table chunks for pages [start, end) of an open pdfplumber PDF"""
+    text_content = []
+    for i, page in enumerate(pdf.pages[start:end], start):
+        # Extract text
+        page_text = page.extract_text()
+        if page_text:
+            text_content.append(f"--- Page {i+1} ---\n{page_text}\n")
+        
+        # Extract tables. pdfplumber finds tables from ruling lines, and a cell
+        # needs two horizontal and two vertical edges, so pages with fewer
+        # (scans, charts, prose) are skipped without running the table finder
+        tables = None
+        if len(page.edges) >= 4 and (not financial_tables_only or FINANCIAL_RE.search(page_text or '')):
+            tables = page.extract_tables()
+        if tables:
+            for table_idx, table in enumerate(tables):
+                text_content.append(f"\n[Table {table_idx+1} on Page {i+1}]\n")
+                # One chunk per table, one line per row
+                text_content.append("\n".join(
+                    " | ".join(str(cell) if cell else "" for cell in row) for row in table if row
+                ))
+        
+        # Drop the page's parsed chars, lines and rects; otherwise every page
+        # processed so far stays in memory until the PDF is closed
+        page.close()
+    return text_content
+
+
+def numeric_lines(pdf_text: str) -> str:
+    """Keep only the lines of report text that carry figures, units or statement titles"""
+    return "\n".join(line for line in pdf_text.splitlines() if _NUMERIC_LINE_RE.search(line))
+
+
+def select_financial_sections(pdf_text: str, max_chars: int = REPORT_TEXT_CHARS) -> str:
+    """
+    Cut report text down to max_chars, keeping the financial statements
+    
+    Keeps a window of text around each statement heading (a balance sheet,
+    P&L or cash flow title near the start of a line), in document order, until
+    max_chars is used. Text without such headings keeps its first max_chars.
+    """
+    if len(pdf_text) <= max_chars:
+        return pdf_text
+    
+    # Merge overlapping windows around each heading
+    windows = []
+    for match in _STATEMENT_HEADING_RE.finditer(pdf_text):
+        start = max(match.start() - SECTION_CHARS_BEFORE, 0)
+        end = match.start() + SECTION_CHARS_AFTER
+        if windows and start <= windows[-1][1]:
+            windows[-1][1] = max(windows[-1][1], end)
+        else:
+            windows.append([start, end])
+    if not windows:
+        return pdf_text[:max_chars]
+    
+    sections = []
+    remaining = max_chars
+    for start, end in windows:
+        section = pdf_text[start:min(end, start + remaining)]
+        sections.append(section)
+        remaining -= len(section)
+        if remaining <= 0:
+            break
+    return "\n...\n".join(sections)
+
+
+def _file_digest(path: str) -> str:
+    """blake2b hex digest of a file's contents, read in 1 MB blocks"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _extract_pages(pdf_path: str, start: int, end: int, financial_tables_only: bool) -> List[str]:
+    """Worker process entry point: open the PDF and extract pages [start, end)"""
+    import pdfplumber
+    
+    with pdfplumber.open(pdf_path) as pdf:
+        return _extract_page_range(pdf, start, end, financial_tables_only)
+
+
+# Page workers shared by every extraction in the process, so reports extracted
+# concurrently (or from several server threads) never exceed cpu_count workers
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_lock = threading.Lock()
+
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    """Get the shared page-extraction pool, creating it on first use"""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            # Never fork: callers run threads (Streamlit, _extract_all_texts), and a
+            # child forked from a threaded process can deadlock on a copied lock
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _page_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                             mp_context=multiprocessing.get_context(method))
+        return _page_pool
+
+
+def _discard_page_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next extraction starts a fresh one"""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is pool:
+            _page_pool = None
+    pool.shutdown(wait=False)
 
 
 class PDFReportParser:
@@ -27,96 +243,99 @@ class PDFReportParser:
             raise ValueError("OpenAI API key is required for PDF parsing. Set OPENAI_API_KEY environment variable.")
         self.client = OpenAI(api_key=self.openai_api_key)
     
-    def extract_text_from_pdf(self, pdf_path: str, max_pages: int = 50) -> str:
-        """Extract text content from PDF"""
-        text_content = []
+    def extract_text_from_pdf(
+        self,
+        pdf_path: str,
+        max_pages: int = 50,
+        financial_tables_only: bool = False
+    ) -> str:
+        """
+        Extract text content from PDF
         
+        Args:
+            pdf_path: Path to the PDF file
+            max_pages: Number of leading pages to process
+            financial_tables_only: Only extract tables from pages whose text names a
+                financial statement (balance sheet, P&L, cash flow); all page text is kept
+        """
         try:
+            cache_key = FileCache.make_key(
+                'pdf_text', _file_digest(pdf_path), f"{max_pages}|{financial_tables_only}"
+            )
+            cached = _text_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            # pdfplumber (and pdfminer under it) is only imported once a PDF
+            # actually needs extracting, keeping it off the package import path
+            import pdfplumber
+            
             with pdfplumber.open(pdf_path) as pdf:
                 # Focus on first 50 pages where financial statements usually are
                 pages_to_process = min(len(pdf.pages), max_pages)
                 
-                for i, page in enumerate(pdf.pages[:pages_to_process]):
-                    # Extract text
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content.append(f"--- Page {i+1} ---\n{page_text}\n")
-                    
-                    # Extract tables
-                    tables = page.extract_tables()
-                    if tables:
-                        for table_idx, table in enumerate(tables):
-                            text_content.append(f"\n[Table {table_idx+1} on Page {i+1}]\n")
-                            for row in table:
-                                if row:
-                                    text_content.append(" | ".join([str(cell) if cell else "" for cell in row]))
-                                    text_content.append("\n")
+                # Pages are independent and extraction is CPU-bound pure Python,
+                # so large reports are split into contiguous page ranges across processes
+                workers = min(os.cpu_count() or 1, pages_to_process // MIN_PAGES_PER_WORKER)
+                if workers <= 1:
+                    text_content = _extract_page_range(pdf, 0, pages_to_process, financial_tables_only)
+            
+            if workers > 1:
+                segment = -(-pages_to_process // workers)
+                starts = range(0, pages_to_process, segment)
+                ends = [min(start + segment, pages_to_process) for start in starts]
+                pool = _get_page_pool()
+                try:
+                    segments = pool.map(
+                        _extract_pages, repeat(pdf_path), starts, ends, repeat(financial_tables_only)
+                    )
+                    text_content = [chunk for segment_chunks in segments for chunk in segment_chunks]
+                except BrokenProcessPool:
+                    _discard_page_pool(pool)
+                    raise
         
         except Exception as e:
             raise Exception(f"Error reading PDF: {e}")
         
-        return "\n".join(text_content)
+        pdf_text = "\n".join(text_content)
+        _text_cache.set(cache_key, pdf_text, PDF_TEXT_TTL)
+        return pdf_text
     
     def parse_financial_data_with_ai(
         self, 
         pdf_text: str, 
         company_name: str,
-        years_to_analyze: int
+        years_to_analyze: int,
+        max_chars: Optional[int] = REPORT_TEXT_CHARS
     ) -> FinancialData:
-        """Use AI to extract financial data from unstructured PDF text"""
+        """
+        Use AI to extract financial data from unstructured PDF text
         
-        # Create a structured prompt for the AI
-        prompt = f"""
-You are a financial analyst extracting data from an annual report. 
-Extract the following financial metrics for the most recent {years_to_analyze} years.
+        Args:
+            pdf_text: Report text; several reports may be concatenated
+            company_name: Name of the company
+            years_to_analyze: Number of most recent fiscal years to extract
+            max_chars: Characters of pdf_text sent to the model (None sends all of it)
+        """
+        
+        # Only the per-company request goes in the user message; the schema and
+        # rules live in _SYSTEM_PROMPT so they form a cacheable prefix
+        prompt = f"""Extract the financial metrics for the most recent {years_to_analyze} years.
 
 Company: {company_name}
 
-Extract these metrics in JSON format:
-{{
-  "company_name": "full company name",
-  "years": ["2024", "2023", "2022", ...],  // Most recent {years_to_analyze} fiscal years found
-  "revenue": {{"2024": value, "2023": value, ...}},  // Annual revenue/sales in millions
-  "net_income": {{"2024": value, ...}},  // Net profit in millions
-  "operating_income": {{"2024": value, ...}},  // Operating profit/EBIT in millions
-  "total_assets": {{"2024": value, ...}},  // Total assets in millions
-  "total_liabilities": {{"2024": value, ...}},  // Total liabilities in millions
-  "shareholders_equity": {{"2024": value, ...}},  // Shareholders' equity in millions
-  "total_debt": {{"2024": value, ...}},  // Total debt/borrowings in millions
-  "cash_and_equivalents": {{"2024": value, ...}},  // Cash and cash equivalents in millions
-  "operating_cash_flow": {{"2024": value, ...}},  // Cash from operations in millions
-  "free_cash_flow": {{"2024": value, ...}},  // Free cash flow in millions
-  "capex": {{"2024": value, ...}},  // Capital expenditure in millions
-  "sector": "industry sector",
-  "industry": "specific industry",
-  "market_cap": market_cap_value,  // in millions
-  "pe_ratio": float,
-  "dividend_yield": float  // as percentage
-}}
-
-IMPORTANT:
-- Convert all amounts to millions (e.g., if reported in crores, divide by 10)
-- Use positive numbers for all values
-- If CAPEX is negative in cash flow statement, report as positive
-- If a metric is not found, use 0
-- Extract from: Balance Sheet, Income Statement, Cash Flow Statement
-- Look for consolidated financials if available
-
 Annual Report Text (truncated to relevant sections):
 
-{pdf_text[:15000]}  
-
-Return ONLY valid JSON, no additional text.
-"""
+{pdf_text[:max_chars]}"""
         
         try:
             # Call OpenAI API
             response = self.client.chat.completions.create(
-                model="gpt-4o",
+                model=EXTRACTION_MODEL,
                 messages=[
                     {
                         "role": "system", 
-                        "content": "You are a precise financial data extraction assistant. Extract data accurately from financial statements and return valid JSON only."
+                        "content": _SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -124,20 +343,22 @@ Return ONLY valid JSON, no additional text.
                     }
                 ],
                 temperature=0.1,
-                max_tokens=2000
+                max_tokens=2000,
+                response_format={"type": "json_object"}
             )
             
-            # Parse response
-            json_text = response.choices[0].message.content.strip()
+            usage = response.usage
+            details = getattr(usage, "prompt_tokens_details", None)
+            if usage is not None and details is not None:
+                _log.info(
+                    "PDF extraction prompt: %s tokens, %s served from cache",
+                    usage.prompt_tokens, details.cached_tokens or 0
+                )
             
-            # Clean up response (remove markdown code blocks if present)
-            if json_text.startswith("```"):
-                json_text = json_text.split("```")[1]
-                if json_text.startswith("json"):
-                    json_text = json_text[4:]
-            json_text = json_text.strip()
+            # Parse response (JSON mode returns a bare JSON object, no code fences)
+            json_text = response.choices[0].message.content.strip()
             
-            data_dict = json.loads(json_text)
+            data_dict = orjson.loads(json_text) if orjson is not None else json.loads(json_text)
             
             # Get AI-extracted company name, but prioritize user input if provided
             extracted_name = data_dict.get("company_name", "")
@@ -187,6 +408,13 @@ Return ONLY valid JSON, no additional text.
     
     def _convert_to_float_dict(self, data: Dict) -> Dict[str, float]:
         """Convert dictionary values to float"""
+        # The model is asked for numbers, so converting everything in one go nearly always works
+        try:
+            return {str(key): float(value) for key, value in data.items()}
+        except (ValueError, TypeError):
+            pass
+        
+        # Non-numeric values (null, "N/A") become 0.0
         result = {}
         for key, value in data.items():
             try:
@@ -195,59 +423,102 @@ Return ONLY valid JSON, no additional text.
                 result[str(key)] = 0.0
         return result
     
+    # (ratio field, numerator, denominator, scale)
+    RATIOS = (
+        ('roe', 'net_income', 'shareholders_equity', 100),  # Return on Equity
+        ('roa', 'net_income', 'total_assets', 100),  # Return on Assets
+        ('debt_to_equity', 'total_debt', 'shareholders_equity', 1),
+        ('operating_margin', 'operating_income', 'revenue', 100),
+        ('net_margin', 'net_income', 'revenue', 100),
+    )
+    
+    # (growth field, metric), growth versus the previous year
+    GROWTH = (
+        ('revenue_growth', 'revenue'),
+        ('profit_growth', 'net_income'),
+    )
+    
     def _calculate_ratios(self, fin_data: FinancialData):
         """Calculate financial ratios from extracted data"""
-        for year in fin_data.revenue.keys():
-            # ROE = Net Income / Shareholders Equity
-            if year in fin_data.net_income and year in fin_data.shareholders_equity:
-                if fin_data.shareholders_equity[year] != 0:
-                    fin_data.roe[year] = (fin_data.net_income[year] / fin_data.shareholders_equity[year]) * 100
-            
-            # ROA = Net Income / Total Assets
-            if year in fin_data.net_income and year in fin_data.total_assets:
-                if fin_data.total_assets[year] != 0:
-                    fin_data.roa[year] = (fin_data.net_income[year] / fin_data.total_assets[year]) * 100
-            
-            # ROCE = Operating Income / Capital Employed
-            if year in fin_data.operating_income and year in fin_data.shareholders_equity and year in fin_data.total_debt:
-                capital_employed = fin_data.shareholders_equity[year] + fin_data.total_debt[year]
-                if capital_employed != 0:
-                    fin_data.roce[year] = (fin_data.operating_income[year] / capital_employed) * 100
-            
-            # Debt to Equity
-            if year in fin_data.total_debt and year in fin_data.shareholders_equity:
-                if fin_data.shareholders_equity[year] != 0:
-                    fin_data.debt_to_equity[year] = fin_data.total_debt[year] / fin_data.shareholders_equity[year]
-            
-            # Operating Margin
-            if year in fin_data.operating_income and year in fin_data.revenue:
-                if fin_data.revenue[year] != 0:
-                    fin_data.operating_margin[year] = (fin_data.operating_income[year] / fin_data.revenue[year]) * 100
-            
-            # Net Margin
-            if year in fin_data.net_income and year in fin_data.revenue:
-                if fin_data.revenue[year] != 0:
-                    fin_data.net_margin[year] = (fin_data.net_income[year] / fin_data.revenue[year]) * 100
+        years = list(fin_data.revenue)
+        if not years:
+            return
+        
+        # One aligned array per input metric, plus which years each metric actually has
+        metrics = {'operating_income', 'total_debt'}
+        metrics.update(name for _, num, den, _ in self.RATIOS for name in (num, den))
+        _, arrays = fin_data.as_arrays(*metrics, years=years)
+        present = {
+            name: np.array([year in getattr(fin_data, name) for year in years], dtype=bool)
+            for name in metrics
+        }
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for attr, num, den, scale in self.RATIOS:
+                # A ratio is only set for years with both inputs and a non-zero denominator
+                valid = present[num] & present[den] & (arrays[den] != 0)
+                values = arrays[num] / arrays[den] * scale
+                getattr(fin_data, attr).update(zip(compress(years, valid), values[valid].tolist()))
             
-            # Revenue Growth
-            years_list = sorted(fin_data.revenue.keys(), reverse=True)
-            for i in range(len(years_list) - 1):
-                current_year = years_list[i]
-                previous_year = years_list[i + 1]
-                if fin_data.revenue[previous_year] != 0:
-                    growth = ((fin_data.revenue[current_year] - fin_data.revenue[previous_year]) / 
-                             fin_data.revenue[previous_year]) * 100
-                    fin_data.revenue_growth[current_year] = growth
+            # ROCE = Operating Income / Capital Employed (equity + debt)
+            capital_employed = arrays['shareholders_equity'] + arrays['total_debt']
+            valid = (present['operating_income'] & present['shareholders_equity']
+                     & present['total_debt'] & (capital_employed != 0))
+            values = arrays['operating_income'] / capital_employed * 100
+            fin_data.roce.update(zip(compress(years, valid), values[valid].tolist()))
             
-            # Profit Growth
-            years_list = sorted(fin_data.net_income.keys(), reverse=True)
-            for i in range(len(years_list) - 1):
-                current_year = years_list[i]
-                previous_year = years_list[i + 1]
-                if fin_data.net_income[previous_year] != 0:
-                    growth = ((fin_data.net_income[current_year] - fin_data.net_income[previous_year]) / 
-                             fin_data.net_income[previous_year]) * 100
-                    fin_data.profit_growth[current_year] = growth
+            for attr, metric in self.GROWTH:
+                # Each year against the one before it, newest first
+                growth_years, series = fin_data.as_arrays(
+                    metric, years=sorted(getattr(fin_data, metric), reverse=True)
+                )
+                current, previous = series[metric][:-1], series[metric][1:]
+                valid = previous != 0
+                values = (current - previous) / previous * 100
+                getattr(fin_data, attr).update(zip(compress(growth_years, valid), values[valid].tolist()))
+    
+    def _extract_all_texts(self, pdf_paths: List[str]) -> Dict[str, str]:
+        """
+        Extract the text of several reports concurrently
+        
+        Hashing, cache reads and large reports' page workers overlap across
+        reports. Reports that cannot be read are skipped with a warning.
+        
+        Returns:
+            {pdf_path: text} for the readable reports, in pdf_paths order
+        """
+        def extract(pdf_path: str) -> Optional[str]:
+            try:
+                pdf_text = self.extract_text_from_pdf(pdf_path, financial_tables_only=True)
+                if not pdf_text or len(pdf_text) < 100:
+                    raise Exception("Could not extract sufficient text from PDF")
+                return pdf_text
+            except Exception as e:
+                print(f"Warning: Could not parse {pdf_path}: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(len(pdf_paths), 8) or 1) as executor:
+            texts = executor.map(extract, pdf_paths)
+            return {pdf_path: text for pdf_path, text in zip(pdf_paths, texts) if text}
+    
+    def _llm_extract_combined(
+        self,
+        report_texts: Dict[str, str],
+        company_name: str,
+        years_to_analyze: int
+    ) -> FinancialData:
+        """Extract every year from several reports' statement sections in one LLM request"""
+        sections = []
+        for pdf_path, pdf_text in report_texts.items():
+            # Label each excerpt with its fiscal year when the file name has one
+            name = os.path.basename(pdf_path)
+            year = _YEAR_RE.search(name)
+            label = f"REPORT FOR FY {year.group()}" if year else f"REPORT: {name}"
+            sections.append(f"--- {label} ---\n{select_financial_sections(numeric_lines(pdf_text))}")
+        
+        return self.parse_financial_data_with_ai(
+            "\n\n".join(sections), company_name, years_to_analyze, max_chars=None
+        )
     
     def parse_annual_report(
         self, 
@@ -266,15 +537,30 @@ Return ONLY valid JSON, no additional text.
         Returns:
             FinancialData object with extracted metrics
         """
+        try:
+            digest = _file_digest(pdf_path)
+        except OSError as e:
+            raise Exception(f"Error reading PDF: {e}")
+        cache_key = FileCache.make_key(
+            'pdf_financials', company_name or '', f"{digest}|{EXTRACTION_MODEL}|{PROMPT_VERSION}", years_to_analyze
+        )
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            return FinancialData(**cached)
+        
         # Extract text from PDF
-        pdf_text = self.extract_text_from_pdf(pdf_path)
+        # Metrics come from the financial statements, so tables elsewhere are skipped
+        pdf_text = self.extract_text_from_pdf(pdf_path, financial_tables_only=True)
         
         if not pdf_text or len(pdf_text) < 100:
             raise Exception("Could not extract sufficient text from PDF")
         
-        # Use AI to parse financial data
-        fin_data = self.parse_financial_data_with_ai(pdf_text, company_name, years_to_analyze)
+        # Use AI to parse financial data from the figures in the statement sections
+        fin_data = self.parse_financial_data_with_ai(
+            select_financial_sections(numeric_lines(pdf_text)), company_name, years_to_analyze
+        )
         
+        _result_cache.set(cache_key, fin_data.to_dict(), ANALYSIS_TTL)
         return fin_data
 
 
@@ -296,45 +582,22 @@ def parse_multiple_reports(
     """
     parser = PDFReportParser(openai_api_key)
     
-    combined_data = FinancialData(
+    # Extract every report's text, then all years in a single LLM request
+    # instead of one round-trip per report
+    report_texts = parser._extract_all_texts(pdf_paths)
+    if report_texts:
+        try:
+            combined_data = parser._llm_extract_combined(report_texts, company_name, len(pdf_paths))
+            combined_data.data_source = "PDF Annual Reports (Multiple)"
+            return combined_data
+        except Exception as e:
+            print(f"Warning: Could not extract financial data from the reports: {e}")
+    
+    # Nothing could be extracted
+    return FinancialData(
         company_name=company_name,
         ticker=company_name.upper().replace(" ", "_"),
         years_analyzed=len(pdf_paths),
         data_source="PDF Annual Reports (Multiple)",
         fetch_timestamp=datetime.now().isoformat()
     )
-    
-    # Parse each PDF
-    for pdf_path in pdf_paths:
-        try:
-            data = parser.parse_annual_report(pdf_path, company_name, 1)
-            
-            # Merge data
-            combined_data.revenue.update(data.revenue)
-            combined_data.net_income.update(data.net_income)
-            combined_data.operating_income.update(data.operating_income)
-            combined_data.total_assets.update(data.total_assets)
-            combined_data.total_liabilities.update(data.total_liabilities)
-            combined_data.shareholders_equity.update(data.shareholders_equity)
-            combined_data.total_debt.update(data.total_debt)
-            combined_data.cash_and_equivalents.update(data.cash_and_equivalents)
-            combined_data.operating_cash_flow.update(data.operating_cash_flow)
-            combined_data.free_cash_flow.update(data.free_cash_flow)
-            combined_data.capex.update(data.capex)
-            
-            # Update company info from first report
-            if not combined_data.sector:
-                combined_data.sector = data.sector
-                combined_data.industry = data.industry
-                combined_data.market_cap = data.market_cap
-                combined_data.pe_ratio = data.pe_ratio
-                combined_data.dividend_yield = data.dividend_yield
-                
-        except Exception as e:
-            print(f"Warning: Could not parse {pdf_path}: {e}")
-            continue
-    
-    # Calculate ratios on combined data
-    parser._calculate_ratios(combined_data)
-    
-    return combined_data
@@ -13,72 +13,392 @@ from reportlab.platypus import (
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
 from reportlab.pdfgen import canvas
-from datetime import datetime
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend for server environments
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+from reportlab.graphics.shapes import Drawing, Rect, Polygon, String
 import numpy as np
 from io import BytesIO
+from bisect import bisect_right
+from collections import Counter
+from functools import lru_cache
 import os
+import math
+import time
+import hashlib
+import tempfile
 from typing import List, Dict
 from .analyzer import QualityReport, RedFlag, QualityScore
 
 
+# Bump when chart drawing changes so PNGs cached on disk are not reused
+CHART_CACHE_VERSION = 3
+# Scores are drawn at the precision of their labels, so near-equal reports share cached charts
+CHART_SCORE_DECIMALS = 1
+CHART_DPI = 100  # Charts are embedded at 3-6.5 inches, so higher resolution adds bytes, not detail
+CHART_CACHE_DIR = os.path.join(".cache", "charts")  # Set to None to keep chart PNGs in memory only
+CHART_CACHE_TTL = 30 * 24 * 3600  # Chart PNGs older than this are re-rendered and pruned
+CHART_CACHE_MAX_FILES = 2000  # Oldest chart PNGs beyond this many are pruned after each write
+
+
+# Bar colour for scores below 4.0, then at or above each threshold; also the gauge segments
+_BAR_THRESHOLDS = np.array([4.0, 5.5, 6.5, 7.5])
+_BAR_COLORS = np.array(['#ef4444', '#f59e0b', '#8b5cf6', '#3b82f6', '#10b981'])
+_SCORE_BAR_PALETTE = ('#e74c3c', '#e67e22', '#f39c12', '#27ae60', '#2ecc71')
+_SCORE_BAR_POSITIONS = (0, 2.5, 5, 7.5, 10)
+_PIE_PALETTE = ('#ef4444', '#f59e0b', '#eab308', '#84cc16', '#22c55e', '#14b8a6', '#06b6d4')
+# Red-flag categories beyond this are drawn as one 'Other' slice; one slice per
+# palette colour, so 'Other' never repeats the red of the adjacent largest slice
+PIE_MAX_SLICES = len(_PIE_PALETTE)
+
+
+def _png_bytes(fig) -> bytes:
+    """Encode a finished figure as PNG and release it"""
+    buf = BytesIO()
+    # One layout pass and one draw; bbox_inches='tight' would draw the figure twice
+    fig.set_dpi(CHART_DPI)
+    fig.set_facecolor('white')
+    fig.tight_layout()
+    fig.canvas.print_png(buf, metadata={'Software': None})
+    return buf.getvalue()
+
+
+def _new_figure(figsize: tuple, projection: str = None):
+    """Create a standalone figure with one axes on an Agg canvas"""
+    # Imported on first use so text-only reports never load matplotlib; figures are
+    # drawn on their own Agg canvas, never through pyplot's global figure manager
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot(111, projection=projection)
+
+
+def _render_radar_chart(categories: tuple, scores: tuple) -> bytes:
+    """Draw the category radar chart"""
+    # Number of variables
+    num_vars = len(categories)
+    
+    # Compute angle for each axis
+    angles = np.linspace(0, 2 * math.pi, num_vars, endpoint=False)
+    scores = np.concatenate([scores, scores[:1]])  # Complete the circle
+    angles = np.concatenate([angles, angles[:1]])
+    
+    # Create figure
+    fig, ax = _new_figure((8, 8), projection='polar')
+    
+    # Draw the chart
+    ax.plot(angles, scores, 'o-', linewidth=2, color='#667eea', label='Quality Scores')
+    ax.fill(angles, scores, alpha=0.25, color='#667eea')
+    
+    # Set category labels
+    ax.set_xticks(angles[:-1])
+    ax.set_xticklabels(categories, size=10, weight='bold')
+    
+    # Set y-axis
+    ax.set_ylim(0, 10)
+    ax.set_yticks([2, 4, 6, 8, 10])
+    ax.set_yticklabels(['2', '4', '6', '8', '10'], size=9)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    
+    # Add title
+    ax.set_title('Category Performance Radar', size=14, weight='bold', pad=20)
+    
+    return _png_bytes(fig)
+
+
+def _render_bar_chart(categories: tuple, scores: tuple) -> bytes:
+    """Draw the category comparison bar chart"""
+    # Determine colors based on scores
+    colors_list = _BAR_COLORS[np.searchsorted(_BAR_THRESHOLDS, scores, side='right')].tolist()
+    
+    # Create figure
+    fig, ax = _new_figure((10, 6))
+    
+    # Create bars
+    y_pos = range(len(categories))
+    bars = ax.barh(y_pos, scores, color=colors_list, edgecolor='white', linewidth=2)
+    
+    # Add score labels
+    for i, (bar, score) in enumerate(zip(bars, scores)):
+        ax.text(score + 0.2, i, f'{score:.1f}', va='center', fontsize=11, weight='bold')
+    
+    # Customize axes
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(categories, fontsize=10)
+    ax.set_xlabel('Score', fontsize=11, weight='bold')
+    ax.set_xlim(0, 10.5)
+    ax.set_title('Category Scores Comparison', fontsize=14, weight='bold', pad=15)
+    ax.grid(axis='x', alpha=0.3, linestyle='--')
+    ax.set_axisbelow(True)
+    
+    return _png_bytes(fig)
+
+
+def _render_gauge_chart(score: float) -> bytes:
+    """Draw the semicircular overall-score gauge"""
+    fig, ax = _new_figure((8, 5), projection='polar')
+    
+    # Define gauge segments
+    theta = math.pi * np.array([0, 0.4, 0.55, 0.65, 0.75, 1.0])
+    
+    colors_list = _BAR_COLORS
+    
+    # Draw gauge segments
+    for color, start, end in zip(colors_list, theta[:-1], theta[1:]):
+        ax.barh(1, end - start, left=start, height=0.3,
+               color=color, alpha=0.8, edgecolor='white', linewidth=2)
+    
+    # Calculate needle angle
+    needle_angle = (score / 10.0) * math.pi
+    
+    # Draw needle
+    ax.plot([needle_angle, needle_angle], [0, 1.3], color='black', linewidth=3)
+    ax.plot(needle_angle, 1.3, 'o', color='black', markersize=10)
+    
+    # Add score text in center
+    ax.text(math.pi / 2, 0.5, f'{score:.1f}', ha='center', va='center',
+           fontsize=32, weight='bold', color='#1e293b')
+    ax.text(math.pi / 2, 0.2, 'Overall Score', ha='center', va='center',
+           fontsize=12, color='#64748b')
+    
+    # Customize
+    ax.set_ylim(0, 1.5)
+    ax.set_xlim(0, math.pi)
+    ax.set_xticks([])
+    ax.set_yticks([])
+    ax.spines['polar'].set_visible(False)
+    ax.grid(False)
+    
+    return _png_bytes(fig)
+
+
+def _render_red_flags_pie(category_counts: tuple) -> bytes:
+    """Draw the red-flag donut from (category, count) pairs"""
+    import matplotlib.patches as mpatches
+    
+    labels = [cat for cat, _ in category_counts]
+    sizes = [count for _, count in category_counts]
+    
+    # Create figure
+    fig, ax = _new_figure((8, 8))
+    
+    colors_list = _PIE_PALETTE
+    
+    # Create pie chart
+    wedges, texts, autotexts = ax.pie(
+        sizes,
+        labels=labels,
+        autopct='%1.1f%%',
+        colors=colors_list[:len(sizes)],
+        startangle=90,
+        wedgeprops=dict(edgecolor='white', linewidth=2),
+        textprops=dict(fontsize=10, weight='bold')
+    )
+    
+    # Add white circle in center for donut effect
+    centre_circle = mpatches.Circle((0, 0), 0.70, fc='white', linewidth=2, edgecolor='white')
+    ax.add_artist(centre_circle)
+    
+    # Add total count in center
+    total = sum(sizes)
+    ax.text(0, 0, f'{total}\nRed Flags', ha='center', va='center',
+           fontsize=20, weight='bold', color='#1e293b')
+    
+    ax.set_title('Red Flags Distribution by Category', fontsize=14, weight='bold', pad=20)
+    
+    return _png_bytes(fig)
+
+
+_CHART_RENDERERS = {
+    'radar': _render_radar_chart,
+    'bar': _render_bar_chart,
+    'gauge': _render_gauge_chart,
+    'pie': _render_red_flags_pie,
+}
+
+
+@lru_cache(maxsize=256)
+def _render_png(kind: str, key: tuple) -> bytes:
+    """
+    Render a chart to PNG bytes, reusing earlier renders of identical inputs
+    
+    Args:
+        kind: Name of the chart in _CHART_RENDERERS
+        key: Hashable chart inputs, passed positionally to the renderer
+        
+    Returns:
+        PNG image bytes
+    """
+    path = None
+    if CHART_CACHE_DIR:
+        digest = hashlib.sha1(repr((CHART_CACHE_VERSION, kind, key)).encode()).hexdigest()
+        path = os.path.join(CHART_CACHE_DIR, f"{digest}.png")
+        try:
+            if time.time() - os.path.getmtime(path) < CHART_CACHE_TTL:
+                with open(path, 'rb') as f:
+                    return f.read()
+        except OSError:
+            pass
+    
+    png = _CHART_RENDERERS[kind](*key)
+    
+    if path:
+        try:
+            os.makedirs(CHART_CACHE_DIR, exist_ok=True)
+            # Write to a temp file and rename so readers never see a partial PNG
+            fd, tmp_path = tempfile.mkstemp(dir=CHART_CACHE_DIR, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(png)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            _prune_chart_cache()
+        except OSError:
+            pass
+    return png
+
+
+def _prune_chart_cache():
+    """Delete expired chart PNGs, then the oldest ones beyond CHART_CACHE_MAX_FILES"""
+    now = time.time()
+    entries = []
+    with os.scandir(CHART_CACHE_DIR) as it:
+        for entry in it:
+            if not entry.name.endswith('.png'):
+                continue
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                pass
+    entries.sort(reverse=True)
+    for i, (mtime, path) in enumerate(entries):
+        if i >= CHART_CACHE_MAX_FILES or now - mtime >= CHART_CACHE_TTL:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+def _category_key(report: QualityReport) -> tuple:
+    """(categories, scores) chart key for a report's category scores"""
+    return (tuple(cs.category for cs in report.category_scores),
+            tuple(round(cs.score, CHART_SCORE_DECIMALS) for cs in report.category_scores))
+
+
 class InstitutionalReportGenerator:
     """
     Generates institutional-grade PDF reports for quality management analysis
     Professional formatting with comprehensive sections
     """
     
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
+    # Score bands: a score at or above the i-th threshold gets entry i + 1
+    _RATING_THRESHOLDS = (4.0, 5.0, 6.0, 7.0, 8.0)
+    _RATING_LABELS = ("BELOW AVERAGE", "MODERATE", "ABOVE AVERAGE", "STRONG",
+                      "EXCELLENT", "EXCEPTIONAL")
+    _ASSESS_LABELS = ("Weak", "Below Avg", "Average", "Above Avg", "Strong", "Excellent")
+    _SCORE_COLOR_THRESHOLDS = (4.0, 5.0, 6.0, 7.5)
+    _PERSPECTIVE_THRESHOLDS = (4.5, 5.5, 6.5, 7.5)
+    _PERSPECTIVES = (
+        ("CAUTIOUS", "Quality concerns warrant careful evaluation"),
+        ("HOLD", "Mixed quality signals requiring monitoring"),
+        ("ACCUMULATE", "Above-average quality with selective strengths"),
+        ("BUY", "Strong fundamentals with favorable quality indicators"),
+        ("STRONG BUY", "Exceptional quality metrics across all dimensions"),
+    )
+    # Profitability vs earnings-quality gap: below 1.0, below 2.0, otherwise
+    _GAP_THRESHOLDS = (1.0, 2.0)
+    _GAP_ASSESSMENTS = (
+        ("minimal", "The company demonstrates strong alignment between reported profitability and earnings quality, "
+                    "suggesting reliable financial reporting and sustainable profit generation."),
+        ("moderate", "A moderate gap exists between profitability metrics and earnings quality, "
+                     "warranting closer examination of accounting practices and profit sustainability."),
+        ("significant", "A significant gap between profitability and earnings quality raises concerns "
+                        "about the sustainability and reliability of reported earnings."),
+    )
+    _SCORE_COLORS = tuple(colors.HexColor(c) for c in
+                          ('#e74c3c', '#e67e22', '#f39c12', '#2ecc71', '#27ae60'))
+    
+    # ReportLab colours, parsed once
+    _C_TITLE = colors.HexColor('#1f4788')
+    _C_SECTION = colors.HexColor('#2c5aa0')
+    _C_SECTION_BG = colors.HexColor('#f0f4f8')
+    _C_SUBHEADING = colors.HexColor('#34495e')
+    _C_SUMMARY_BG = colors.HexColor('#fff9e6')
+    _C_SUMMARY_BORDER = colors.HexColor('#ffcc00')
+    _C_COMPANY = colors.HexColor('#c0392b')
+    _C_MUTED = colors.HexColor('#7f8c8d')
+    _C_LIGHT_BG = colors.HexColor('#ecf0f1')
+    _C_ROW_ALT = colors.HexColor('#f8f9fa')
+    _SEVERITY_COLORS = {'High': colors.HexColor('#e74c3c'), 'Medium': colors.HexColor('#f39c12')}
+    _C_SEVERITY_LOW = colors.HexColor('#95a5a6')
+    _SCORE_BAR_COLORS = tuple(colors.HexColor(c) for c in _SCORE_BAR_PALETTE)
+    
+    # Shared stylesheet, built by the first instance; styles are not modified afterwards
+    _STYLES = None
+    
+    # Keywords the narrative sections look up category scores by
+    _CATEGORY_KEYWORDS = ('Governance', 'Growth', 'Efficiency', 'Cash', 'Quality', 'Profitability')
+    
+    def __init__(self, enable_charts: bool = True):
+        """
+        Args:
+            enable_charts: Render matplotlib charts; False builds a text-only
+                report with a vector score bar on the cover
+        """
+        self.enable_charts = enable_charts
         self._setup_custom_styles()
+        self.styles = self._STYLES
+        self._cat_index: Dict[str, QualityScore] = {}
         
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles for professional formatting"""
+    @classmethod
+    def _setup_custom_styles(cls):
+        """Build the paragraph and table styles once for all instances"""
+        if cls._STYLES is not None:
+            return
+        styles = getSampleStyleSheet()
         
         # Title style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CustomTitle',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=24,
-            textColor=colors.HexColor('#1f4788'),
+            textColor=cls._C_TITLE,
             spaceAfter=30,
             alignment=TA_CENTER,
             fontName='Helvetica-Bold'
         ))
         
         # Section heading
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='SectionHeading',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=16,
-            textColor=colors.HexColor('#2c5aa0'),
+            textColor=cls._C_SECTION,
             spaceAfter=12,
             spaceBefore=16,
             fontName='Helvetica-Bold',
             borderWidth=1,
-            borderColor=colors.HexColor('#2c5aa0'),
+            borderColor=cls._C_SECTION,
             borderPadding=5,
-            backColor=colors.HexColor('#f0f4f8')
+            backColor=cls._C_SECTION_BG
         ))
         
         # Subsection heading
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='SubHeading',
-            parent=self.styles['Heading3'],
+            parent=styles['Heading3'],
             fontSize=13,
-            textColor=colors.HexColor('#34495e'),
+            textColor=cls._C_SUBHEADING,
             spaceAfter=8,
             spaceBefore=10,
             fontName='Helvetica-Bold'
         ))
         
         # Body text with justification
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='JustifiedBody',
-            parent=self.styles['BodyText'],
+            parent=styles['BodyText'],
             fontSize=10,
             alignment=TA_JUSTIFY,
             spaceAfter=8,
@@ -86,19 +406,98 @@ class InstitutionalReportGenerator:
         ))
         
         # Executive summary style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='ExecutiveSummary',
-            parent=self.styles['BodyText'],
+            parent=styles['BodyText'],
             fontSize=11,
             alignment=TA_JUSTIFY,
             spaceAfter=10,
-            backColor=colors.HexColor('#fff9e6'),
+            backColor=cls._C_SUMMARY_BG,
             borderWidth=1,
-            borderColor=colors.HexColor('#ffcc00'),
+            borderColor=cls._C_SUMMARY_BORDER,
             borderPadding=10,
             leading=16
         ))
         
+        # Cover company name and ticker
+        styles.add(ParagraphStyle(
+            name='CompanyName',
+            parent=styles['CustomTitle'],
+            fontSize=28,
+            textColor=cls._C_COMPANY
+        ))
+        styles.add(ParagraphStyle(name='Ticker', fontSize=14, alignment=TA_CENTER))
+        
+        # Closing disclaimer
+        styles.add(ParagraphStyle(
+            name='Disclaimer',
+            fontSize=8,
+            textColor=cls._C_MUTED,
+            alignment=TA_JUSTIFY,
+            borderWidth=0.5,
+            borderColor=colors.grey,
+            borderPadding=5,
+            backColor=cls._C_LIGHT_BG
+        ))
+        
+        # Table styles shared by every report
+        cls._METADATA_TABLE_STYLE = TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('TEXTCOLOR', (0, 0), (0, -1), cls._C_MUTED),
+            ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ])
+        cls._SCORE_TABLE_STYLE = TableStyle([
+            # Header
+            ('BACKGROUND', (0, 0), (-1, 0), cls._C_SECTION),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            
+            # Data rows
+            ('FONTNAME', (0, 1), (-1, -2), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -2), 9),
+            ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
+            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+            
+            # Overall row
+            ('BACKGROUND', (0, -1), (-1, -1), cls._C_LIGHT_BG),
+            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, -1), (-1, -1), 11),
+            
+            # Grid
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -2), [colors.white, cls._C_ROW_ALT]),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ])
+        severity_colors = dict(cls._SEVERITY_COLORS, Low=cls._C_SEVERITY_LOW)
+        cls._FLAG_TABLE_STYLES = {
+            severity: TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), color),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 10),
+                ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 1), (0, -1), 9),
+                ('FONTNAME', (1, 1), (1, -1), 'Helvetica'),
+                ('FONTSIZE', (1, 1), (1, -1), 9),
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                ('TOPPADDING', (0, 0), (-1, -1), 6),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+                ('LEFTPADDING', (0, 0), (-1, -1), 8),
+            ])
+            for severity, color in severity_colors.items()
+        }
+        
+        cls._STYLES = styles
+    
     def _create_cover_page(self, report: QualityReport):
         """Create professional cover page"""
         story = []
@@ -115,29 +514,21 @@ class InstitutionalReportGenerator:
         story.append(Spacer(1, 0.3*inch))
         
         # Company name
-        company_style = ParagraphStyle(
-            'CompanyName',
-            parent=self.styles['CustomTitle'],
-            fontSize=28,
-            textColor=colors.HexColor('#c0392b')
-        )
-        company = Paragraph(f"<b>{report.company_name}</b>", company_style)
+        company = Paragraph(f"<b>{report.company_name}</b>", self.styles['CompanyName'])
         story.append(company)
         story.append(Spacer(1, 0.2*inch))
         
         # Ticker
         ticker_text = Paragraph(
             f"Ticker: <b>{report.ticker}</b>",
-            ParagraphStyle('Ticker', fontSize=14, alignment=TA_CENTER)
+            self.styles['Ticker']
         )
         story.append(ticker_text)
         story.append(Spacer(1, 1*inch))
         
-        # Overall score with visual
-        score_img = self._create_score_gauge(report.overall_score)
-        if score_img:
-            story.append(Image(score_img, width=4*inch, height=2*inch))
-            story.append(Spacer(1, 0.3*inch))
+        # Overall score with visual (vector shapes, so the cover never needs matplotlib)
+        story.append(self._create_score_gauge_rl(report.overall_score))
+        story.append(Spacer(1, 0.3*inch))
         
         # Rating
         rating = self._get_rating_text(report.overall_score)
@@ -158,279 +549,108 @@ class InstitutionalReportGenerator:
         ]
         
         metadata_table = Table(metadata_data, colWidths=[2.5*inch, 3.5*inch])
-        metadata_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#7f8c8d')),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica-Bold'),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]))
+        metadata_table.setStyle(self._METADATA_TABLE_STYLE)
         story.append(metadata_table)
         
         story.append(PageBreak())
         return story
     
-    def _create_score_gauge(self, score: float):
-        """Create visual score gauge"""
-        try:
-            fig, ax = plt.subplots(figsize=(6, 3))
-            
-            # Create horizontal bar
-            colors_list = ['#e74c3c', '#e67e22', '#f39c12', '#27ae60', '#2ecc71']
-            positions = [0, 2.5, 5, 7.5, 10]
-            
-            for i in range(len(colors_list)):
-                start = positions[i]
-                end = positions[i+1] if i < len(positions)-1 else 10
-                ax.barh(0, end-start, left=start, height=0.5,
-                       color=colors_list[i], alpha=0.7)
-            
-            # Add score marker
-            ax.plot(score, 0, 'v', color='black', markersize=20, zorder=10)
-            ax.text(score, -0.15, f'{score:.1f}', ha='center', va='top',
-                   fontsize=16, fontweight='bold')
-            
-            ax.set_xlim(0, 10)
-            ax.set_ylim(-0.5, 0.5)
-            ax.axis('off')
-            
-            # Convert to image
-            buf = BytesIO()
-            plt.tight_layout()
-            plt.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-            plt.close()
-            buf.seek(0)
-            return buf
-        except Exception as e:
-            print(f"Error creating score gauge: {e}")
-            return None
-    
     def _create_radar_chart(self, report: QualityReport):
         """Create radar chart for category scores"""
+        if not self.enable_charts:
+            return None
         try:
-            # Get category data
-            categories = [cs.category for cs in report.category_scores]
-            scores = [cs.score for cs in report.category_scores]
-            
-            # Number of variables
-            num_vars = len(categories)
-            
-            # Compute angle for each axis
-            angles = [n / float(num_vars) * 2 * 3.14159 for n in range(num_vars)]
-            scores += scores[:1]  # Complete the circle
-            angles += angles[:1]
-            
-            # Create figure
-            fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(projection='polar'))
-            
-            # Draw the chart
-            ax.plot(angles, scores, 'o-', linewidth=2, color='#667eea', label='Quality Scores')
-            ax.fill(angles, scores, alpha=0.25, color='#667eea')
-            
-            # Set category labels
-            ax.set_xticks(angles[:-1])
-            ax.set_xticklabels(categories, size=10, weight='bold')
-            
-            # Set y-axis
-            ax.set_ylim(0, 10)
-            ax.set_yticks([2, 4, 6, 8, 10])
-            ax.set_yticklabels(['2', '4', '6', '8', '10'], size=9)
-            ax.grid(True, linestyle='--', alpha=0.7)
-            
-            # Add title
-            plt.title('Category Performance Radar', size=14, weight='bold', pad=20)
-            
-            # Convert to image
-            buf = BytesIO()
-            plt.tight_layout()
-            plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', facecolor='white')
-            plt.close()
-            buf.seek(0)
-            return buf
+            return BytesIO(_render_png('radar', _category_key(report)))
         except Exception as e:
             print(f"Error creating radar chart: {e}")
             return None
     
     def _create_horizontal_bar_chart(self, report: QualityReport):
         """Create horizontal bar chart for category scores"""
+        if not self.enable_charts:
+            return None
         try:
-            # Get category data
-            categories = [cs.category for cs in report.category_scores]
-            scores = [cs.score for cs in report.category_scores]
-            
-            # Determine colors based on scores
-            colors_list = []
-            for score in scores:
-                if score >= 7.5:
-                    colors_list.append('#10b981')
-                elif score >= 6.5:
-                    colors_list.append('#3b82f6')
-                elif score >= 5.5:
-                    colors_list.append('#8b5cf6')
-                elif score >= 4.0:
-                    colors_list.append('#f59e0b')
-                else:
-                    colors_list.append('#ef4444')
-            
-            # Create figure
-            fig, ax = plt.subplots(figsize=(10, 6))
-            
-            # Create bars
-            y_pos = range(len(categories))
-            bars = ax.barh(y_pos, scores, color=colors_list, edgecolor='white', linewidth=2)
-            
-            # Add score labels
-            for i, (bar, score) in enumerate(zip(bars, scores)):
-                ax.text(score + 0.2, i, f'{score:.1f}', va='center', fontsize=11, weight='bold')
-            
-            # Customize axes
-            ax.set_yticks(y_pos)
-            ax.set_yticklabels(categories, fontsize=10)
-            ax.set_xlabel('Score', fontsize=11, weight='bold')
-            ax.set_xlim(0, 10.5)
-            ax.set_title('Category Scores Comparison', fontsize=14, weight='bold', pad=15)
-            ax.grid(axis='x', alpha=0.3, linestyle='--')
-            ax.set_axisbelow(True)
-            
-            # Convert to image
-            buf = BytesIO()
-            plt.tight_layout()
-            plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', facecolor='white')
-            plt.close()
-            buf.seek(0)
-            return buf
+            return BytesIO(_render_png('bar', _category_key(report)))
         except Exception as e:
             print(f"Error creating bar chart: {e}")
             return None
     
     def _create_gauge_chart(self, score: float):
         """Create enhanced gauge chart for overall score"""
+        if not self.enable_charts:
+            return None
         try:
-            fig, ax = plt.subplots(figsize=(8, 5), subplot_kw={'projection': 'polar'})
-            
-            # Define gauge segments
-            theta = [0, 3.14159 * 0.4, 3.14159 * 0.55, 3.14159 * 0.65, 
-                    3.14159 * 0.75, 3.14159]
-            
-            colors_list = ['#ef4444', '#f59e0b', '#8b5cf6', '#3b82f6', '#10b981']
-            
-            # Draw gauge segments
-            for i in range(len(colors_list)):
-                ax.barh(1, theta[i+1] - theta[i], left=theta[i], height=0.3,
-                       color=colors_list[i], alpha=0.8, edgecolor='white', linewidth=2)
-            
-            # Calculate needle angle
-            needle_angle = (score / 10.0) * 3.14159
-            
-            # Draw needle
-            ax.plot([needle_angle, needle_angle], [0, 1.3], color='black', linewidth=3)
-            ax.plot(needle_angle, 1.3, 'o', color='black', markersize=10)
-            
-            # Add score text in center
-            ax.text(3.14159/2, 0.5, f'{score:.1f}', ha='center', va='center',
-                   fontsize=32, weight='bold', color='#1e293b')
-            ax.text(3.14159/2, 0.2, 'Overall Score', ha='center', va='center',
-                   fontsize=12, color='#64748b')
-            
-            # Customize
-            ax.set_ylim(0, 1.5)
-            ax.set_xlim(0, 3.14159)
-            ax.set_xticks([])
-            ax.set_yticks([])
-            ax.spines['polar'].set_visible(False)
-            ax.grid(False)
-            
-            # Convert to image
-            buf = BytesIO()
-            plt.tight_layout()
-            plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', facecolor='white')
-            plt.close()
-            buf.seek(0)
-            return buf
+            return BytesIO(_render_png('gauge', (round(score, CHART_SCORE_DECIMALS),)))
         except Exception as e:
             print(f"Error creating gauge chart: {e}")
             return None
     
     def _create_red_flags_pie_chart(self, report: QualityReport):
         """Create pie chart for red flags distribution by category"""
+        if not self.enable_charts:
+            return None
         try:
             if not report.red_flags:
                 return None
             
-            # Count flags by category
-            category_counts = {}
-            for flag in report.red_flags:
-                cat = flag.category if hasattr(flag, 'category') else 'Other'
-                category_counts[cat] = category_counts.get(cat, 0) + 1
-            
-            # Create figure
-            fig, ax = plt.subplots(figsize=(8, 8))
-            
-            colors_list = ['#ef4444', '#f59e0b', '#eab308', '#84cc16', 
-                          '#22c55e', '#14b8a6', '#06b6d4']
+            # Count flags by category, largest first, folding the tail into 'Other'
+            category_counts = Counter(getattr(flag, 'category', 'Other') for flag in report.red_flags)
+            if len(category_counts) > PIE_MAX_SLICES:
+                slices = dict(category_counts.most_common(PIE_MAX_SLICES - 1))
+                rest = sum(category_counts.values()) - sum(slices.values())
+                slices['Other'] = slices.get('Other', 0) + rest
+            else:
+                slices = dict(category_counts.most_common())
             
-            # Create pie chart
-            wedges, texts, autotexts = ax.pie(
-                category_counts.values(),
-                labels=category_counts.keys(),
-                autopct='%1.1f%%',
-                colors=colors_list[:len(category_counts)],
-                startangle=90,
-                wedgeprops=dict(edgecolor='white', linewidth=2),
-                textprops=dict(fontsize=10, weight='bold')
-            )
-            
-            # Add white circle in center for donut effect
-            centre_circle = plt.Circle((0, 0), 0.70, fc='white', linewidth=2, edgecolor='white')
-            ax.add_artist(centre_circle)
-            
-            # Add total count in center
-            total = sum(category_counts.values())
-            ax.text(0, 0, f'{total}\nRed Flags', ha='center', va='center',
-                   fontsize=20, weight='bold', color='#1e293b')
-            
-            ax.set_title('Red Flags Distribution by Category', fontsize=14, weight='bold', pad=20)
-            
-            # Convert to image
-            buf = BytesIO()
-            plt.tight_layout()
-            plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', facecolor='white')
-            plt.close()
-            buf.seek(0)
-            return buf
+            # Slice order decides the layout, so it is part of the key
+            return BytesIO(_render_png('pie', (tuple(slices.items()),)))
         except Exception as e:
             print(f"Error creating pie chart: {e}")
             return None
     
+    def _create_score_gauge_rl(self, score: float) -> Drawing:
+        """Draw the cover score bar with ReportLab shapes, without matplotlib"""
+        width, height = 4*inch, 2*inch
+        scale = width / 10
+        bar_y, bar_height = 0.35*height, 0.3*height
+        
+        drawing = Drawing(width, height)
+        drawing.hAlign = 'CENTER'
+        for color, start, end in zip(self._SCORE_BAR_COLORS, _SCORE_BAR_POSITIONS[:-1],
+                                     _SCORE_BAR_POSITIONS[1:]):
+            drawing.add(Rect(start*scale, bar_y, (end - start)*scale, bar_height,
+                             fillColor=color, fillOpacity=0.7, strokeColor=None))
+        
+        # Score marker above the bar and value below it
+        x = min(max(score, 0.0), 10.0) * scale
+        top = bar_y + bar_height
+        drawing.add(Polygon([x - 8, top + 16, x + 8, top + 16, x, top + 2],
+                            fillColor=colors.black, strokeColor=None))
+        drawing.add(String(x, bar_y - 18, f'{score:.1f}', fontName='Helvetica-Bold',
+                           fontSize=16, textAnchor='middle'))
+        return drawing
+    
     def _get_rating_text(self, score: float) -> str:
         """Get rating text based on score"""
-        if score >= 8.0:
-            return "EXCEPTIONAL"
-        elif score >= 7.0:
-            return "EXCELLENT"
-        elif score >= 6.0:
-            return "STRONG"
-        elif score >= 5.0:
-            return "ABOVE AVERAGE"
-        elif score >= 4.0:
-            return "MODERATE"
-        else:
-            return "BELOW AVERAGE"
+        return self._RATING_LABELS[bisect_right(self._RATING_THRESHOLDS, score)]
     
     def _get_score_color(self, score: float):
         """Get color based on score"""
-        if score >= 7.5:
-            return colors.HexColor('#27ae60')
-        elif score >= 6.0:
-            return colors.HexColor('#2ecc71')
-        elif score >= 5.0:
-            return colors.HexColor('#f39c12')
-        elif score >= 4.0:
-            return colors.HexColor('#e67e22')
-        else:
-            return colors.HexColor('#e74c3c')
+        return self._SCORE_COLORS[bisect_right(self._SCORE_COLOR_THRESHOLDS, score)]
+    
+    def _build_category_index(self, report: QualityReport) -> Dict[str, QualityScore]:
+        """Map each of _CATEGORY_KEYWORDS to the category score whose name contains it"""
+        index = {}
+        for cat_score in report.category_scores:
+            for keyword in self._CATEGORY_KEYWORDS:
+                if keyword in cat_score.category:
+                    index[keyword] = cat_score
+        return index
+    
+    def _category_score(self, keyword: str) -> float:
+        """Score of the category matching keyword, or 0.0 if the report has none"""
+        cat_score = self._cat_index.get(keyword)
+        return cat_score.score if cat_score else 0.0
     
     def _create_executive_summary(self, report: QualityReport):
         """Create executive summary section"""
@@ -464,19 +684,22 @@ class InstitutionalReportGenerator:
         story.append(Spacer(1, 0.1*inch))
         
         # Create category scores table
-        table_data = [['Category', 'Score', 'Weight', 'Weighted Score', 'Assessment']]
+        category_scores = report.category_scores
+        scores = np.fromiter((cs.score for cs in category_scores), dtype=np.float64,
+                             count=len(category_scores))
+        weights = np.fromiter((cs.weight for cs in category_scores), dtype=np.float64,
+                              count=len(category_scores))
+        weighted = scores * weights
+        bands = np.searchsorted(self._RATING_THRESHOLDS, scores, side='right')
         
-        for cat_score in report.category_scores:
-            weighted = cat_score.score * cat_score.weight
-            assessment = self._get_category_assessment(cat_score.score)
-            
-            table_data.append([
-                cat_score.category,
-                f"{cat_score.score:.1f}/10",
-                f"{cat_score.weight*100:.0f}%",
-                f"{weighted:.2f}",
-                assessment
-            ])
+        table_data = [['Category', 'Score', 'Weight', 'Weighted Score', 'Assessment']]
+        table_data += [
+            [cs.category, f"{score:.1f}/10", f"{weight*100:.0f}%", f"{wtd:.2f}",
+             self._ASSESS_LABELS[band]]
+            for cs, score, weight, wtd, band in zip(category_scores, scores.tolist(),
+                                                     weights.tolist(), weighted.tolist(),
+                                                     bands.tolist())
+        ]
         
         # Add overall score row
         table_data.append([
@@ -490,32 +713,7 @@ class InstitutionalReportGenerator:
         # Create table
         score_table = Table(table_data, colWidths=[2.2*inch, 0.9*inch, 0.8*inch, 
                                                     1.1*inch, 1.5*inch])
-        score_table.setStyle(TableStyle([
-            # Header
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2c5aa0')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            
-            # Data rows
-            ('FONTNAME', (0, 1), (-1, -2), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -2), 9),
-            ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
-            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-            
-            # Overall row
-            ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#ecf0f1')),
-            ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, -1), (-1, -1), 11),
-            
-            # Grid
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -2), [colors.white, colors.HexColor('#f8f9fa')]),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]))
+        score_table.setStyle(self._SCORE_TABLE_STYLE)
         
         story.append(score_table)
         story.append(Spacer(1, 0.3*inch))
@@ -535,18 +733,7 @@ class InstitutionalReportGenerator:
     
     def _get_category_assessment(self, score: float) -> str:
         """Get assessment text for category score"""
-        if score >= 8.0:
-            return "Excellent"
-        elif score >= 7.0:
-            return "Strong"
-        elif score >= 6.0:
-            return "Above Avg"
-        elif score >= 5.0:
-            return "Average"
-        elif score >= 4.0:
-            return "Below Avg"
-        else:
-            return "Weak"
+        return self._ASSESS_LABELS[bisect_right(self._RATING_THRESHOLDS, score)]
     
     def _create_visual_analytics(self, report: QualityReport):
         """Create visual analytics section with charts"""
@@ -618,14 +805,8 @@ class InstitutionalReportGenerator:
             story.append(Spacer(1, 0.1*inch))
         
         # Extract governance and growth scores for strategic context
-        governance_score = 0.0
-        growth_score = 0.0
-        
-        for cat_score in report.category_scores:
-            if 'Governance' in cat_score.category:
-                governance_score = cat_score.score
-            elif 'Growth' in cat_score.category:
-                growth_score = cat_score.score
+        governance_score = self._category_score('Governance')
+        growth_score = self._category_score('Growth')
         
         strategic_text = f"""
         The company demonstrates {'strong' if governance_score >= 6.0 else 'moderate'} 
@@ -649,14 +830,8 @@ class InstitutionalReportGenerator:
         story.append(Spacer(1, 0.1*inch))
         
         # Extract relevant scores
-        efficiency_score = 0.0
-        cash_score = 0.0
-        
-        for cat_score in report.category_scores:
-            if 'Capital Efficiency' in cat_score.category or 'Efficiency' in cat_score.category:
-                efficiency_score = cat_score.score
-            elif 'Cash' in cat_score.category:
-                cash_score = cat_score.score
+        efficiency_score = self._category_score('Efficiency')
+        cash_score = self._category_score('Cash')
         
         capital_text = f"""
         <b>Capital Efficiency Rating:</b> {efficiency_score:.1f}/10<br/>
@@ -675,18 +850,15 @@ class InstitutionalReportGenerator:
         
         # Add metrics if available
         if report.metrics_summary:
-            metrics_text = "<b>Key Capital Metrics:</b><br/>"
-            
             key_metrics = ['ROE', 'ROIC', 'Asset Turnover', 'Free Cash Flow', 
                           'Operating Cash Flow']
             
-            for metric in key_metrics:
-                if metric in report.metrics_summary:
-                    value = report.metrics_summary[metric]
-                    metrics_text += f"• {metric}: {value}<br/>"
+            parts = ["<b>Key Capital Metrics:</b><br/>"]
+            parts.extend(f"• {metric}: {report.metrics_summary[metric]}<br/>"
+                         for metric in key_metrics if metric in report.metrics_summary)
             
-            if '•' in metrics_text:
-                story.append(Paragraph(metrics_text, self.styles['BodyText']))
+            if len(parts) > 1:
+                story.append(Paragraph("".join(parts), self.styles['BodyText']))
                 story.append(Spacer(1, 0.1*inch))
         
         return story
@@ -699,16 +871,10 @@ class InstitutionalReportGenerator:
         story.append(Spacer(1, 0.1*inch))
         
         # Extract governance score
-        governance_score = 0.0
-        governance_strengths = []
-        governance_concerns = []
-        
-        for cat_score in report.category_scores:
-            if 'Governance' in cat_score.category:
-                governance_score = cat_score.score
-                governance_strengths = cat_score.strengths
-                governance_concerns = cat_score.concerns
-                break
+        governance = self._cat_index.get('Governance')
+        governance_score = governance.score if governance else 0.0
+        governance_strengths = governance.strengths if governance else []
+        governance_concerns = governance.concerns if governance else []
         
         governance_rating = self._get_rating_text(governance_score)
         
@@ -747,26 +913,18 @@ class InstitutionalReportGenerator:
         story.append(Spacer(1, 0.1*inch))
         
         # Compare earnings quality vs profitability
-        earnings_quality = 0.0
-        profitability = 0.0
-        
-        for cat_score in report.category_scores:
-            if 'Earnings Quality' in cat_score.category or 'Quality' in cat_score.category:
-                earnings_quality = cat_score.score
-            elif 'Profitability' in cat_score.category:
-                profitability = cat_score.score
+        earnings_quality = self._category_score('Quality')
+        profitability = self._category_score('Profitability')
         
         gap = abs(profitability - earnings_quality)
-        gap_assessment = "minimal" if gap < 1.0 else "moderate" if gap < 2.0 else "significant"
+        gap_assessment, gap_narrative = self._GAP_ASSESSMENTS[bisect_right(self._GAP_THRESHOLDS, gap)]
         
         gap_text = f"""
         <b>Profitability Score:</b> {profitability:.1f}/10<br/>
         <b>Earnings Quality Score:</b> {earnings_quality:.1f}/10<br/>
         <b>Gap Assessment:</b> {gap_assessment.upper()} (Δ {gap:.1f})<br/><br/>
         
-        {'The company demonstrates strong alignment between reported profitability and earnings quality, suggesting reliable financial reporting and sustainable profit generation.' if gap < 1.0 else 
-         'A moderate gap exists between profitability metrics and earnings quality, warranting closer examination of accounting practices and profit sustainability.' if gap < 2.0 else
-         'A significant gap between profitability and earnings quality raises concerns about the sustainability and reliability of reported earnings.'}
+        {gap_narrative}
         """
         
         story.append(Paragraph(gap_text, self.styles['JustifiedBody']))
@@ -790,30 +948,20 @@ class InstitutionalReportGenerator:
             story.append(Paragraph(no_flags, self.styles['JustifiedBody']))
         else:
             # Summary
-            high_severity = sum(1 for rf in report.red_flags if rf.severity == "High")
-            medium_severity = sum(1 for rf in report.red_flags if rf.severity == "Medium")
-            low_severity = sum(1 for rf in report.red_flags if rf.severity == "Low")
+            summary_parts = [f"<b>Total Red Flags Identified:</b> {len(report.red_flags)}<br/>"]
+            # A single flag's severity is already shown in its own table below
+            if len(report.red_flags) > 1:
+                severity_counts = Counter(rf.severity for rf in report.red_flags)
+                for severity in ("High", "Medium", "Low"):
+                    if severity_counts[severity]:
+                        summary_parts.append(f"• {severity} Severity: {severity_counts[severity]}<br/>")
+            summary_parts.append("<br/>")
             
-            summary = f"""
-            <b>Total Red Flags Identified:</b> {len(report.red_flags)}<br/>
-            • High Severity: {high_severity}<br/>
-            • Medium Severity: {medium_severity}<br/>
-            • Low Severity: {low_severity}<br/><br/>
-            """
-            
-            story.append(Paragraph(summary, self.styles['BodyText']))
+            story.append(Paragraph("".join(summary_parts), self.styles['BodyText']))
             story.append(Spacer(1, 0.15*inch))
             
             # Detailed red flags
             for i, red_flag in enumerate(report.red_flags, 1):
-                # Color code by severity
-                if red_flag.severity == "High":
-                    severity_color = colors.HexColor('#e74c3c')
-                elif red_flag.severity == "Medium":
-                    severity_color = colors.HexColor('#f39c12')
-                else:
-                    severity_color = colors.HexColor('#95a5a6')
-                
                 flag_data = [
                     [f"Red Flag #{i}", f"{red_flag.severity} Severity"],
                     ["Category:", red_flag.category],
@@ -823,21 +971,9 @@ class InstitutionalReportGenerator:
                 ]
                 
                 flag_table = Table(flag_data, colWidths=[1.5*inch, 5*inch])
-                flag_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), severity_color),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 1), (0, -1), 9),
-                    ('FONTNAME', (1, 1), (1, -1), 'Helvetica'),
-                    ('FONTSIZE', (1, 1), (1, -1), 9),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('TOPPADDING', (0, 0), (-1, -1), 6),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 8),
-                ]))
+                # Header colour coded by severity
+                flag_table.setStyle(self._FLAG_TABLE_STYLES.get(red_flag.severity,
+                                                                self._FLAG_TABLE_STYLES['Low']))
                 
                 story.append(flag_table)
                 story.append(Spacer(1, 0.15*inch))
@@ -856,21 +992,8 @@ class InstitutionalReportGenerator:
         rating = self._get_rating_text(report.overall_score)
         
         # Determine investment perspective
-        if report.overall_score >= 7.5:
-            perspective = "STRONG BUY"
-            outlook = "Exceptional quality metrics across all dimensions"
-        elif report.overall_score >= 6.5:
-            perspective = "BUY"
-            outlook = "Strong fundamentals with favorable quality indicators"
-        elif report.overall_score >= 5.5:
-            perspective = "ACCUMULATE"
-            outlook = "Above-average quality with selective strengths"
-        elif report.overall_score >= 4.5:
-            perspective = "HOLD"
-            outlook = "Mixed quality signals requiring monitoring"
-        else:
-            perspective = "CAUTIOUS"
-            outlook = "Quality concerns warrant careful evaluation"
+        perspective, outlook = self._PERSPECTIVES[
+            bisect_right(self._PERSPECTIVE_THRESHOLDS, report.overall_score)]
         
         rating_summary = f"""
         <b>OVERALL QUALITY RATING: {report.overall_score:.1f}/10.0 ({rating})</b><br/>
@@ -898,21 +1021,48 @@ class InstitutionalReportGenerator:
         company performance.
         """
         
-        disclaimer_style = ParagraphStyle(
-            'Disclaimer',
-            fontSize=8,
-            textColor=colors.HexColor('#7f8c8d'),
-            alignment=TA_JUSTIFY,
-            borderWidth=0.5,
-            borderColor=colors.grey,
-            borderPadding=5,
-            backColor=colors.HexColor('#ecf0f1')
-        )
-        
-        story.append(Paragraph(disclaimer, disclaimer_style))
+        story.append(Paragraph(disclaimer, self.styles['Disclaimer']))
         
         return story
     
+    def _story(self, report: QualityReport):
+        """Yield the report's flowables section by section, in page order"""
+        # Cover page
+        yield from self._create_cover_page(report)
+        
+        # Executive summary
+        yield from self._create_executive_summary(report)
+        
+        # Quantitative scoring (includes category breakdown)
+        yield from self._create_quantitative_scoring(report)
+        yield PageBreak()
+        
+        # Visual Analytics Section (New)
+        if self.enable_charts:
+            yield from self._create_visual_analytics(report)
+            yield PageBreak()
+        
+        # Strategic alignment
+        yield from self._create_strategic_alignment(report)
+        
+        # Capital allocation
+        yield from self._create_capital_allocation(report)
+        yield PageBreak()
+        
+        # Governance quality
+        yield from self._create_governance_quality(report)
+        
+        # Execution vs narrative gap
+        yield from self._create_execution_narrative_gap(report)
+        yield PageBreak()
+        
+        # Red flags
+        yield from self._create_red_flags_section(report)
+        yield PageBreak()
+        
+        # Final rating
+        yield from self._create_final_rating(report)
+    
     def generate_report(self, report: QualityReport, output_path: str) -> str:
         """
         Generate complete institutional PDF report
@@ -925,6 +1075,8 @@ class InstitutionalReportGenerator:
             Path to generated PDF file
         """
         try:
+            self._cat_index = self._build_category_index(report)
+            
             # Create document
             doc = SimpleDocTemplate(
                 output_path,
@@ -935,46 +1087,8 @@ class InstitutionalReportGenerator:
                 bottomMargin=0.75*inch
             )
             
-            # Build story
-            story = []
-            
-            # Cover page
-            story.extend(self._create_cover_page(report))
-            
-            # Executive summary
-            story.extend(self._create_executive_summary(report))
-            
-            # Quantitative scoring (includes category breakdown)
-            story.extend(self._create_quantitative_scoring(report))
-            story.append(PageBreak())
-            
-            # Visual Analytics Section (New)
-            story.extend(self._create_visual_analytics(report))
-            story.append(PageBreak())
-            
-            # Strategic alignment
-            story.extend(self._create_strategic_alignment(report))
-            
-            # Capital allocation
-            story.extend(self._create_capital_allocation(report))
-            story.append(PageBreak())
-            
-            # Governance quality
-            story.extend(self._create_governance_quality(report))
-            
-            # Execution vs narrative gap
-            story.extend(self._create_execution_narrative_gap(report))
-            story.append(PageBreak())
-            
-            # Red flags
-            story.extend(self._create_red_flags_section(report))
-            story.append(PageBreak())
-            
-            # Final rating
-            story.extend(self._create_final_rating(report))
-            
             # Build PDF
-            doc.build(story, onFirstPage=self._add_page_number, 
+            doc.build(list(self._story(report)), onFirstPage=self._add_page_number,
                      onLaterPages=self._add_page_number)
             
             return output_path
@@ -992,20 +1106,22 @@ class InstitutionalReportGenerator:
         canvas_obj.restoreState()
 
 
-def generate_institutional_pdf(report: QualityReport, output_path: str = None) -> str:
+def generate_institutional_pdf(report: QualityReport, output_path: str = None,
+                               enable_charts: bool = True) -> str:
     """
     Convenience function to generate institutional PDF report
     
     Args:
         report: QualityReport object
         output_path: Optional custom output path
+        enable_charts: False skips matplotlib for a faster text-only report
         
     Returns:
         Path to generated PDF
     """
     if output_path is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         output_path = f"Quality_Report_{report.ticker}_{timestamp}.pdf"
     
-    generator = InstitutionalReportGenerator()
+    generator = InstitutionalReportGenerator(enable_charts=enable_charts)
     return generator.generate_report(report, output_path)
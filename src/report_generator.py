@@ -3,7 +3,9 @@ Report Generator - Formats and outputs quality analysis reports
 """
 
 import json
+from bisect import bisect_right
 from datetime import datetime
+from itertools import islice
 from typing import Dict, Optional
 
 from rich.console import Console
@@ -16,49 +18,92 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .analyzer import QualityReport, QualityScore, RedFlag
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# (threshold, format) pairs, largest first; the value is divided by the threshold it reaches
+_TREND_SCALES = ((1e9, "{:.1f}B"), (1e7, "{:.0f}Cr"), (1e6, "{:.1f}M"))
+_MARKET_CAP_SCALES = ((1e12, "${:.2f}T"), (1e9, "${:.2f}B"), (1e7, "₹{:.0f} Cr"))
+
+# Ten-cell score bars indexed by whole points scored
+_SCORE_BARS = tuple("█" * filled + "░" * (10 - filled) for filled in range(11))
+
+# Characters that can start Markdown syntax; text without any of them renders the same as plain Text
+_MARKDOWN_MARKERS = frozenset("*_#`[|>~&<\\\n\r\t\f\v")
+
+
+def _format_magnitude(value: float, scales=_TREND_SCALES) -> str:
+    """Format an amount with the largest unit in scales it reaches, else with thousands separators"""
+    for threshold, fmt in scales:
+        if value >= threshold:
+            return fmt.format(value / threshold)
+    return f"{value:,.0f}"
+
+
+def _render_body(text: str):
+    """Wrap report prose as Markdown only when it may contain Markdown syntax"""
+    body = text.rstrip()
+    start = body.lstrip(" ")[:1]
+    # A leading dash, plus or digit may open a list, and a four-space indent a code block
+    if (not start or start in ("-", "+") or start.isdigit() or body.startswith("    ")
+            or not _MARKDOWN_MARKERS.isdisjoint(body)):
+        return Markdown(text)
+    return Text(body.lstrip(" "))
+
 
 class ReportFormatter:
     """Formats quality reports for various outputs"""
     
+    # Score bands: a score at or above the i-th threshold gets entry i + 1
+    _RATING_THRESHOLDS = (4, 5, 6, 7, 8)
+    _RATINGS = ("Weak", "Fair", "Moderate", "Good", "Strong", "Excellent")
+    _COLOR_THRESHOLDS = (5, 7)
+    _SCORE_COLORS = ("red", "yellow", "green")
+    
     def __init__(self):
         self.console = Console()
     
     def print_report(self, report: QualityReport, detailed: bool = True):
         """Print formatted report to console"""
-        self.console.print()
-        
-        # Header
-        self._print_header(report)
-        
-        # Overall Score Panel
-        self._print_overall_score(report)
-        
-        # Executive Summary
-        if report.executive_summary:
-            self._print_executive_summary(report)
-        
-        # Category Scores
-        self._print_category_scores(report)
-        
-        # Key Strengths
-        self._print_strengths(report)
-        
-        # Red Flags
-        self._print_red_flags(report)
-        
-        # Investment Thesis
-        if report.investment_thesis:
-            self._print_investment_thesis(report)
-        
-        # Risk Assessment
-        if report.risk_assessment:
-            self._print_risk_assessment(report)
-        
-        # Detailed Metrics (if requested)
-        if detailed:
-            self._print_detailed_metrics(report)
-        
-        self.console.print()
+        # Buffer every section and write the whole report to the terminal at once
+        with self.console:
+            self.console.print()
+            
+            # Header
+            self._print_header(report)
+            
+            # Overall Score Panel
+            self._print_overall_score(report)
+            
+            # Executive Summary
+            if report.executive_summary:
+                self._print_executive_summary(report)
+            
+            # Category Scores
+            self._print_category_scores(report)
+            
+            # Key Strengths
+            self._print_strengths(report)
+            
+            # Red Flags
+            self._print_red_flags(report)
+            
+            # Investment Thesis
+            if report.investment_thesis:
+                self._print_investment_thesis(report)
+            
+            # Risk Assessment
+            if report.risk_assessment:
+                self._print_risk_assessment(report)
+            
+            # Detailed Metrics (if requested)
+            if detailed:
+                self._print_detailed_metrics(report)
+            
+            self.console.print()
     
     def _print_header(self, report: QualityReport):
         """Print report header"""
@@ -69,7 +114,7 @@ class ReportFormatter:
         header_text.append(f"  Company: ", style="dim")
         header_text.append(f"{report.company_name} ({report.ticker})\n", style="bold cyan")
         header_text.append(f"  Analysis Date: ", style="dim")
-        header_text.append(f"{report.analysis_date[:10]}\n", style="white")
+        header_text.append(f"{report.analysis_date_short}\n", style="white")
         header_text.append(f"  Years Analyzed: ", style="dim")
         header_text.append(f"{report.years_analyzed}\n", style="white")
         header_text.append("═" * 70, style="blue")
@@ -81,19 +126,12 @@ class ReportFormatter:
         score = report.overall_score
         
         # Determine color based on score
-        if score >= 7:
-            color = "green"
-            rating = "STRONG"
-        elif score >= 5:
-            color = "yellow"
-            rating = "MODERATE"
-        else:
-            color = "red"
-            rating = "WEAK"
+        band = bisect_right(self._COLOR_THRESHOLDS, score)
+        color = self._SCORE_COLORS[band]
+        rating = report.overall_rating.upper()
         
         # Create visual score bar
-        filled = int(score)
-        bar = "█" * filled + "░" * (10 - filled)
+        bar = self._create_mini_bar(score)
         
         score_text = Text()
         score_text.append(f"\n  OVERALL QUALITY SCORE: ", style="bold")
@@ -108,7 +146,7 @@ class ReportFormatter:
         """Print executive summary"""
         self.console.print("\n[bold cyan]📋 EXECUTIVE SUMMARY[/bold cyan]")
         self.console.print("─" * 50)
-        self.console.print(Panel(Markdown(report.executive_summary), border_style="cyan"))
+        self.console.print(Panel(_render_body(report.executive_summary), border_style="cyan"))
     
     def _print_category_scores(self, report: QualityReport):
         """Print category-wise scores"""
@@ -166,13 +204,13 @@ class ReportFormatter:
         """Print investment thesis"""
         self.console.print("\n[bold cyan]💡 INVESTMENT THESIS[/bold cyan]")
         self.console.print("─" * 50)
-        self.console.print(Panel(Markdown(report.investment_thesis), border_style="cyan"))
+        self.console.print(Panel(_render_body(report.investment_thesis), border_style="cyan"))
     
     def _print_risk_assessment(self, report: QualityReport):
         """Print risk assessment"""
         self.console.print("\n[bold yellow]⚡ RISK ASSESSMENT[/bold yellow]")
         self.console.print("─" * 50)
-        self.console.print(Panel(Markdown(report.risk_assessment), border_style="yellow"))
+        self.console.print(Panel(_render_body(report.risk_assessment), border_style="yellow"))
     
     def _print_detailed_metrics(self, report: QualityReport):
         """Print detailed metrics tables"""
@@ -191,15 +229,7 @@ class ReportFormatter:
             self.console.print(f"    Sector: {info.get('sector', 'N/A')}")
             self.console.print(f"    Industry: {info.get('industry', 'N/A')}")
             if info.get('market_cap'):
-                market_cap = info['market_cap']
-                if market_cap >= 1e12:
-                    cap_str = f"${market_cap/1e12:.2f}T"
-                elif market_cap >= 1e9:
-                    cap_str = f"${market_cap/1e9:.2f}B"
-                elif market_cap >= 1e7:
-                    cap_str = f"₹{market_cap/1e7:.0f} Cr"
-                else:
-                    cap_str = f"{market_cap:,.0f}"
+                cap_str = _format_magnitude(info['market_cap'], _MARKET_CAP_SCALES)
                 self.console.print(f"    Market Cap: {cap_str}")
         
         # Valuation Metrics
@@ -223,34 +253,17 @@ class ReportFormatter:
             if revenue:
                 table = Table(show_header=True, header_style="bold", box=None)
                 table.add_column("Year", style="dim")
-                for year in list(revenue.keys())[:5]:
+                years = list(islice(revenue, 5))
+                for year in years:
                     table.add_column(year, justify="right")
                 
                 rev_row = ["Revenue"]
-                for year in list(revenue.keys())[:5]:
-                    val = revenue[year]
-                    if val >= 1e9:
-                        rev_row.append(f"{val/1e9:.1f}B")
-                    elif val >= 1e7:
-                        rev_row.append(f"{val/1e7:.0f}Cr")
-                    elif val >= 1e6:
-                        rev_row.append(f"{val/1e6:.1f}M")
-                    else:
-                        rev_row.append(f"{val:,.0f}")
+                rev_row.extend(_format_magnitude(revenue[year]) for year in years)
                 table.add_row(*rev_row)
                 
                 if profit:
                     prof_row = ["Net Income"]
-                    for year in list(profit.keys())[:5]:
-                        val = profit[year]
-                        if val >= 1e9:
-                            prof_row.append(f"{val/1e9:.1f}B")
-                        elif val >= 1e7:
-                            prof_row.append(f"{val/1e7:.0f}Cr")
-                        elif val >= 1e6:
-                            prof_row.append(f"{val/1e6:.1f}M")
-                        else:
-                            prof_row.append(f"{val:,.0f}")
+                    prof_row.extend(_format_magnitude(value) for value in islice(profit.values(), 5))
                     if len(prof_row) == len(table.columns):
                         table.add_row(*prof_row)
                 
@@ -262,38 +275,21 @@ class ReportFormatter:
             self.console.print(f"\n  [bold]Return Metrics (Latest Available)[/bold]")
             for metric_name, values in returns.items():
                 if values:
-                    latest = list(values.values())[0] if isinstance(values, dict) else values
+                    latest = next(iter(values.values())) if isinstance(values, dict) else values
                     if isinstance(latest, (int, float)):
                         self.console.print(f"    {metric_name.upper()}: {latest:.1f}%")
     
     def _get_score_color(self, score: float) -> str:
         """Get color based on score"""
-        if score >= 7:
-            return "green"
-        elif score >= 5:
-            return "yellow"
-        else:
-            return "red"
+        return self._SCORE_COLORS[bisect_right(self._COLOR_THRESHOLDS, score)]
     
     def _get_rating_text(self, score: float) -> str:
         """Get rating text based on score"""
-        if score >= 8:
-            return "Excellent"
-        elif score >= 7:
-            return "Strong"
-        elif score >= 6:
-            return "Good"
-        elif score >= 5:
-            return "Moderate"
-        elif score >= 4:
-            return "Fair"
-        else:
-            return "Weak"
+        return self._RATINGS[bisect_right(self._RATING_THRESHOLDS, score)]
     
     def _create_mini_bar(self, score: float) -> str:
         """Create mini score bar"""
-        filled = int(score)
-        return "█" * filled + "░" * (10 - filled)
+        return _SCORE_BARS[max(0, min(10, int(score)))]
     
     def _get_severity_color(self, severity: str) -> str:
         """Get color based on severity"""
@@ -303,9 +299,9 @@ class ReportFormatter:
             "Low": "blue"
         }.get(severity, "white")
     
-    def to_json(self, report: QualityReport) -> str:
-        """Convert report to JSON string"""
-        return json.dumps({
+    def _json_payload(self, report: QualityReport) -> Dict:
+        """Fields of the report written to JSON"""
+        return {
             "company_name": report.company_name,
             "ticker": report.ticker,
             "analysis_date": report.analysis_date,
@@ -335,47 +331,54 @@ class ReportFormatter:
             "investment_thesis": report.investment_thesis,
             "risk_assessment": report.risk_assessment,
             "metrics_summary": report.metrics_summary
-        }, indent=2)
+        }
+    
+    def to_json_bytes(self, report: QualityReport) -> bytes:
+        """Serialize the report as indented UTF-8 JSON, using orjson when it is installed"""
+        payload = self._json_payload(report)
+        if orjson is not None:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                                | orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(payload, indent=2).encode()
+    
+    def to_json(self, report: QualityReport) -> str:
+        """Convert report to JSON string"""
+        return self.to_json_bytes(report).decode()
     
     def to_markdown(self, report: QualityReport) -> str:
         """Convert report to Markdown format"""
-        md = []
-        
-        # Header
-        md.append(f"# Quality Management Analysis Report")
-        md.append(f"\n**Company:** {report.company_name} ({report.ticker})")
-        md.append(f"**Analysis Date:** {report.analysis_date[:10]}")
-        md.append(f"**Years Analyzed:** {report.years_analyzed}")
-        
-        # Overall Score
-        rating = "Strong" if report.overall_score >= 7 else "Moderate" if report.overall_score >= 5 else "Weak"
-        md.append(f"\n## Overall Quality Score: {report.overall_score}/10 ({rating})")
+        # Header and Overall Score
+        md = [
+            f"# Quality Management Analysis Report\n"
+            f"\n**Company:** {report.company_name} ({report.ticker})\n"
+            f"**Analysis Date:** {report.analysis_date_short}\n"
+            f"**Years Analyzed:** {report.years_analyzed}\n"
+            f"\n## Overall Quality Score: {report.overall_score}/10 ({report.overall_rating})"
+        ]
         
         # Executive Summary
         if report.executive_summary:
             md.append(f"\n## Executive Summary\n\n{report.executive_summary}")
         
         # Category Scores
-        md.append("\n## Category Scores\n")
-        md.append("| Category | Score | Rating |")
-        md.append("|----------|-------|--------|")
-        for cs in report.category_scores:
-            rating = self._get_rating_text(cs.score)
-            md.append(f"| {cs.category} | {cs.score:.1f}/10 | {rating} |")
+        md.append("\n## Category Scores\n\n| Category | Score | Rating |\n|----------|-------|--------|")
+        md.extend(f"| {cs.category} | {cs.score:.1f}/10 | {self._get_rating_text(cs.score)} |"
+                  for cs in report.category_scores)
         
         # Key Strengths
         md.append("\n## Key Strengths\n")
-        for i, strength in enumerate(report.key_strengths[:8], 1):
-            md.append(f"{i}. {strength}")
+        md.extend(f"{i}. {strength}" for i, strength in enumerate(report.key_strengths[:8], 1))
         
         # Red Flags
         md.append("\n## Red Flags & Concerns\n")
         if report.red_flags:
-            for rf in report.red_flags:
-                md.append(f"\n### [{rf.severity}] {rf.description}")
-                md.append(f"- **Category:** {rf.category}")
-                md.append(f"- **Impact:** {rf.impact}")
-                md.append(f"- **Recommendation:** {rf.recommendation}")
+            md.extend(
+                f"\n### [{rf.severity}] {rf.description}\n"
+                f"- **Category:** {rf.category}\n"
+                f"- **Impact:** {rf.impact}\n"
+                f"- **Recommendation:** {rf.recommendation}"
+                for rf in report.red_flags
+            )
         else:
             md.append("No significant red flags identified.")
         
@@ -392,15 +395,16 @@ class ReportFormatter:
     def save_report(self, report: QualityReport, filepath: str, format: str = "json"):
         """Save report to file"""
         if format == "json":
-            content = self.to_json(report)
+            # Written as the encoded bytes, skipping a decode/encode round trip
+            with open(filepath, 'wb') as f:
+                f.write(self.to_json_bytes(report))
         elif format == "md" or format == "markdown":
             content = self.to_markdown(report)
+            with open(filepath, 'w') as f:
+                f.write(content)
         else:
             raise ValueError(f"Unsupported format: {format}")
         
-        with open(filepath, 'w') as f:
-            f.write(content)
-        
         self.console.print(f"[green]Report saved to:[/green] {filepath}")
 
 
@@ -2,17 +2,16 @@
 """Test script to verify data fetching works correctly"""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, '/workspaces/Quality-Management-Check')
 
 from src.data_fetcher import MultiSourceFetcher
 
-def test_company(fetcher, ticker, years=3):
+def print_result(ticker, data):
     print(f"\n{'='*50}")
     print(f"Testing: {ticker}")
     print('='*50)
     
-    data = fetcher.fetch_data(ticker, years)
-    
     if data:
         print(f"  SUCCESS!")
         print(f"  Company: {data.company_name}")
@@ -27,6 +26,9 @@ def test_company(fetcher, ticker, years=3):
         print(f"  FAILED - No data returned")
         return False
 
+def test_company(fetcher, ticker, years=3):
+    return print_result(ticker, fetcher.fetch_data(ticker, years))
+
 if __name__ == "__main__":
     fetcher = MultiSourceFetcher()
     
@@ -37,9 +39,17 @@ if __name__ == "__main__":
         "AAPL",        # US stock
     ]
     
+    # Fetch every ticker concurrently on worker threads, then print each result in order
     results = {}
-    for ticker in test_cases:
-        results[ticker] = test_company(fetcher, ticker)
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+        futures = [executor.submit(fetcher.fetch_data, ticker, 3) for ticker in test_cases]
+        for ticker, future in zip(test_cases, futures):
+            try:
+                data = future.result()
+            except Exception as e:
+                print(f"\n{ticker}: ERROR - {e}")
+                data = None
+            results[ticker] = print_result(ticker, data)
     
     print("\n" + "="*50)
     print("SUMMARY")
@@ -1,10 +1,10 @@
 """
 Test script for company name validation functionality
-Tests both company names and ticker symbols
+Tests both company names and ticker symbols, including NSE/BSE suffix handling
 """
 import os
 from dotenv import load_dotenv
-from src.data_fetcher import validate_company_name
+from src.data_fetcher import validate_company_names_batch
 
 # Load environment variables
 load_dotenv()
@@ -24,6 +24,27 @@ def test_validation():
         ("InvalidCompanyXYZ123", "Invalid Input")
     ]
     
+    # Exchange suffix handling (formerly test_alkem_validation.py)
+    suffix_cases = [
+        "ALKEM.NS",
+        "alkem.ns",
+        "ALKEM",
+        "alkem",
+        "TCS.NS",
+        "TCS",
+        "tcs",
+        "DIXON",
+        "dixon",
+        "COLPAL",
+        "colpal",
+        "RANDOMSTOCK.NS",  # Should be accepted even if not in list
+        "RANDOMSTOCK"  # Should get .NS added automatically
+    ]
+    
+    # Validate the union of both lists in one batch; queries shared by the
+    # two lists are looked up once
+    results = validate_company_names_batch([query for query, _ in test_cases] + suffix_cases, fmp_api_key)
+    
     print("="*70)
     print("Testing Company Name/Ticker Validation")
     print("="*70)
@@ -31,7 +52,7 @@ def test_validation():
     for query, input_type in test_cases:
         print(f"\n🔍 Testing: {query} ({input_type})")
         print("-" * 70)
-        result = validate_company_name(query, fmp_api_key)
+        result = results[query]
         
         if result['valid']:
             print(f"✅ Valid - Found {len(result['matches'])} match(es)")
@@ -55,12 +76,29 @@ def test_validation():
     print("\n\n" + "="*70)
     print("Testing TCS (the specific case from user)")
     print("="*70)
-    result = validate_company_name("TCS", fmp_api_key)
+    result = results["TCS"]
     if result['valid']:
         print("\n✅ TCS Validation Results:")
         for i, match in enumerate(result['matches'], 1):
             print(f"   {i}. {match['name']} ({match['ticker']})")
     print("="*70)
+    
+    # Exchange suffix handling
+    print("\n\n" + "="*70)
+    print("Testing NSE/BSE Suffix Handling")
+    print("="*70)
+    for query in suffix_cases:
+        print(f"\nInput: '{query}'")
+        print("-" * 70)
+        result = results[query]
+        
+        print(f"Valid: {result['valid']}")
+        if result['valid'] and result['best_match']:
+            print(f"Name: {result['best_match']['name']}")
+            print(f"Ticker: {result['best_match']['ticker']}")
+        if result.get('error'):
+            print(f"Error: {result['error']}")
+    print("="*70)
 
 if __name__ == "__main__":
     test_validation()